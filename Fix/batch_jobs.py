@@ -0,0 +1,148 @@
+import argparse
+import csv
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from cryptography.hazmat.primitives import serialization
+from io_utils import atomic_write_bytes
+from job_journal import JobJournal, describe_outputs
+
+# Job batch untuk tab Batch di GUI; fungsi job dijalankan di proses worker
+# sehingga hanya menerima/mengembalikan data yang bisa di-pickle.
+
+RESULT_FIELDS = ["kind", "input", "cover_or_key", "status", "output", "result", "elapsed_sec"]
+# Status akhir; 'Skipped' = sudah selesai di run sebelumnya menurut jurnal
+FINISHED_STATUSES = ("Done", "Error", "Skipped")
+# Jurnal job enkripsi, disimpan di direktori output batch
+JOURNAL_NAME = "batch_journal.jsonl"
+
+# Fungsi job enkripsi: kunci baru per pesan, enkripsi, QR di memori, sisipkan ke cover
+def run_encrypt_job(text, cover_path, output_path, key_type='rsa'):
+    from crypto_utils import generate_keys, encrypt_data, create_qr_image, compress_qr_image
+    from stegano_utils import embed_data_in_audio
+    start_time = time.perf_counter()
+
+    private_key, public_key = generate_keys(key_type)
+    ciphertext = encrypt_data(public_key, text)
+    compressed = compress_qr_image(create_qr_image(ciphertext))
+    # Kunci privat disimpan di samping file stego (<stego>.key.pem); keduanya ditulis atomik,
+    # kunci lebih dulu agar stego yang terlihat selalu punya kuncinya
+    key_path = key_path_for(output_path)
+    atomic_write_bytes(key_path, private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    ))
+    embed_data_in_audio(cover_path, compressed, output_path)
+    # Hash keluaran dihitung di worker, proses induk hanya mencatat ke jurnal
+    return {"output": output_path, "result": key_path, "payload_bytes": len(compressed),
+            "outputs": describe_outputs([output_path, key_path]), "elapsed_sec": time.perf_counter() - start_time}
+
+# Fungsi job dekripsi: ekstrak payload dari stego lalu dekripsi dengan kunci privat.
+# cache_dir (opsional): cache ekstraksi/dekode QR bersama antar worker (lihat extract_cache.py)
+def run_decrypt_job(stego_path, key_path, cache_dir=None):
+    from crypto_utils import load_private_key, decrypt_qr_data
+    from stegano_utils import extract_data_from_audio
+    from extract_cache import shared_cache
+    start_time = time.perf_counter()
+
+    cache = shared_cache(cache_dir) if cache_dir else None
+    private_key = load_private_key(key_path)
+    extracted = extract_data_from_audio(stego_path, cache=cache)
+    text = decrypt_qr_data(private_key, extracted, reconstructed_path=None, cache=cache)
+    if text is None:
+        raise ValueError("Dekripsi gagal.")
+    return {"output": "", "result": text, "payload_bytes": len(extracted), "outputs": [],
+            "elapsed_sec": time.perf_counter() - start_time}
+
+def key_path_for(stego_path):
+    return os.path.splitext(stego_path)[0] + ".key.pem"
+
+# Fungsi untuk membaca pesan dari file teks (satu pesan per baris, baris kosong dilewati)
+def load_messages(path):
+    with open(path, encoding="utf-8") as f:
+        return [line.rstrip("\n") for line in f if line.strip()]
+
+# Fungsi untuk membuat kunci stabil job enkripsi (baris ke-i file pesan, cover, jenis kunci)
+def encrypt_job_key(text, cover_path, index, key_type='rsa'):
+    params = [text, os.path.abspath(cover_path), index, key_type]
+    return hashlib.blake2b(json.dumps(params).encode(), digest_size=8).hexdigest()
+
+# Fungsi untuk memasangkan pesan dengan cover secara bergiliran dan menentukan nama output.
+# Nama output diturunkan dari kunci job: run ulang menulis ke path yang sama (idempoten),
+# batch dengan pesan/cover lain tidak menimpa hasil batch ini.
+def plan_encrypt_jobs(messages, cover_paths, output_dir, key_type='rsa'):
+    jobs = []
+    for i, text in enumerate(messages):
+        cover_path = cover_paths[i % len(cover_paths)]
+        key = encrypt_job_key(text, cover_path, i, key_type)
+        stem = os.path.splitext(os.path.basename(cover_path))[0]
+        output_path = os.path.join(output_dir, f"{stem}_stego_{key}.wav")
+        jobs.append((key, text, cover_path, output_path))
+    return jobs
+
+# Fungsi untuk menjalankan job enkripsi dengan jurnal; job yang sudah selesai (keluaran masih
+# cocok dengan hash di jurnal) dilewati sehingga batch yang terhenti bisa dilanjutkan
+def run_encrypt_batch(jobs, output_dir, key_type='rsa', workers=None, verify_hash=True):
+    os.makedirs(output_dir, exist_ok=True)
+    rows = []
+    with JobJournal(os.path.join(output_dir, JOURNAL_NAME)) as journal:
+        pending = []
+        for key, text, cover_path, output_path in jobs:
+            row = {"kind": "encrypt", "input": text, "cover_or_key": cover_path, "status": "Queued",
+                   "output": output_path, "result": "", "elapsed_sec": ""}
+            if journal.is_done(key, verify_hash):
+                row.update(status="Skipped", result=journal.get(key)["result"])
+            else:
+                pending.append((key, row))
+            rows.append(row)
+        print(f"[Batch] {len(jobs)} job, {len(jobs) - len(pending)} sudah selesai, {len(pending)} dijalankan")
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {}
+            for key, row in pending:
+                # Plaintext tidak dicatat di jurnal
+                journal.start(key, "encrypt", {"cover": row["cover_or_key"], "output": row["output"],
+                                               "key_type": key_type})
+                future = pool.submit(run_encrypt_job, row["input"], row["cover_or_key"], row["output"], key_type)
+                futures[future] = (key, row)
+            for future in as_completed(futures):
+                key, row = futures[future]
+                try:
+                    result = future.result()
+                    journal.complete(key, "encrypt", result["outputs"], result["result"])
+                    row.update(status="Done", result=result["result"], elapsed_sec=f"{result['elapsed_sec']:.3f}")
+                except Exception as e:
+                    journal.fail(key, "encrypt", e)
+                    row.update(status="Error", result=str(e))
+    return rows
+
+# Fungsi untuk menyimpan hasil batch ke CSV
+def export_results(rows, path):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, RESULT_FIELDS, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(rows)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batch enkripsi pesan ke banyak cover; bisa dilanjutkan setelah terhenti.")
+    parser.add_argument("messages", type=str, help="File pesan (satu pesan per baris)")
+    parser.add_argument("covers", type=str, nargs="+", help="File audio cover (dipakai bergiliran)")
+    parser.add_argument("--output-dir", type=str, default="batch_output", help="Direktori output dan jurnal")
+    parser.add_argument("--key-type", type=str, default="rsa", choices=["rsa", "x25519"], help="Jenis kunci")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument("--results", type=str, default=None, help="File CSV hasil (opsional)")
+    parser.add_argument("--no-verify-hash", action="store_true",
+                        help="Saat resume hanya cek ukuran file keluaran, bukan SHA-256")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    jobs = plan_encrypt_jobs(load_messages(args.messages), args.covers, args.output_dir, args.key_type)
+    rows = run_encrypt_batch(jobs, args.output_dir, args.key_type, args.workers, not args.no_verify_hash)
+    if args.results:
+        export_results(rows, args.results)
+    counts = {status: sum(row["status"] == status for row in rows) for status in FINISHED_STATUSES}
+    print(f"[Batch] Selesai dalam {time.perf_counter() - start_time:.2f} s: {counts['Done']} baru, "
+          f"{counts['Skipped']} dilewati, {counts['Error']} gagal")
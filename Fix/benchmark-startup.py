@@ -0,0 +1,58 @@
+import argparse
+import os
+import subprocess
+import sys
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MODULES = ["crypto_utils", "stegano_utils", "evaluations", "encrypt", "decrypt"]
+
+# Fungsi untuk menjalankan `python -X importtime` dan mem-parsing hasilnya
+def import_times(module):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BENCH_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Gagal mengimpor {module}:\n{result.stderr.strip().splitlines()[-1]}")
+
+    # Format baris: "import time:  self [us] | cumulative | imported package"
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        name = name.rstrip()
+        level = (len(name) - len(name.lstrip()) - 1) // 2
+        entries.append((name.strip(), level, int(cumulative_us)))
+    return entries
+
+# Fungsi untuk meringkas waktu impor sebuah modul (median dari beberapa proses)
+def measure_startup(module, repeat=5, top=5):
+    totals = []
+    for _ in range(repeat):
+        entries = import_times(module)
+        # Total = jumlah waktu kumulatif impor tingkat atas (level 0)
+        totals.append(sum(cum for _, level, cum in entries if level == 0))
+    dependencies = [(name, cum) for name, level, cum in entries if level in (0, 1) and name != module]
+    return {
+        "module": module,
+        "median_ms": sorted(totals)[len(totals) // 2] / 1000,
+        "heaviest": sorted(dependencies, key=lambda item: -item[1])[:top],
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark waktu startup modul berdasarkan -X importtime.")
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES, help="Modul yang diukur")
+    parser.add_argument("--repeat", type=int, default=5, help="Jumlah proses per modul (default: 5)")
+    parser.add_argument("--top", type=int, default=5, help="Jumlah impor terberat yang ditampilkan (default: 5)")
+    args = parser.parse_args()
+
+    for module in args.modules:
+        try:
+            stats = measure_startup(module, args.repeat, args.top)
+        except RuntimeError as e:
+            print(f"[!] {e}")
+            continue
+        print(f"\n{stats['module']}: {stats['median_ms']:.1f} ms")
+        for name, cumulative_us in stats["heaviest"]:
+            print(f"   {name:<40} {cumulative_us / 1000:>8.1f} ms")
@@ -0,0 +1,78 @@
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import soundfile as sf
+from stegano_utils import TRANSFORM_BACKENDS, embed_data_in_audio, extract_data_from_audio
+
+# Fungsi untuk mengukur waktu dan puncak memori satu pemanggilan
+def measure(func, *args, **kwargs):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        func(*args, **kwargs)
+    elapsed = time.perf_counter() - start_time
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+# Fungsi untuk membandingkan backend transformasi pada beberapa ukuran cover
+def run_benchmark(durations, sample_rate=44100, repeat=3, payload_ratio=0.5):
+    results = []
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for duration in durations:
+            num_samples = int(duration * sample_rate)
+            cover_path = os.path.join(tmp_dir, f"cover_{duration}s.wav")
+            stego_path = os.path.join(tmp_dir, "stego.wav")
+            sf.write(cover_path, rng.uniform(-0.5, 0.5, num_samples), sample_rate)
+            payload = os.urandom(int(num_samples // 2 * payload_ratio) // 8)
+
+            for name, backend in TRANSFORM_BACKENDS.items():
+                samples = np.zeros(num_samples, dtype=backend.dtype or 'int16')
+                transform_time, transform_peak = min(
+                    measure(lambda: backend.inverse(*backend.forward(samples)))
+                    for _ in range(repeat)
+                )
+                embed_time, embed_peak = min(
+                    measure(embed_data_in_audio, cover_path, payload, stego_path, transform=name)
+                    for _ in range(repeat)
+                )
+                extract_time, extract_peak = min(
+                    measure(extract_data_from_audio, stego_path, len(payload) * 8, transform=name)
+                    for _ in range(repeat)
+                )
+                results.append({
+                    "backend": name,
+                    "duration_sec": duration,
+                    "transform_msamples_per_sec": num_samples / transform_time / 1e6,
+                    "transform_peak_mb": transform_peak / 2**20,
+                    "embed_time_sec": embed_time,
+                    "embed_peak_mb": embed_peak / 2**20,
+                    "extract_time_sec": extract_time,
+                    "extract_peak_mb": extract_peak / 2**20,
+                })
+    return results
+
+def print_results(results):
+    print(f"\n{'backend':<8} {'durasi':>7} {'Msampel/s':>10} {'mem DWT':>9} "
+          f"{'embed':>8} {'mem':>8} {'extract':>8} {'mem':>8}")
+    for r in results:
+        print(f"{r['backend']:<8} {r['duration_sec']:>6}s "
+              f"{r['transform_msamples_per_sec']:>10.1f} {r['transform_peak_mb']:>7.1f}MB "
+              f"{r['embed_time_sec']:>7.3f}s {r['embed_peak_mb']:>6.1f}MB "
+              f"{r['extract_time_sec']:>7.3f}s {r['extract_peak_mb']:>6.1f}MB")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark backend transformasi Haar.")
+    parser.add_argument("--durations", type=float, nargs="+", default=[5, 30, 120],
+                        help="Durasi cover dalam detik (default: 5 30 120)")
+    parser.add_argument("--samplerate", type=int, default=44100, help="Sample rate cover (default: 44100 Hz)")
+    parser.add_argument("--repeat", type=int, default=3, help="Jumlah pengulangan, diambil yang tercepat (default: 3)")
+
+    args = parser.parse_args()
+    print_results(run_benchmark(args.durations, args.samplerate, args.repeat))
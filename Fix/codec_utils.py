@@ -0,0 +1,158 @@
+import bz2
+import lzma
+import math
+import struct
+import time
+import zlib
+import numpy as np
+
+# Codec kompresi payload. Payload tersandi = 1 byte ID codec + data terkompresi,
+# sehingga sisi ekstraksi tidak perlu tahu codec yang dipakai saat embed.
+# ID tidak pernah 0x78, jadi payload lama (zlib mentah, selalu diawali 0x78) tetap terbaca.
+LEGACY_ZLIB_PREFIX = 0x78
+
+# Batas waktu default mode auto untuk mencoba codec (detik)
+AUTO_TIME_BUDGET = 0.05
+
+# LZMA2 mentah tanpa kontainer .xz (hemat ~60 byte header/footer). Kamus dibatasi 1 MiB:
+# payload jauh lebih kecil, sedangkan kamus bawaan preset 9 (64 MiB) memakan ~675 MB saat kompresi.
+LZMA_FILTERS = [{"id": lzma.FILTER_LZMA2, "preset": 9, "dict_size": 1 << 20}]
+
+# Class codec tanpa kompresi
+class NoneCodec:
+    def __init__(self, codec_id, name):
+        self.codec_id = codec_id
+        self.name = name
+
+    def compress(self, data):
+        return bytes(data)
+
+    def decompress(self, data):
+        return bytes(data)
+
+# Class pembungkus kompresor pustaka standar
+class StdlibCodec:
+    def __init__(self, codec_id, name, compress, decompress):
+        self.codec_id = codec_id
+        self.name = name
+        self._compress = compress
+        self._decompress = decompress
+
+    def compress(self, data):
+        return self._compress(data)
+
+    def decompress(self, data):
+        return self._decompress(data)
+
+# Class codec untuk bitmap 1-bit hasil compress_qr_image (lebar, tinggi 2 byte + baris piksel).
+# Batas run piksel pada gambar QR selalu kelipatan ukuran modul, jadi gambar dapat
+# diperkecil tanpa kehilangan informasi ke satu piksel per modul sebelum di-deflate.
+class Bitmap1Codec:
+    HEADER = struct.Struct('>HHHH')
+
+    def __init__(self, codec_id, name):
+        self.codec_id = codec_id
+        self.name = name
+
+    def compress(self, data):
+        width, height, pixels = self._unpack_bitmap(data)
+
+        # Ukuran blok = FPB semua posisi perubahan piksel (horizontal dan vertikal)
+        cols = np.flatnonzero((pixels[:, 1:] != pixels[:, :-1]).any(axis=0)) + 1
+        rows = np.flatnonzero((pixels[1:] != pixels[:-1]).any(axis=1)) + 1
+        scale_x = math.gcd(width, *cols.tolist())
+        scale_y = math.gcd(height, *rows.tolist())
+
+        modules = pixels[::scale_y, ::scale_x]
+        header = self.HEADER.pack(width, height, scale_x, scale_y)
+        return header + zlib.compress(np.packbits(modules).tobytes(), 9)
+
+    def decompress(self, data):
+        width, height, scale_x, scale_y = self.HEADER.unpack_from(data)
+        shape = (height // scale_y, width // scale_x)
+        bits = np.unpackbits(np.frombuffer(zlib.decompress(data[self.HEADER.size:]), dtype=np.uint8))
+        modules = bits[:shape[0] * shape[1]].reshape(shape)
+        pixels = np.repeat(np.repeat(modules, scale_y, axis=0), scale_x, axis=1)
+        # Baris dikemas ulang per baris (padding byte di akhir tiap baris seperti mode '1' PIL)
+        size_info = width.to_bytes(2, 'big') + height.to_bytes(2, 'big')
+        return size_info + np.packbits(pixels, axis=1).tobytes()
+
+    @staticmethod
+    def _unpack_bitmap(data):
+        if len(data) < 4:
+            raise ValueError("Data bukan bitmap 1-bit.")
+        width = int.from_bytes(data[:2], 'big')
+        height = int.from_bytes(data[2:4], 'big')
+        stride = -(-width // 8)
+        if width == 0 or height == 0 or len(data) != 4 + stride * height:
+            raise ValueError("Data bukan bitmap 1-bit.")
+        rows = np.frombuffer(data, dtype=np.uint8, offset=4).reshape(height, stride)
+        return width, height, np.unpackbits(rows, axis=1)[:, :width]
+
+CODECS = {
+    codec.name: codec
+    for codec in (
+        NoneCodec(0, 'none'),
+        StdlibCodec(1, 'zlib1', lambda d: zlib.compress(d, 1), zlib.decompress),
+        StdlibCodec(2, 'zlib', zlib.compress, zlib.decompress),
+        StdlibCodec(3, 'zlib9', lambda d: zlib.compress(d, 9), zlib.decompress),
+        StdlibCodec(4, 'lzma',
+                    lambda d: lzma.compress(d, format=lzma.FORMAT_RAW, filters=LZMA_FILTERS),
+                    lambda d: lzma.decompress(d, format=lzma.FORMAT_RAW, filters=LZMA_FILTERS)),
+        StdlibCodec(5, 'bz2', lambda d: bz2.compress(d, 9), bz2.decompress),
+        Bitmap1Codec(6, 'bitmap1'),
+    )
+}
+CODECS_BY_ID = {codec.codec_id: codec for codec in CODECS.values()}
+
+# Urutan percobaan mode auto: dari yang paling murah
+AUTO_CODECS = ('none', 'bitmap1', 'zlib', 'zlib9', 'bz2', 'lzma')
+
+# Fungsi untuk memilih codec berdasarkan nama
+def get_codec(name):
+    try:
+        return CODECS[name]
+    except KeyError:
+        raise ValueError(f"Codec tidak dikenal: {name}") from None
+
+# Fungsi untuk mengompres payload dan mencatat ID codec di byte pertama.
+# codec='auto' mencoba AUTO_CODECS berurutan (tidak memulai codec baru setelah time_budget
+# terlewati) dan memilih hasil terkecil.
+def encode_payload(data, codec='auto', time_budget=AUTO_TIME_BUDGET):
+    if codec != 'auto':
+        selected = get_codec(codec)
+        return bytes([selected.codec_id]) + selected.compress(data)
+
+    best = None
+    start_time = time.perf_counter()
+    for name in AUTO_CODECS:
+        candidate = get_codec(name)
+        try:
+            compressed = candidate.compress(data)
+        except ValueError:
+            # Codec khusus (bitmap1) tidak berlaku untuk data ini
+            continue
+        if best is None or len(compressed) < len(best[1]):
+            best = (candidate, compressed)
+        if time.perf_counter() - start_time > time_budget:
+            break
+    return bytes([best[0].codec_id]) + best[1]
+
+# Fungsi untuk membaca ID codec dari payload dan mendekompresinya
+def decode_payload(payload):
+    if not payload:
+        raise ValueError("Payload kosong.")
+    if payload[0] == LEGACY_ZLIB_PREFIX:
+        return zlib.decompress(payload)
+    try:
+        codec = CODECS_BY_ID[payload[0]]
+    except KeyError:
+        raise ValueError(f"ID codec tidak dikenal: {payload[0]}") from None
+    return codec.decompress(payload[1:])
+
+# Fungsi untuk mendapatkan nama codec dari payload tersandi
+def payload_codec_name(payload):
+    if payload and payload[0] == LEGACY_ZLIB_PREFIX:
+        return 'zlib'
+    codec = CODECS_BY_ID.get(payload[0]) if payload else None
+    return codec.name if codec else None
@@ -1,12 +1,21 @@
-from cryptography.hazmat.primitives.asymmetric import rsa, padding
+from cryptography.hazmat.primitives.asymmetric import rsa, padding, x25519
 from cryptography.hazmat.primitives import serialization, hashes
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+from cryptography.hazmat.primitives.ciphers.aead import ChaCha20Poly1305
 from cryptography.hazmat.backends import default_backend
-from PIL import Image
-import qrcode
-import zlib
 import os
-import cv2
-from pyzbar.pyzbar import decode
+from io_utils import atomic_output, atomic_write_bytes
+
+# PIL, qrcode, pyzbar dan codec_utils (numpy, bz2, lzma) diimpor saat pertama dipakai agar
+# pemanggil yang hanya butuh kunci/enkripsi RSA tidak menanggung waktu impornya
+
+# Mode X25519 (ECIES): ciphertext = kunci publik ephemeral (32) + data terenkripsi + tag (16)
+X25519_KEY_SIZE = 32
+X25519_HKDF_INFO = b'stego-x25519-chacha20poly1305'
+# Batas plaintext RSA-2048 OAEP-SHA256: 256 - 2*32 - 2 byte
+RSA_OAEP_MAX_PLAINTEXT = 190
+# Kapasitas QR version 40 level H mode byte (1273 byte) untuk ciphertext yang ditulis sebagai hex
+QR_MAX_CIPHERTEXT = 1273 // 2
 
 # Fungsi untuk menghasilkan kunci RSA
 def generate_rsa_keys():
@@ -18,6 +27,25 @@ def generate_rsa_keys():
     public_key = private_key.public_key()
     return private_key, public_key
 
+# Fungsi untuk menghasilkan kunci X25519 (jauh lebih cepat dari RSA)
+def generate_x25519_keys():
+    private_key = x25519.X25519PrivateKey.generate()
+    public_key = private_key.public_key()
+    return private_key, public_key
+
+KEY_GENERATORS = {
+    'rsa': generate_rsa_keys,
+    'x25519': generate_x25519_keys,
+}
+
+# Fungsi untuk menghasilkan kunci sesuai algoritma ('rsa' atau 'x25519')
+def generate_keys(algorithm='rsa'):
+    try:
+        generator = KEY_GENERATORS[algorithm]
+    except KeyError:
+        raise ValueError(f"Algoritma kunci tidak dikenal: {algorithm}") from None
+    return generator()
+
 # Fungsi untuk menampilkan kunci publik dan privat
 def display_keys(private_key, public_key, save_to_file=True):
     private_pem = private_key.private_bytes(
@@ -40,14 +68,14 @@ def display_keys(private_key, public_key, save_to_file=True):
     if save_to_file:
         # Save to Keys directory
         os.makedirs("Keys", exist_ok=True)
-        with open("Keys/public_key.pem", "wb") as f:
-            f.write(public_pem)
-        with open("Keys/private_key.pem", "wb") as f:
-            f.write(private_pem)
+        atomic_write_bytes("Keys/public_key.pem", public_pem)
+        atomic_write_bytes("Keys/private_key.pem", private_pem)
         print("\nKeys saved in 'Keys' directory")
 
-# Fungsi untuk mengenkripsi data menggunakan kunci publik
+# Fungsi untuk mengenkripsi data menggunakan kunci publik (RSA-OAEP atau X25519)
 def encrypt_data(public_key, data):
+    if isinstance(public_key, x25519.X25519PublicKey):
+        return _x25519_encrypt(public_key, data.encode())
     ciphertext = public_key.encrypt(
         data.encode(),
         padding.OAEP(
@@ -58,8 +86,58 @@ def encrypt_data(public_key, data):
     )
     return ciphertext
 
-# Fungsi untuk membuat QR Code dari data
-def create_qr_code(data, filename='qr_code.png'):
+# Fungsi untuk mendekripsi ciphertext menggunakan kunci privat (RSA-OAEP atau X25519)
+def decrypt_data(private_key, ciphertext):
+    if isinstance(private_key, x25519.X25519PrivateKey):
+        return _x25519_decrypt(private_key, ciphertext)
+
+    key_bytes = private_key.key_size // 8
+    if len(ciphertext) != key_bytes:
+        raise ValueError(f"Panjang ciphertext salah: {len(ciphertext)} byte, harus {key_bytes} byte")
+    return private_key.decrypt(
+        ciphertext,
+        padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA256()),
+            algorithm=hashes.SHA256(),
+            label=None
+        )
+    )
+
+# Fungsi untuk menurunkan kunci dan nonce AEAD dari shared secret X25519.
+# Kunci ephemeral selalu baru per pesan, jadi nonce turunan HKDF tidak pernah berulang.
+def _x25519_cipher(shared_secret, ephemeral_public, recipient_public):
+    derived = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32 + 12,
+        salt=ephemeral_public + recipient_public,
+        info=X25519_HKDF_INFO,
+    ).derive(shared_secret)
+    return ChaCha20Poly1305(derived[:32]), derived[32:]
+
+def _raw_public_bytes(public_key):
+    return public_key.public_bytes(
+        encoding=serialization.Encoding.Raw,
+        format=serialization.PublicFormat.Raw
+    )
+
+def _x25519_encrypt(public_key, plaintext):
+    ephemeral_key = x25519.X25519PrivateKey.generate()
+    ephemeral_public = _raw_public_bytes(ephemeral_key.public_key())
+    cipher, nonce = _x25519_cipher(ephemeral_key.exchange(public_key), ephemeral_public, _raw_public_bytes(public_key))
+    return ephemeral_public + cipher.encrypt(nonce, plaintext, None)
+
+def _x25519_decrypt(private_key, ciphertext):
+    if len(ciphertext) < X25519_KEY_SIZE + 16:
+        raise ValueError(f"Ciphertext X25519 terlalu pendek: {len(ciphertext)} byte")
+    ephemeral_public = ciphertext[:X25519_KEY_SIZE]
+    shared_secret = private_key.exchange(x25519.X25519PublicKey.from_public_bytes(ephemeral_public))
+    recipient_public = _raw_public_bytes(private_key.public_key())
+    cipher, nonce = _x25519_cipher(shared_secret, ephemeral_public, recipient_public)
+    return cipher.decrypt(nonce, ciphertext[X25519_KEY_SIZE:], None)
+
+# Fungsi untuk membuat gambar QR Code dari data (tanpa menyimpan ke file)
+def create_qr_image(data):
+    import qrcode
     hex_data = data.hex()
     qr = qrcode.QRCode(
         version=None,
@@ -70,55 +148,72 @@ def create_qr_code(data, filename='qr_code.png'):
     
     qr.add_data(hex_data)
     qr.make(fit=True)
-    img = qr.make_image(fill_color="black", back_color="white")
-    img.save(filename)
+    return qr.make_image(fill_color="black", back_color="white").get_image()
+
+# Fungsi untuk membuat QR Code dari data
+def create_qr_code(data, filename='qr_code.png'):
+    img = create_qr_image(data)
+    # Ditulis atomik; run bersamaan sebaiknya memberi nama unik (io_utils.unique_path)
+    with atomic_output(filename) as temp_path:
+        img.save(temp_path)
     return filename
 
-# Fungsi untuk memproses gambar QR Code menjadi format yang dapat disimpan
-def process_qr_image(image_path):
-    img = Image.open(image_path).convert('1')
+# Fungsi untuk mengompres gambar QR Code (objek PIL) menjadi format yang dapat disimpan.
+# codec: nama di codec_utils.CODECS atau 'auto' (pilih hasil terkecil); ID codec ikut di payload.
+def compress_qr_image(img, codec='auto'):
+    from codec_utils import encode_payload
+    img = img.convert('1')
     width, height = img.size
     img_bytes = img.tobytes()
     
     size_info = (width.to_bytes(2, 'big') + height.to_bytes(2, 'big'))
-    compressed = zlib.compress(size_info + img_bytes)
+    compressed = encode_payload(size_info + img_bytes, codec)
     return compressed
 
+# Fungsi untuk memproses gambar QR Code menjadi format yang dapat disimpan
+def process_qr_image(image_path, codec='auto'):
+    from PIL import Image
+    return compress_qr_image(Image.open(image_path), codec)
+
 # Fungsi untuk mendekripsi data QR Code menggunakan kunci privat
-def decrypt_qr_data(private_key, compressed_data):
+def decrypt_qr_data(private_key, compressed_data, reconstructed_path='reconstructed_qr.png', cache=None):
     try:
-        decompressed = zlib.decompress(compressed_data)
-        width = int.from_bytes(decompressed[:2], 'big')
-        height = int.from_bytes(decompressed[2:4], 'big')
-        img_bytes = decompressed[4:]
-        
-        img = Image.frombytes('1', (width, height), img_bytes)
-        img.save('reconstructed_qr.png')
-        print("[+] QR Code reconstructed and saved as 'reconstructed_qr.png'")
-
-        img.save('temp_qr.png')
-        cv_image = cv2.imread('temp_qr.png')
-        codes = decode(cv_image)
-        os.remove('temp_qr.png')
-
-        if not codes:
-            raise ValueError("QR Code tidak ditemukan dalam gambar.")
-        
-        hex_str = codes[0].data.decode('ascii')
-        ciphertext = bytes.fromhex(hex_str)
-        print(f"[Decrypt] Panjang ciphertext: {len(ciphertext)} bytes")
+        # Ciphertext hasil dekode QR dapat diambil dari cache (bukan plaintext); cache hit tanpa
+        # reconstructed_path tidak membutuhkan PIL maupun libzbar
+        ciphertext = None
+        if cache is not None:
+            cache_key = cache.bytes_key(compressed_data, 'qr')
+            ciphertext = cache.get(cache_key)
 
-        if len(ciphertext) != 256:
-            raise ValueError(f"Panjang ciphertext salah: {len(ciphertext)} byte, harus 256 byte")
+        if ciphertext is None or reconstructed_path:
+            from PIL import Image
+            from codec_utils import decode_payload
+            decompressed = decode_payload(compressed_data)
+            width = int.from_bytes(decompressed[:2], 'big')
+            height = int.from_bytes(decompressed[2:4], 'big')
+            img_bytes = decompressed[4:]
 
-        plaintext = private_key.decrypt(
-            ciphertext,
-            padding.OAEP(
-                mgf=padding.MGF1(algorithm=hashes.SHA256()),
-                algorithm=hashes.SHA256(),
-                label=None
-            )
-        )
+            img = Image.frombytes('1', (width, height), img_bytes)
+            if reconstructed_path:
+                with atomic_output(reconstructed_path) as temp_path:
+                    img.save(temp_path)
+                print(f"[+] QR Code reconstructed and saved as '{reconstructed_path}'")
+
+        if ciphertext is None:
+            from pyzbar.pyzbar import decode
+            # Decode langsung dari memori, tanpa file sementara
+            codes = decode(img.convert('L'))
+
+            if not codes:
+                raise ValueError("QR Code tidak ditemukan dalam gambar.")
+
+            hex_str = codes[0].data.decode('ascii')
+            ciphertext = bytes.fromhex(hex_str)
+            if cache is not None:
+                cache.put(cache_key, ciphertext)
+        print(f"[Decrypt] Panjang ciphertext: {len(ciphertext)} bytes")
+
+        plaintext = decrypt_data(private_key, ciphertext)
         return plaintext.decode()
     except Exception as e:
         print(f"Decryption failed: {e}")
@@ -132,4 +227,13 @@ def load_private_key(key_path):
             password=None,
             backend=default_backend()
         )
-    return private_key
\ No newline at end of file
+    return private_key
+
+# Fungsi untuk memuat kunci publik dari file
+def load_public_key(key_path):
+    with open(key_path, "rb") as key_file:
+        public_key = serialization.load_pem_public_key(
+            key_file.read(),
+            backend=default_backend()
+        )
+    return public_key
@@ -1,9 +1,11 @@
 from crypto_utils import load_private_key, decrypt_qr_data
 from stegano_utils import extract_data_from_audio
+from mem_profile import stage, add_profile_argument, run_profiled
+import argparse
 import os
 
-#
-def main():
+# cache_dir (opsional): cache hasil ekstraksi dan dekode QR (lihat extract_cache.py)
+def main(cache_dir=None):
     try:
         print("=== DECRYPTION PROCESS ===")
         
@@ -26,16 +28,23 @@ def main():
         private_key = load_private_key(key_path)
         print("[+] Private key loaded successfully")
 
+        cache = None
+        if cache_dir:
+            from extract_cache import ExtractionCache
+            cache = ExtractionCache(cache_dir)
+
         # 4. Extract data from audio
         print("\n[4] Extracting Hidden Data from Audio...")
         # We'll extract a large number of bits first
         initial_bits = 1000000  # We'll try with 1 million bits first
-        extracted_data = extract_data_from_audio(audio_path, initial_bits)
+        with stage("extract"):
+            extracted_data = extract_data_from_audio(audio_path, initial_bits, cache=cache)
         print("[+] Data extracted successfully")
 
         # 5. Reconstruct QR and decrypt
         print("\n[5] Reconstructing QR Code and Decrypting...")
-        decrypted_text = decrypt_qr_data(private_key, extracted_data)
+        with stage("decrypt"):
+            decrypted_text = decrypt_qr_data(private_key, extracted_data, cache=cache)
         
         if decrypted_text:
             print("\n=== DECRYPTION SUCCESSFUL! ✅ ===")
@@ -47,4 +56,9 @@ def main():
         print(f"\n[ERROR] {str(e)}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Ekstrak dan dekripsi pesan dari audio stego (interaktif).")
+    add_profile_argument(parser)
+    parser.add_argument("--cache", type=str, default=None, metavar="DIR",
+                        help="Direktori cache ekstraksi/dekode QR (dekripsi ulang file yang sama cukup hash)")
+    args = parser.parse_args()
+    run_profiled(main, args.profile_memory, args.cache)
\ No newline at end of file
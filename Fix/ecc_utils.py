@@ -0,0 +1,81 @@
+import numpy as np
+
+# Kode koreksi error tingkat bitstream (encode/decode tervektorisasi dengan NumPy).
+# Setiap kode mempunyai ID kecil yang dicatat di flags header frame.
+
+# Class kode repetisi n kali; salinan disebar sejauh panjang data (interleaving maksimal)
+class RepetitionCode:
+    def __init__(self, code_id, name, n):
+        self.code_id = code_id
+        self.name = name
+        self.n = n
+
+    def encoded_length(self, n_bits):
+        return n_bits * self.n
+
+    def encode(self, bits):
+        # Salinan ke-k dari bit i berada di posisi k * len(bits) + i
+        return np.tile(bits, self.n)
+
+    def decode(self, bits, n_bits):
+        # Majority vote per bit data
+        votes = bits[:n_bits * self.n].reshape(self.n, n_bits).sum(axis=0, dtype=np.int32)
+        return (votes > self.n // 2).astype(np.uint8)
+
+# Class kode Hamming(7,4) sistematis dengan block interleaving antar codeword
+class Hamming74Code:
+    # Bagian paritas generator: codeword = [d1 d2 d3 d4 p1 p2 p3]
+    PARITY = np.array([[1, 1, 0],
+                       [1, 0, 1],
+                       [0, 1, 1],
+                       [1, 1, 1]], dtype=np.uint8)
+
+    def __init__(self, code_id, name):
+        self.code_id = code_id
+        self.name = name
+        self.generator = np.hstack([np.eye(4, dtype=np.uint8), self.PARITY])
+        self.parity_check = np.hstack([self.PARITY.T, np.eye(3, dtype=np.uint8)])
+
+        # Tabel sindrom -> posisi bit yang salah (-1 = tidak ada error)
+        self.syndrome_table = np.full(8, -1, dtype=np.int64)
+        for pos in range(7):
+            s = self.parity_check[:, pos]
+            self.syndrome_table[s[0] * 4 + s[1] * 2 + s[2]] = pos
+
+    def encoded_length(self, n_bits):
+        return -(-n_bits // 4) * 7
+
+    def encode(self, bits):
+        data = np.zeros(-(-len(bits) // 4) * 4, dtype=np.uint8)
+        data[:len(bits)] = bits
+        codewords = (data.reshape(-1, 4).astype(np.int32) @ self.generator) % 2
+        # Interleave: bit ke-j dari semua codeword ditulis berurutan
+        return codewords.T.ravel().astype(np.uint8)
+
+    def decode(self, bits, n_bits):
+        n_codewords = -(-n_bits // 4)
+        codewords = bits[:n_codewords * 7].reshape(7, n_codewords).T.copy()
+        syndrome = (codewords.astype(np.int32) @ self.parity_check.T) % 2
+        error_pos = self.syndrome_table[syndrome @ np.array([4, 2, 1])]
+        rows = np.nonzero(error_pos >= 0)[0]
+        codewords[rows, error_pos[rows]] ^= 1
+        return codewords[:, :4].ravel()[:n_bits]
+
+ECC_CODES = {
+    code.name: code
+    for code in (
+        RepetitionCode(1, 'rep3', 3),
+        RepetitionCode(2, 'rep5', 5),
+        Hamming74Code(3, 'hamming74'),
+    )
+}
+ECC_CODES_BY_ID = {code.code_id: code for code in ECC_CODES.values()}
+
+# Fungsi untuk memilih kode ECC berdasarkan nama (None = tanpa ECC)
+def get_ecc_code(name):
+    if name is None:
+        return None
+    try:
+        return ECC_CODES[name]
+    except KeyError:
+        raise ValueError(f"Kode ECC tidak dikenal: {name}") from None
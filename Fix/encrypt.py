@@ -1,5 +1,9 @@
-from crypto_utils import generate_rsa_keys, display_keys, encrypt_data, create_qr_code, process_qr_image
+from crypto_utils import (generate_keys, display_keys, encrypt_data, create_qr_code, process_qr_image,
+                          RSA_OAEP_MAX_PLAINTEXT, QR_MAX_CIPHERTEXT)
+from cryptography.hazmat.primitives.asymmetric import rsa
 from stegano_utils import embed_data_in_audio
+from mem_profile import stage, add_profile_argument, run_profiled
+import argparse
 import os
 
 def main():
@@ -7,23 +11,31 @@ def main():
         print("=== ENCRYPTION STAGE ===")
         input_text = input("Enter text to encrypt: ")
 
-        # 1. Generate RSA Key   
-        print("\n[1] Generating RSA Keys...")
-        private_key, public_key = generate_rsa_keys()
+        # 1. Generate Key (RSA atau X25519)
+        key_type = input("Key type (rsa/x25519, default: rsa): ").strip().lower() or "rsa"
+        print(f"\n[1] Generating {key_type.upper()} Keys...")
+        with stage("keygen"):
+            private_key, public_key = generate_keys(key_type)
         display_keys(private_key, public_key)
 
         # 2. Encrypt Text
         print("\n[2] Encrypting Text...")
-        encrypted_data = encrypt_data(public_key, input_text)
+        # Batas RSA berlaku pada plaintext (OAEP); X25519 hanya dibatasi kapasitas QR
+        if isinstance(public_key, rsa.RSAPublicKey) and len(input_text.encode()) > RSA_OAEP_MAX_PLAINTEXT:
+            raise ValueError(f"Text exceeds RSA 2048-bit OAEP limit ({RSA_OAEP_MAX_PLAINTEXT} bytes); "
+                             f"use the x25519 key type for longer messages.")
+        with stage("encrypt"):
+            encrypted_data = encrypt_data(public_key, input_text)
         print(f"[+] Encrypted Size: {len(encrypted_data)} bytes")
 
-        if len(encrypted_data) > 256:
-            raise ValueError("Encrypted data exceeds RSA 2048-bit limit (256 bytes).")
+        if len(encrypted_data) > QR_MAX_CIPHERTEXT:
+            raise ValueError(f"Encrypted data exceeds QR code capacity ({QR_MAX_CIPHERTEXT} bytes).")
 
         # 3. Generate QR Code
         print("\n[3] Generating QR Code...")
-        qr_path = create_qr_code(encrypted_data)
-        compressed_data = process_qr_image(qr_path)
+        with stage("qr"):
+            qr_path = create_qr_code(encrypted_data)
+            compressed_data = process_qr_image(qr_path)
         print(f"[+] QR Code generated and saved as '{qr_path}'")
         print(f"[+] Compressed QR size: {len(compressed_data)} bytes")
 
@@ -32,11 +44,12 @@ def main():
         audio_path = input("Enter path to WAV audio file: ")
         if not os.path.exists(audio_path):
             raise ValueError(f"Audio file not found: {audio_path}")
-        
-        
+        output_path = input("Output file (.wav or .flac, default: stego_audio.wav): ").strip() or "stego_audio.wav"
+
         # Check if audio file is large enough
         expected_bit_length = len(compressed_data) * 8
-        stego_audio = embed_data_in_audio(audio_path, compressed_data)
+        with stage("embed"):
+            stego_audio = embed_data_in_audio(audio_path, compressed_data, output_path)
         print(f"\n=== ENCRYPTION COMPLETE!  ===")
         print(f"[+] Original text length: {len(input_text)} characters")
         print(f"[+] Final audio file: {stego_audio}")
@@ -48,4 +61,7 @@ def main():
         print(f"\n[ERROR] {str(e)}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Enkripsi teks dan sisipkan ke audio (interaktif).")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    run_profiled(main, args.profile_memory)
\ No newline at end of file
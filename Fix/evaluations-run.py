@@ -1,7 +1,10 @@
+import argparse
 import os
 from crypto_utils import generate_rsa_keys, encrypt_data, create_qr_code, process_qr_image, decrypt_qr_data
 from stegano_utils import embed_data_in_audio, extract_data_from_audio
 from evaluations import RSACryptoEvaluator, DWTSteganoEvaluator, run_evaluation
+from mem_profile import stage, add_profile_argument, run_profiled
+from io_utils import unique_path
 import tempfile
 
 def main():
@@ -18,30 +21,37 @@ def main():
 
     # [3] Generate RSA Keys
     print("\n🔑 Membuat kunci RSA...")
-    private_key, public_key = generate_rsa_keys()
+    with stage("keygen"):
+        private_key, public_key = generate_rsa_keys()
 
     # [4] Enkripsi teks
     print("🔐 Mengenkripsi teks...")
-    ciphertext = encrypt_data(public_key, text)
+    with stage("encrypt"):
+        ciphertext = encrypt_data(public_key, text)
 
     # [5] Buat QR code dari hasil enkripsi
     print("📷 Membuat QR code...")
-    qr_file = create_qr_code(ciphertext)
+    with stage("qr"):
+        qr_file = create_qr_code(ciphertext, unique_path("qr_code.png"))
 
     # [6] Kompres gambar QR
     print("📦 Kompres QR code...")
-    compressed_data = process_qr_image(qr_file)
+    with stage("compress"):
+        compressed_data = process_qr_image(qr_file)
 
     # [7] Sisipkan ke audio
     print("🎧 Menyisipkan ke audio...")
-    stego_path = "stego_audio.wav"
-    embed_data_in_audio(audio_path, compressed_data, output_path=stego_path)
+    # Nama unik per run agar run bersamaan tidak saling menimpa
+    stego_path = unique_path("stego_audio.wav")
+    with stage("embed"):
+        embed_data_in_audio(audio_path, compressed_data, output_path=stego_path)
 
     print(f"✅ Stego audio disimpan sebagai: {stego_path}")
 
     # [8] Jalankan evaluasi lengkap
     print("\n📊 Menjalankan evaluasi...")
-    results = run_evaluation(text, audio_path, stego_path, private_key)
+    with stage("evaluation"):
+        results = run_evaluation(text, audio_path, stego_path, private_key)
 
     print("\n=== HASIL EVALUASI ===")
     print_formatted_results(results)
@@ -68,4 +78,7 @@ def print_formatted_results(results):
         print(f" - Error: {r.get('error', 'Unknown Error')}")
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Jalankan pipeline steganografi audio + RSA dan evaluasinya.")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    run_profiled(main, args.profile_memory)
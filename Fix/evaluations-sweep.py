@@ -0,0 +1,189 @@
+import argparse
+import contextlib
+import csv
+import hashlib
+import io
+import itertools
+import json
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import numpy as np
+import soundfile as sf
+import stegano_utils
+from stegano_utils import (
+    LiftingHaarBackend, get_transform_backend, payload_coeff_length, embed_data_in_bytes, extract_data_from_bytes,
+)
+from stego_scan import find_audio_files
+from stego_shard import cover_capacity_bits
+
+# Kolom hasil (urutan tetap agar CSV bisa dilanjutkan); 'key' selalu kolom pertama
+FIELDS = [
+    "key", "cover", "payload_size", "transform", "ecc", "depth", "scale_factor",
+    "capacity_bits", "frame_coeffs", "utilization", "fits",
+    "embed_time_sec", "extract_time_sec", "embed_mb_per_sec", "extract_mb_per_sec",
+    "psnr_dB", "snr_dB", "max_abs_diff", "recovered", "error",
+]
+
+# Fungsi untuk membuat kunci stabil satu titik grid (dipakai untuk melanjutkan sweep)
+def job_key(job):
+    params = {name: job[name] for name in ("cover", "payload_size", "transform", "ecc", "depth", "scale_factor", "seed")}
+    return hashlib.blake2b(json.dumps(params, sort_keys=True).encode(), digest_size=8).hexdigest()
+
+# Fungsi untuk menyusun grid (payload x cover x mode embed x scale factor)
+def build_jobs(covers, payload_sizes, transforms, eccs, scale_factors, seed=0, depths=(1,)):
+    jobs = []
+    for cover, payload_size, transform, ecc, depth in itertools.product(covers, payload_sizes, transforms, eccs, depths):
+        # Lifting tidak memakai scale factor, cukup satu titik
+        factors = [None] if get_transform_backend(transform) is LiftingHaarBackend else scale_factors
+        for scale_factor in factors:
+            job = {"cover": cover, "payload_size": payload_size, "transform": transform,
+                   "ecc": ecc, "depth": depth, "scale_factor": scale_factor, "seed": seed}
+            job["key"] = job_key(job)
+            jobs.append(job)
+    return jobs
+
+# Fungsi untuk menghitung metrik kualitas antara cover dan stego (mono, float64)
+def quality_metrics(cover_bytes, stego_bytes):
+    original, _ = sf.read(io.BytesIO(cover_bytes))
+    stego, _ = sf.read(io.BytesIO(stego_bytes))
+    if original.ndim > 1:
+        original = original.mean(axis=1)
+    if stego.ndim > 1:
+        stego = stego.mean(axis=1)
+    n = min(len(original), len(stego))
+    noise = original[:n] - stego[:n]
+    mse = np.mean(noise ** 2)
+    max_val = np.max(np.abs(original))
+    signal_power = np.mean(original ** 2)
+    return {
+        "psnr_dB": 100.0 if mse == 0 else 20 * math.log10(max_val / math.sqrt(mse)) if max_val > 0 else 0.0,
+        "snr_dB": 100.0 if mse == 0 else 10 * math.log10(signal_power / mse) if signal_power > 0 else 0.0,
+        "max_abs_diff": float(np.max(np.abs(noise))) if n else 0.0,
+    }
+
+# Fungsi job (dijalankan di proses worker): embed + extract di memori untuk satu titik grid
+def run_job(job):
+    result = {name: job.get(name) for name in FIELDS}
+    result["recovered"] = False
+    payload = np.random.default_rng([job["seed"], job["payload_size"]]).bytes(job["payload_size"])
+
+    try:
+        capacity_bits = cover_capacity_bits(job["cover"], job["transform"])
+        frame_coeffs = payload_coeff_length(job["payload_size"], job["ecc"], job["depth"])
+        result.update(capacity_bits=capacity_bits, frame_coeffs=frame_coeffs,
+                      utilization=frame_coeffs / capacity_bits if capacity_bits else None,
+                      fits=frame_coeffs <= capacity_bits)
+        if frame_coeffs > capacity_bits:
+            result["error"] = "payload tidak muat di cover"
+            return result
+
+        with open(job["cover"], "rb") as f:
+            cover_bytes = f.read()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            stego_bytes = embed_data_in_bytes(cover_bytes, payload, transform=job["transform"], ecc=job["ecc"],
+                                              depth=job["depth"], scale_factor=job["scale_factor"])
+            embed_time = time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            extracted = extract_data_from_bytes(stego_bytes, transform=job["transform"],
+                                                scale_factor=job["scale_factor"])
+            extract_time = time.perf_counter() - start_time
+
+        audio_mb = len(cover_bytes) / 2**20
+        result.update(embed_time_sec=embed_time, extract_time_sec=extract_time,
+                      embed_mb_per_sec=audio_mb / embed_time, extract_mb_per_sec=audio_mb / extract_time,
+                      recovered=extracted == payload, **quality_metrics(cover_bytes, stego_bytes))
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+# Class penulis hasil bertahap (CSV atau JSONL sesuai ekstensi), aman dilanjutkan setelah terputus
+class ResultWriter:
+    def __init__(self, path):
+        self.path = path
+        self.format = "jsonl" if path.endswith((".jsonl", ".json")) else "csv"
+        self.done = self._load_done()
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self.file = open(path, "a", newline="")
+        self.csv_writer = csv.DictWriter(self.file, FIELDS) if self.format == "csv" else None
+        if self.csv_writer and new_file:
+            self.csv_writer.writeheader()
+
+    def _load_done(self):
+        if not os.path.exists(self.path):
+            return set()
+        # Baris terakhir yang terpotong (proses dihentikan saat menulis) dibuang
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+        done = set()
+        with open(self.path, newline="") as f:
+            if self.format == "csv":
+                for row in csv.DictReader(f):
+                    done.add(row["key"])
+            else:
+                for line in f:
+                    if line.strip():
+                        done.add(json.loads(line)["key"])
+        return done
+
+    def write(self, result):
+        if self.csv_writer:
+            self.csv_writer.writerow(result)
+        else:
+            self.file.write(json.dumps(result) + "\n")
+        self.file.flush()
+        self.done.add(result["key"])
+
+    def close(self):
+        self.file.close()
+
+# Fungsi untuk menjalankan sweep secara paralel; titik grid yang sudah ada di output dilewati
+def run_sweep(jobs, output_path, workers=None):
+    writer = ResultWriter(output_path)
+    pending = [job for job in jobs if job["key"] not in writer.done]
+    print(f"[Sweep] {len(jobs)} titik grid, {len(jobs) - len(pending)} sudah selesai, {len(pending)} dijalankan")
+
+    start_time = time.perf_counter()
+    completed = failed = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(run_job, job) for job in pending]
+            for future in as_completed(futures):
+                result = future.result()
+                writer.write(result)
+                completed += 1
+                failed += not result["recovered"]
+                if completed % 10 == 0 or completed == len(pending):
+                    print(f"[Sweep] {completed}/{len(pending)} ({time.perf_counter() - start_time:.1f} s)")
+    finally:
+        writer.close()
+    return completed, failed
+
+def _parse_ecc(value):
+    return None if value.lower() == "none" else value
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sweep parameter embed/extract dengan hasil CSV/JSONL yang bisa dilanjutkan.")
+    parser.add_argument("covers", type=str, nargs="+", help="File cover atau direktori (dipindai rekursif)")
+    parser.add_argument("--output", type=str, default="sweep_results.csv", help="File hasil .csv atau .jsonl")
+    parser.add_argument("--payload-sizes", type=int, nargs="+", default=[256, 1024, 4096], help="Ukuran payload (bytes)")
+    parser.add_argument("--transforms", type=str, nargs="+", default=["pywt", "lifting"], help="Transform (pywt, numpy, lifting)")
+    parser.add_argument("--ecc", type=_parse_ecc, nargs="+", default=[None], help="Kode ECC (none, rep3, rep5, hamming74)")
+    parser.add_argument("--depths", type=int, nargs="+", default=[1], help="Jumlah LSB per koefisien (1-8, default: 1)")
+    parser.add_argument("--scale-factors", type=int, nargs="+", default=[stegano_utils.SCALE_FACTOR],
+                        help=f"Scale factor kuantisasi backend float (default: {stegano_utils.SCALE_FACTOR})")
+    parser.add_argument("--seed", type=int, default=0, help="Seed payload (default: 0)")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    args = parser.parse_args()
+
+    covers = []
+    for path in args.covers:
+        covers.extend(find_audio_files(path) if os.path.isdir(path) else [path])
+    jobs = build_jobs(covers, args.payload_sizes, args.transforms, args.ecc, args.scale_factors, args.seed, args.depths)
+    completed, failed = run_sweep(jobs, args.output, args.workers)
+    print(f"[Sweep] Selesai: {completed} titik baru, {failed} gagal dipulihkan. Hasil: {args.output}")
@@ -1,13 +1,13 @@
+import argparse
 import os
 import numpy as np
 import soundfile as sf
 import time
 import math
-import matplotlib.pyplot as plt
-from scipy.signal import spectrogram
-from skimage.metrics import structural_similarity as ssim
 from crypto_utils import generate_rsa_keys, encrypt_data, create_qr_code, process_qr_image, decrypt_qr_data
 from stegano_utils import embed_data_in_audio, extract_data_from_audio
+from mem_profile import stage, add_profile_argument, run_profiled
+from io_utils import unique_path
 
 # Class untuk evaluasi kriptografi RSA
 class RSACryptoEvaluator:
@@ -47,6 +47,7 @@ class DWTSteganoEvaluator:
     @staticmethod
     # Fungsi untuk mengevaluasi imperceptibility
     def evaluate_imperceptibility(original_audio_path, stego_audio_path):
+        from skimage.metrics import structural_similarity as ssim
         original, _ = sf.read(original_audio_path)
         stego, _ = sf.read(stego_audio_path)
 
@@ -90,7 +91,7 @@ class DWTSteganoEvaluator:
     def evaluate_recovery(original_text, stego_audio_path, private_key):
         try:
             extracted_data = extract_data_from_audio(stego_audio_path, float('inf'))
-            decrypted_text = decrypt_qr_data(private_key, extracted_data)
+            decrypted_text = decrypt_qr_data(private_key, extracted_data, reconstructed_path=None)
             if decrypted_text == original_text:
                 return {"success": True, "recovery_rate_percent": 100.0}
             else:
@@ -102,11 +103,26 @@ class DWTSteganoEvaluator:
         except Exception as e:
             return {"success": False, "recovery_rate_percent": 0.0, "error": str(e)}
 
+    @staticmethod
+    # Fungsi untuk mengevaluasi keterdeteksian statistik (chi-square, histogram, RS pada cD1).
+    # Jika analisis gagal (cover terlalu pendek, format tidak terbaca) baris hasil berisi "error",
+    # seperti evaluate_recovery, agar hasil evaluasi lain tetap dilaporkan
+    def evaluate_detectability(original_audio_path, stego_audio_path, transform='pywt'):
+        from steganalysis import analyze_pair
+        return analyze_pair(original_audio_path, stego_audio_path, transform)
+
+# Fungsi untuk menampilkan perkiraan RS; None = analisis RS tidak terdefinisi untuk file tersebut
+def format_rs_rate(rate):
+    return "n/a" if rate is None else f"{rate:.3f}"
+
 # Fungsi untuk membuat perbandingan spektrogram
 def create_spectrogram_comparison(original_audio_path, stego_audio_path, output_path="spectrogram_comparison.png"):
     """
     Buat perbandingan spektrogram antara audio original dan steganografi
     """
+    import matplotlib.pyplot as plt
+    from scipy.signal import spectrogram
+
     print("📊 Membuat perbandingan spektrogram...")
     
     # Load audio files
@@ -187,27 +203,41 @@ def create_spectrogram_comparison(original_audio_path, stego_audio_path, output_
 def run_evaluation(text_data, original_audio_path, stego_audio_path, private_key):
     print("\n=== [1] RSA CRYPTOGRAPHY EVALUATION ===")
     rsa_eval = RSACryptoEvaluator()
-    timing = rsa_eval.compute_time(text_data)
-    avalanche = rsa_eval.avalanche_effect(text_data)
+    with stage("eval.rsa"):
+        timing = rsa_eval.compute_time(text_data)
+        avalanche = rsa_eval.avalanche_effect(text_data)
     print(f"Key Generation Time: {timing['key_generation_time_sec']:.4f} sec")
     print(f"Encryption Time: {timing['encryption_time_sec']:.4f} sec")
     print(f"Avalanche Effect: {avalanche:.2f} %")
 
     print("\n=== [2] DWT STEGANOGRAPHY EVALUATION ===")
     steg_eval = DWTSteganoEvaluator()
-    quality = steg_eval.evaluate_imperceptibility(original_audio_path, stego_audio_path)
+    with stage("eval.imperceptibility"):
+        quality = steg_eval.evaluate_imperceptibility(original_audio_path, stego_audio_path)
     print(f"PSNR: {quality['psnr_dB']:.2f} dB")
     print(f"SSIM: {quality['ssim']:.4f}")
 
-    capacity = steg_eval.evaluate_capacity(original_audio_path)
+    with stage("eval.capacity"):
+        capacity = steg_eval.evaluate_capacity(original_audio_path)
     print(f"Capacity: {capacity['capacity_bytes']} bytes ({capacity['bits_per_second']:.2f} bps)")
 
-    recovery = steg_eval.evaluate_recovery(text_data, stego_audio_path, private_key)
+    with stage("eval.recovery"):
+        recovery = steg_eval.evaluate_recovery(text_data, stego_audio_path, private_key)
     print(f"Recovery Rate: {recovery['recovery_rate_percent']:.2f} %")
+
+    with stage("eval.detectability"):
+        detectability = steg_eval.evaluate_detectability(original_audio_path, stego_audio_path)
+    if detectability.get("error"):
+        print(f"Detectability: n/a ({detectability['error']})")
+    else:
+        print(f"RS Embedding Rate: {format_rs_rate(detectability['cover_rs_rate'])} (cover) -> "
+              f"{format_rs_rate(detectability['stego_rs_rate'])} (stego)")
+        print(f"Chi-square p: {detectability['cover_chi2_p']:.3f} (cover) -> {detectability['stego_chi2_p']:.3f} (stego)")
     
     # === TAMBAHAN: SPEKTROGRAM ANALYSIS ===
     print("\n=== [3] SPEKTROGRAM ANALYSIS ===")
-    spectral_analysis = create_spectrogram_comparison(original_audio_path, stego_audio_path)
+    with stage("eval.spectrogram"):
+        spectral_analysis = create_spectrogram_comparison(original_audio_path, stego_audio_path)
     print(f"Spektral Correlation: {spectral_analysis['spectral_correlation']:.4f}")
     print(f"Max Difference: {spectral_analysis['max_difference_db']:.2f} dB")
     print(f"Mean Difference: {spectral_analysis['mean_difference_db']:.2f} dB")
@@ -220,7 +250,8 @@ def run_evaluation(text_data, original_audio_path, stego_audio_path, private_key
         "steganography": {
             "imperceptibility": quality,
             "capacity": capacity,
-            "recovery": recovery
+            "recovery": recovery,
+            "detectability": detectability
         },
         "spectral_analysis": spectral_analysis
     }
@@ -239,30 +270,37 @@ def main():
 
     # [3] Generate RSA Keys
     print("\n🔑 Membuat kunci RSA...")
-    private_key, public_key = generate_rsa_keys()
+    with stage("keygen"):
+        private_key, public_key = generate_rsa_keys()
 
     # [4] Enkripsi teks
     print("🔐 Mengenkripsi teks...")
-    ciphertext = encrypt_data(public_key, text)
+    with stage("encrypt"):
+        ciphertext = encrypt_data(public_key, text)
 
     # [5] Buat QR code dari hasil enkripsi
     print("📷 Membuat QR code...")
-    qr_file = create_qr_code(ciphertext)
+    with stage("qr"):
+        qr_file = create_qr_code(ciphertext, unique_path("qr_code.png"))
 
     # [6] Kompres gambar QR
     print("📦 Kompres QR code...")
-    compressed_data = process_qr_image(qr_file)
+    with stage("compress"):
+        compressed_data = process_qr_image(qr_file)
 
     # [7] Sisipkan ke audio
     print("🎧 Menyisipkan ke audio...")
-    stego_path = "stego_audio.wav"
-    embed_data_in_audio(audio_path, compressed_data, output_path=stego_path)
+    # Nama unik per run agar run bersamaan tidak saling menimpa
+    stego_path = unique_path("stego_audio.wav")
+    with stage("embed"):
+        embed_data_in_audio(audio_path, compressed_data, output_path=stego_path)
 
     print(f"✅ Stego audio disimpan sebagai: {stego_path}")
 
     # [8] Jalankan evaluasi lengkap dengan spektrogram
     print("\n📊 Menjalankan evaluasi...")
-    results = run_evaluation(text, audio_path, stego_path, private_key)
+    with stage("evaluation"):
+        results = run_evaluation(text, audio_path, stego_path, private_key)
 
     print("\n=== HASIL EVALUASI ===")
     print_formatted_results(results)
@@ -287,6 +325,16 @@ def print_formatted_results(results):
     if not r['success']:
         print(f" - Error: {r.get('error', 'Unknown Error')}")
     
+    d = results['steganography']['detectability']
+    if d.get('error'):
+        print(" - RS Embedding Rate: n/a")
+        print(f" - Error: {d['error']}")
+    else:
+        print(f" - RS Embedding Rate: {format_rs_rate(d['cover_rs_rate'])} (cover) -> "
+              f"{format_rs_rate(d['stego_rs_rate'])} (stego)")
+        print(f" - Chi-square p: {d['cover_chi2_p']:.3f} (cover) -> {d['stego_chi2_p']:.3f} (stego)")
+        print(f" - Histogram Distance: {d['hist_distance']:.5f}")
+
     print("\n📊 [Spektrogram Analysis]")
     s = results['spectral_analysis']
     print(f" - Spektral Correlation: {s['spectral_correlation']:.4f}")
@@ -295,4 +343,7 @@ def print_formatted_results(results):
     print(f" - Plot File: {s['plot_saved']}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Evaluasi pipeline steganografi audio + RSA dengan spektrogram.")
+    add_profile_argument(parser)
+    args = parser.parse_args()
+    run_profiled(main, args.profile_memory)
\ No newline at end of file
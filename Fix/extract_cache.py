@@ -0,0 +1,167 @@
+import hashlib
+import os
+import tempfile
+
+CACHE_MAGIC = b'SGC1'
+DIGEST_SIZE = 16
+CHUNK_SIZE = 1 << 20
+# Eviksi membuang entri sampai total <= LOW_WATER * max_bytes, agar scan direktori cache
+# tidak terjadi di setiap put (biayanya diamortisasi atas banyak penulisan)
+LOW_WATER = 0.9
+
+# Fungsi untuk menghitung hash isi file audio secara bertahap (blake2b cepat).
+# Menerima path atau objek file-like (posisi baca dikembalikan ke awal).
+def content_hash(audio_path):
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    if hasattr(audio_path, "read"):
+        audio_path.seek(0)
+        while chunk := audio_path.read(CHUNK_SIZE):
+            digest.update(chunk)
+        audio_path.seek(0)
+        return digest.hexdigest()
+    with open(audio_path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Instance per proses per direktori cache (lihat shared_cache)
+_shared_caches = {}
+
+# Fungsi untuk mengambil instance cache milik proses ini; worker pool yang menerima cache
+# (di-pickle per task/chunk) memakai instance yang sama sehingga perkiraan ukuran cache tetap
+# terjaga dan direktori tidak di-scan ulang untuk setiap task
+def shared_cache(cache_dir='.stego_cache', max_bytes=256 * 2**20):
+    key = (os.path.abspath(cache_dir), max_bytes)
+    cache = _shared_caches.get(key)
+    if cache is None:
+        cache = _shared_caches[key] = ExtractionCache(cache_dir, max_bytes)
+    return cache
+
+# Class cache hasil ekstraksi/dekode di disk, dengan eviksi LRU berbatas ukuran
+class ExtractionCache:
+    def __init__(self, cache_dir='.stego_cache', max_bytes=256 * 2**20):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        # Perkiraan total ukuran cache: hasil scan terakhir + penulisan proses ini sejak itu.
+        # None = belum pernah di-scan. Proses lain yang berbagi direktori tidak terlihat di sini,
+        # jadi cache bisa melampaui max_bytes sebesar (jumlah proses x selisih low-water) sebelum eviksi.
+        self.size_estimate = None
+        os.makedirs(cache_dir, exist_ok=True)
+
+    # Saat di-pickle ke proses worker, dibuka ulang lewat shared_cache
+    def __reduce__(self):
+        return shared_cache, (self.cache_dir, self.max_bytes)
+
+    # Kunci = hash(isi data + namespace + parameter ekstraksi)
+    @staticmethod
+    def make_key(data_hash, namespace, **params):
+        digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+        digest.update(f"{namespace}|{data_hash}|{sorted(params.items())!r}".encode())
+        return digest.hexdigest()
+
+    def file_key(self, audio_path, namespace, **params):
+        return self.make_key(content_hash(audio_path), namespace, **params)
+
+    def bytes_key(self, data, namespace, **params):
+        return self.make_key(hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest(), namespace, **params)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.bin")
+
+    # Cache dapat dipakai bersama oleh banyak proses (stego_scan, batch decrypt): entri bisa
+    # dihapus proses lain kapan saja, jadi setiap kegagalan I/O dianggap miss, bukan error
+    def get(self, key):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                blob = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        # Cek integritas: magic + digest isi; entri rusak dihapus
+        header_len = len(CACHE_MAGIC) + DIGEST_SIZE
+        value = blob[header_len:]
+        if (blob[:len(CACHE_MAGIC)] != CACHE_MAGIC
+                or blob[len(CACHE_MAGIC):header_len] != hashlib.blake2b(value, digest_size=DIGEST_SIZE).digest()):
+            print(f"[Cache] Corrupt entry removed: {key}")
+            self._remove(path)
+            self.misses += 1
+            return None
+
+        # Sentuh mtime agar entri ini menjadi yang terbaru untuk LRU; jika entri baru saja
+        # dieviksi proses lain, isinya sudah terbaca dan terverifikasi, jadi tetap dipakai
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        blob = CACHE_MAGIC + hashlib.blake2b(value, digest_size=DIGEST_SIZE).digest() + value
+        if len(blob) > self.max_bytes:
+            return
+        # Tulis ke file sementara lalu rename agar pembaca tidak melihat entri setengah jadi.
+        # Gagal menulis (disk penuh, direktori dihapus) hanya melewatkan put.
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(blob)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"[Cache] Put skipped: {e}")
+            if tmp_path is not None:
+                self._remove(tmp_path)
+            return
+
+        if self.size_estimate is None:
+            self.size_estimate = self._scan()[1]
+        else:
+            self.size_estimate += len(blob)
+        if self.size_estimate > self.max_bytes:
+            self.evict()
+
+    # Fungsi untuk membaca daftar entri (mtime, ukuran, path) dan total ukurannya.
+    # Entri yang dihapus proses lain di tengah scan dilewati.
+    def _scan(self):
+        entries = []
+        total = 0
+        try:
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    if not entry.name.endswith(".bin"):
+                        continue
+                    try:
+                        stat = entry.stat()
+                    except FileNotFoundError:
+                        continue
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        except OSError:
+            pass
+        return entries, total
+
+    # Fungsi untuk menghapus entri paling lama dipakai sampai total ukuran <= LOW_WATER * max_bytes
+    def evict(self):
+        entries, total = self._scan()
+        target = self.max_bytes * LOW_WATER
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+        self.size_estimate = total
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses}
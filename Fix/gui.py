@@ -1,12 +1,19 @@
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                              QHBoxLayout, QPushButton, QLabel, QTextEdit, QFileDialog,
-                             QTabWidget, QProgressBar, QMessageBox, QSizePolicy, QSpacerItem)
-from PyQt5.QtCore import Qt
+                             QTabWidget, QProgressBar, QMessageBox, QSizePolicy, QSpacerItem, QComboBox,
+                             QTableWidget, QTableWidgetItem, QHeaderView, QSpinBox)
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QPixmap, QFont
-from crypto_utils import generate_rsa_keys, display_keys, encrypt_data, create_qr_code, process_qr_image, load_private_key, decrypt_qr_data
+from crypto_utils import generate_keys, display_keys, encrypt_data, create_qr_code, process_qr_image, load_private_key, decrypt_qr_data
 from stegano_utils import embed_data_in_audio, extract_data_from_audio
+from key_pool import RSAKeyPool
+from batch_jobs import (RESULT_FIELDS, FINISHED_STATUSES, JOURNAL_NAME, run_encrypt_job, run_decrypt_job,
+                        key_path_for, load_messages, plan_encrypt_jobs, export_results)
+from job_journal import JobJournal
+from concurrent.futures import ProcessPoolExecutor
 import sys
 import os
+import time
 import base64
 
 # Class untuk GUI Steganografi Audio
@@ -107,6 +114,13 @@ class SteganoGUI(QMainWindow):
         # Encrypt button with spacers for centering
         button_layout = QHBoxLayout()
         button_layout.addStretch(1)
+        key_type_label = QLabel("Key type:")
+        button_layout.addWidget(key_type_label)
+        self.key_type_combo = QComboBox()
+        self.key_type_combo.addItem("RSA-2048", "rsa")
+        self.key_type_combo.addItem("X25519", "x25519")
+        self.key_type_combo.currentIndexChanged.connect(self.on_key_type_changed)
+        button_layout.addWidget(self.key_type_combo)
         encrypt_btn = QPushButton("Encrypt")
         encrypt_btn.setMinimumWidth(150)
         encrypt_btn.clicked.connect(self.encrypt_text)
@@ -337,6 +351,7 @@ class SteganoGUI(QMainWindow):
         # Add tabs to tab widget
         tabs.addTab(encrypt_tab, "Encrypt")
         tabs.addTab(decrypt_tab, "Decrypt")
+        tabs.addTab(self.build_batch_tab(), "Batch")
 
         # Instance variables
         self.audio_path = None
@@ -345,11 +360,242 @@ class SteganoGUI(QMainWindow):
         self.encrypted_data = None
         self.compressed_data = None
         self.qr_path = None
+
+        # Keypair RSA baru per pesan diambil dari pool yang diisi di latar belakang; pool (dan
+        # proses pembuat kuncinya) baru dibuat saat RSA dipilih atau dipakai pertama kali
+        self.key_pool = None
         
         # Set window height to accommodate the new elements
         self.setGeometry(100, 100, 800, 700)  # Increased height from 650 to 700
         
         
+    # Hentikan worker pool kunci dan batch saat jendela ditutup
+    def closeEvent(self, event):
+        if self.key_pool is not None:
+            self.key_pool.close()
+        if self.batch_pool is not None:
+            self.batch_pool.shutdown(wait=False, cancel_futures=True)
+        for journal in self.batch_journals.values():
+            journal.close()
+        super().closeEvent(event)
+
+    # fungsi untuk mengambil pool kunci RSA, dibuat saat pertama dibutuhkan
+    def get_key_pool(self):
+        if self.key_pool is None:
+            self.key_pool = RSAKeyPool()
+        return self.key_pool
+
+    # Mulai mengisi pool di latar belakang begitu pengguna memilih RSA
+    def on_key_type_changed(self, index):
+        if self.key_type_combo.itemData(index) == "rsa":
+            self.get_key_pool()
+
+    # fungsi untuk membuat tab antrian batch
+    def build_batch_tab(self):
+        self.batch_rows = []
+        self.batch_pool = None
+        # Jurnal per direktori output (dibuka saat batch pertama kali dijalankan)
+        self.batch_journals = {}
+        self.batch_start_time = None
+        # Status future diperiksa berkala dari thread GUI (widget Qt tidak boleh diubah dari thread lain)
+        self.batch_timer = QTimer(self)
+        self.batch_timer.setInterval(100)
+        self.batch_timer.timeout.connect(self.poll_batch_jobs)
+
+        batch_tab = QWidget()
+        batch_layout = QVBoxLayout(batch_tab)
+        batch_layout.setContentsMargins(15, 15, 15, 15)
+        batch_layout.setSpacing(12)
+
+        add_layout = QHBoxLayout()
+        add_encrypt_btn = QPushButton("Add Encrypt Jobs...")
+        add_encrypt_btn.clicked.connect(self.add_batch_encrypt_jobs)
+        add_layout.addWidget(add_encrypt_btn)
+        add_decrypt_btn = QPushButton("Add Decrypt Jobs...")
+        add_decrypt_btn.clicked.connect(self.add_batch_decrypt_jobs)
+        add_layout.addWidget(add_decrypt_btn)
+        add_layout.addStretch(1)
+        add_layout.addWidget(QLabel("Key type:"))
+        self.batch_key_type_combo = QComboBox()
+        self.batch_key_type_combo.addItem("RSA-2048", "rsa")
+        self.batch_key_type_combo.addItem("X25519", "x25519")
+        add_layout.addWidget(self.batch_key_type_combo)
+        add_layout.addWidget(QLabel("Workers:"))
+        self.batch_workers_spin = QSpinBox()
+        self.batch_workers_spin.setRange(1, os.cpu_count() or 1)
+        self.batch_workers_spin.setValue(os.cpu_count() or 1)
+        add_layout.addWidget(self.batch_workers_spin)
+        batch_layout.addLayout(add_layout)
+
+        self.batch_table = QTableWidget(0, len(RESULT_FIELDS))
+        self.batch_table.setHorizontalHeaderLabels(["Type", "Input", "Cover / Key", "Status", "Output", "Result", "Time (s)"])
+        self.batch_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.batch_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        batch_layout.addWidget(self.batch_table)
+
+        run_layout = QHBoxLayout()
+        run_layout.addStretch(1)
+        start_btn = QPushButton("Start")
+        start_btn.setMinimumWidth(120)
+        start_btn.clicked.connect(self.start_batch_jobs)
+        run_layout.addWidget(start_btn)
+        export_btn = QPushButton("Export Results...")
+        export_btn.clicked.connect(self.export_batch_results)
+        run_layout.addWidget(export_btn)
+        clear_btn = QPushButton("Clear Finished")
+        clear_btn.clicked.connect(self.clear_batch_jobs)
+        run_layout.addWidget(clear_btn)
+        run_layout.addStretch(1)
+        batch_layout.addLayout(run_layout)
+
+        self.batch_progress = QProgressBar()
+        batch_layout.addWidget(self.batch_progress)
+        self.batch_status = QLabel("")
+        self.batch_status.setStyleSheet("color: #4a86e8; font-weight: bold;")
+        self.batch_status.setAlignment(Qt.AlignCenter)
+        batch_layout.addWidget(self.batch_status)
+        return batch_tab
+
+    # fungsi untuk menambah job enkripsi: file pesan (satu per baris) x cover (bergiliran)
+    def add_batch_encrypt_jobs(self):
+        messages_path, _ = QFileDialog.getOpenFileName(self, "Select Messages File (one per line)", "", "Text Files (*.txt)")
+        if not messages_path:
+            return
+        cover_paths, _ = QFileDialog.getOpenFileNames(self, "Select Cover Audio Files", "", "Audio Files (*.wav *.flac)")
+        if not cover_paths:
+            return
+        output_dir = os.path.join(os.path.dirname(messages_path), "batch_output")
+        os.makedirs(output_dir, exist_ok=True)
+
+        key_type = self.batch_key_type_combo.currentData()
+        jobs = plan_encrypt_jobs(load_messages(messages_path), cover_paths, output_dir, key_type)
+        journal_path = os.path.join(output_dir, JOURNAL_NAME)
+        for key, text, cover_path, output_path in jobs:
+            self.add_batch_row("encrypt", text, cover_path, run_encrypt_job, (text, cover_path, output_path, key_type),
+                               journal=(journal_path, key))
+
+    # fungsi untuk menambah job dekripsi; kunci diambil dari <stego>.key.pem jika ada
+    def add_batch_decrypt_jobs(self):
+        stego_paths, _ = QFileDialog.getOpenFileNames(self, "Select Stego Audio Files", "", "Audio Files (*.wav *.flac)")
+        if not stego_paths:
+            return
+        shared_key_path = None
+        for stego_path in stego_paths:
+            key_path = key_path_for(stego_path)
+            if not os.path.exists(key_path):
+                if shared_key_path is None:
+                    shared_key_path, _ = QFileDialog.getOpenFileName(self, "Select Private Key", "", "PEM Files (*.pem)")
+                    if not shared_key_path:
+                        return
+                key_path = shared_key_path
+            self.add_batch_row("decrypt", stego_path, key_path, run_decrypt_job, (stego_path, key_path))
+
+    # journal: (path jurnal, key job) untuk job enkripsi; job dekripsi tidak dicatat (hasilnya plaintext)
+    def add_batch_row(self, kind, job_input, cover_or_key, func, args, journal=None):
+        row = {"kind": kind, "input": job_input, "cover_or_key": cover_or_key, "status": "Queued",
+               "output": "", "result": "", "elapsed_sec": "", "func": func, "args": args, "future": None,
+               "journal": journal}
+        self.batch_rows.append(row)
+        self.batch_table.insertRow(self.batch_table.rowCount())
+        self.update_batch_row(len(self.batch_rows) - 1)
+        self.update_batch_status()
+
+    def update_batch_row(self, index):
+        row = self.batch_rows[index]
+        for column, field in enumerate(RESULT_FIELDS):
+            value = row[field]
+            if field == "input" or field == "cover_or_key":
+                value = value if row["kind"] == "encrypt" and field == "input" else os.path.basename(value)
+            self.batch_table.setItem(index, column, QTableWidgetItem(str(value)))
+
+    def get_batch_journal(self, path):
+        if path not in self.batch_journals:
+            self.batch_journals[path] = JobJournal(path)
+        return self.batch_journals[path]
+
+    # fungsi untuk menjalankan semua job yang masih antri di pool proses;
+    # job enkripsi yang sudah selesai di run sebelumnya (menurut jurnal) dilewati
+    def start_batch_jobs(self):
+        if self.batch_pool is None:
+            self.batch_pool = ProcessPoolExecutor(max_workers=self.batch_workers_spin.value())
+        queued = [row for row in self.batch_rows if row["status"] == "Queued"]
+        if not queued:
+            self.batch_status.setText("No queued jobs.")
+            return
+        for row in queued:
+            if row["journal"] is not None:
+                journal_path, key = row["journal"]
+                journal = self.get_batch_journal(journal_path)
+                if journal.is_done(key):
+                    row.update(status="Skipped", output=row["args"][2], result=journal.get(key)["result"])
+                    self.update_batch_row(self.batch_rows.index(row))
+                    continue
+                journal.start(key, row["kind"], {"cover": row["args"][1], "output": row["args"][2],
+                                                 "key_type": row["args"][3]})
+            row["future"] = self.batch_pool.submit(row["func"], *row["args"])
+            row["status"] = "Pending"
+        # Job yang dilewati tidak ikut dihitung di throughput
+        self.batch_start_time = time.perf_counter()
+        self.batch_done_at_start = sum(row["status"] in FINISHED_STATUSES for row in self.batch_rows)
+        self.update_batch_status()
+        self.batch_timer.start()
+
+    def poll_batch_jobs(self):
+        for index, row in enumerate(self.batch_rows):
+            future = row["future"]
+            if future is None or row["status"] in FINISHED_STATUSES:
+                continue
+            if future.done():
+                journal = self.get_batch_journal(row["journal"][0]) if row["journal"] else None
+                try:
+                    result = future.result()
+                    row.update(status="Done", output=result["output"], result=result["result"],
+                               elapsed_sec=f"{result['elapsed_sec']:.3f}")
+                    if journal:
+                        journal.complete(row["journal"][1], row["kind"], result["outputs"], result["result"])
+                except Exception as e:
+                    row.update(status="Error", result=str(e))
+                    if journal:
+                        journal.fail(row["journal"][1], row["kind"], e)
+            elif future.running() and row["status"] != "Running":
+                row["status"] = "Running"
+            else:
+                continue
+            self.update_batch_row(index)
+        self.update_batch_status()
+
+        if not any(row["status"] in ("Pending", "Running") for row in self.batch_rows):
+            self.batch_timer.stop()
+
+    # fungsi untuk menampilkan progres dan throughput batch
+    def update_batch_status(self):
+        total = len(self.batch_rows)
+        finished = sum(row["status"] in FINISHED_STATUSES for row in self.batch_rows)
+        errors = sum(row["status"] == "Error" for row in self.batch_rows)
+        self.batch_progress.setMaximum(max(total, 1))
+        self.batch_progress.setValue(finished)
+
+        text = f"{finished}/{total} finished, {errors} errors"
+        if self.batch_start_time is not None:
+            elapsed = time.perf_counter() - self.batch_start_time
+            finished_now = finished - self.batch_done_at_start
+            if elapsed > 0 and finished_now:
+                text += f" — {finished_now / elapsed:.2f} jobs/s"
+        self.batch_status.setText(text)
+
+    def export_batch_results(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export Results", "batch_results.csv", "CSV Files (*.csv)")
+        if path:
+            export_results(self.batch_rows, path)
+            self.batch_status.setText(f"Results exported to {os.path.basename(path)}")
+
+    def clear_batch_jobs(self):
+        self.batch_rows = [row for row in self.batch_rows if row["status"] not in FINISHED_STATUSES]
+        self.batch_table.setRowCount(len(self.batch_rows))
+        for index in range(len(self.batch_rows)):
+            self.update_batch_row(index)
+        self.update_batch_status()
+
     #  fungsi untuk memilih file audio
     def select_audio_file(self):
         file_path, _ = QFileDialog.getOpenFileName(self, "Select Audio File", "", "WAV Files (*.wav)")
@@ -382,7 +628,11 @@ class SteganoGUI(QMainWindow):
             self.encrypt_status.setText("Encrypting text and generating QR...")
             self.encrypt_progress.setValue(10)
 
-            private_key, public_key = generate_rsa_keys()
+            key_type = self.key_type_combo.currentData()
+            if key_type == "rsa":
+                private_key, public_key = self.get_key_pool().get()
+            else:
+                private_key, public_key = generate_keys(key_type)
             display_keys(private_key, public_key)
 
             self.encrypted_data = encrypt_data(public_key, text)
@@ -0,0 +1,50 @@
+import contextlib
+import os
+
+# Penulisan file keluaran yang aman untuk run bersamaan dan crash: data ditulis ke file sementara
+# di direktori yang sama lalu dipindahkan dengan os.replace (atomik pada filesystem yang sama),
+# sehingga pembaca tidak pernah melihat file setengah jadi. Modul ini diimpor crypto_utils, jadi
+# hanya memakai os/contextlib di level atas (lihat benchmark-startup.py).
+
+# Fungsi untuk membuat nama file sementara di samping target; ekstensi dipertahankan
+# agar penulis yang menebak format dari ekstensi (soundfile, PIL) tetap bekerja
+def temp_path_for(path):
+    directory, name = os.path.split(os.fspath(path))
+    stem, ext = os.path.splitext(name)
+    return os.path.join(directory, f".{stem}.tmp-{os.getpid()}-{os.urandom(4).hex()}{ext}")
+
+# Context manager: menghasilkan path sementara; jika blok selesai tanpa error, file
+# dipindahkan ke path tujuan, jika gagal file sementara dihapus
+@contextlib.contextmanager
+def atomic_output(path):
+    temp_path = temp_path_for(path)
+    try:
+        yield temp_path
+        os.replace(temp_path, path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(temp_path)
+        raise
+
+# Fungsi untuk menulis bytes secara atomik
+def atomic_write_bytes(path, data):
+    with atomic_output(path) as temp_path:
+        with open(temp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+    return path
+
+# Fungsi untuk menghitung SHA-256 isi file secara bertahap (file besar tidak dibaca sekaligus)
+def file_sha256(path, chunk_size=1 << 20):
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+# Fungsi untuk membuat nama keluaran unik per run (mis. stego_audio.wav -> stego_audio_4821_9f3a1c.wav)
+def unique_path(path):
+    stem, ext = os.path.splitext(os.fspath(path))
+    return f"{stem}_{os.getpid()}_{os.urandom(3).hex()}{ext}"
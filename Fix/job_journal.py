@@ -0,0 +1,90 @@
+import json
+import os
+import time
+from io_utils import file_sha256
+
+# Jurnal job batch (append-only JSONL): satu baris per perubahan status job, dikunci oleh key stabil
+# dari parameter job; baris terakhir per key yang berlaku. Job 'done' yang file keluarannya masih
+# cocok dengan hash di jurnal dilewati saat batch dijalankan ulang, sehingga batch yang terhenti
+# (crash, Ctrl+C) cukup dilanjutkan. Hanya proses induk yang menulis jurnal.
+
+# Fungsi untuk mencatat file keluaran job: path, ukuran dan SHA-256 (dipakai saat resume)
+def describe_outputs(paths):
+    # Path absolut agar resume dari direktori kerja lain tetap menemukan file
+    return [{"path": os.path.abspath(path), "size": os.path.getsize(path), "sha256": file_sha256(path)}
+            for path in paths]
+
+# Fungsi untuk memeriksa apakah file keluaran yang tercatat masih utuh.
+# verify_hash=False hanya membandingkan ukuran (cepat untuk file audio besar).
+def outputs_intact(outputs, verify_hash=True):
+    for output in outputs:
+        path = output["path"]
+        if not os.path.exists(path) or os.path.getsize(path) != output["size"]:
+            return False
+        if verify_hash and file_sha256(path) != output["sha256"]:
+            return False
+    return True
+
+# Class jurnal job; entri terbaru per key disimpan di memori, setiap perubahan langsung di-append
+class JobJournal:
+    def __init__(self, path):
+        self.path = path
+        self.entries = self._load()
+        self.file = open(path, "a", encoding="utf-8")
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        # Baris terakhir yang terpotong (proses dihentikan saat menulis) dibuang
+        with open(self.path, "rb+") as f:
+            data = f.read()
+            if data and not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+        entries = {}
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    entries[entry["key"]] = entry
+        return entries
+
+    def _append(self, entry):
+        entry["time"] = time.time()
+        self.file.write(json.dumps(entry) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.entries[entry["key"]] = entry
+
+    def get(self, key):
+        return self.entries.get(key)
+
+    # Fungsi untuk mengecek job selesai: status done dan semua keluarannya masih utuh
+    def is_done(self, key, verify_hash=True):
+        entry = self.entries.get(key)
+        return entry is not None and entry["status"] == "done" and outputs_intact(entry["outputs"], verify_hash)
+
+    # Job yang terputus tetap berstatus 'running' di jurnal dan dijalankan ulang saat resume
+    def start(self, key, kind, params):
+        self._append({"key": key, "kind": kind, "status": "running", "params": params})
+
+    def complete(self, key, kind, outputs, result=None):
+        self._append({"key": key, "kind": kind, "status": "done", "outputs": outputs, "result": result})
+
+    def fail(self, key, kind, error):
+        self._append({"key": key, "kind": kind, "status": "error", "error": str(error)})
+
+    # Fungsi untuk menghitung jumlah job per status
+    def summary(self):
+        counts = {}
+        for entry in self.entries.values():
+            counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+        return counts
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,121 @@
+import argparse
+import queue
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from cryptography.hazmat.primitives import serialization
+from crypto_utils import generate_rsa_keys
+
+# Fungsi worker: buat satu keypair RSA dan kirim sebagai DER (objek kunci tidak bisa di-pickle)
+def _generate_key_der():
+    private_key, _ = generate_rsa_keys()
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+
+def _load_key_der(der):
+    # Kunci dibuat sendiri oleh worker, validasi RSA yang mahal dapat dilewati
+    private_key = serialization.load_der_private_key(der, password=None, unsafe_skip_rsa_key_validation=True)
+    return private_key, private_key.public_key()
+
+# Class pool keypair RSA yang diisi di latar belakang oleh proses worker.
+# Jika jumlah kunci siap + yang sedang dibuat turun ke low_watermark, pool diisi lagi sampai high_watermark.
+class RSAKeyPool:
+    def __init__(self, low_watermark=2, high_watermark=8, workers=2):
+        if not 0 <= low_watermark < high_watermark:
+            raise ValueError("Harus 0 <= low_watermark < high_watermark.")
+        self.low_watermark = low_watermark
+        self.high_watermark = high_watermark
+        self.hits = 0
+        self.misses = 0
+        self._keys = queue.Queue(maxsize=high_watermark)
+        self._pending = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=workers)
+        self._refill()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Fungsi untuk mengambil keypair: langsung dari pool (hit) atau dibuat di tempat (miss)
+    def get(self):
+        try:
+            private_key, public_key = _load_key_der(self._keys.get_nowait())
+            with self._lock:
+                self.hits += 1
+        except queue.Empty:
+            with self._lock:
+                self.misses += 1
+            private_key, public_key = generate_rsa_keys()
+        self._refill()
+        return private_key, public_key
+
+    # Fungsi untuk menunggu pool terisi (mis. sebelum benchmark atau permintaan pertama)
+    def wait_ready(self, count=None, timeout=None):
+        count = self.high_watermark if count is None else count
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._keys.qsize() < count:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+    def _refill(self):
+        with self._lock:
+            if self._closed or self._keys.qsize() + self._pending > self.low_watermark:
+                return
+            missing = self.high_watermark - self._keys.qsize() - self._pending
+            self._pending += missing
+        for _ in range(missing):
+            self._executor.submit(_generate_key_der).add_done_callback(self._on_generated)
+
+    def _on_generated(self, future):
+        with self._lock:
+            self._pending -= 1
+        if future.cancelled() or future.exception() is not None:
+            return
+        try:
+            self._keys.put_nowait(future.result())
+        except queue.Full:
+            pass
+
+    def stats(self):
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "available": self._keys.qsize(), "pending": self._pending}
+
+    def close(self):
+        with self._lock:
+            self._closed = True
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bandingkan latensi keygen RSA langsung vs dari pool.")
+    parser.add_argument("--requests", type=int, default=20, help="Jumlah permintaan keypair (default: 20)")
+    parser.add_argument("--interval", type=float, default=0.2, help="Jeda antar permintaan dalam detik (default: 0.2)")
+    parser.add_argument("--low", type=int, default=2, help="Low watermark (default: 2)")
+    parser.add_argument("--high", type=int, default=8, help="High watermark (default: 8)")
+    parser.add_argument("--workers", type=int, default=2, help="Jumlah proses worker (default: 2)")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    generate_rsa_keys()
+    print(f"[Pool] Keygen langsung: {(time.perf_counter() - start_time) * 1000:.1f} ms")
+
+    with RSAKeyPool(args.low, args.high, args.workers) as pool:
+        pool.wait_ready()
+        latencies = []
+        for _ in range(args.requests):
+            start_time = time.perf_counter()
+            pool.get()
+            latencies.append((time.perf_counter() - start_time) * 1000)
+            time.sleep(args.interval)
+        latencies.sort()
+        print(f"[Pool] Median: {latencies[len(latencies) // 2]:.2f} ms, maks: {latencies[-1]:.2f} ms")
+        print(f"[Pool] {pool.stats()}")
@@ -0,0 +1,149 @@
+import contextlib
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+MB = 2**20
+
+# Profiler yang sedang aktif; stage() menjadi no-op jika tidak ada
+_active = None
+
+# Fungsi untuk menandai satu tahap; dipanggil dari modul pipeline tanpa biaya jika profiling mati
+def stage(name):
+    if _active is None:
+        return contextlib.nullcontext()
+    return _active.stage(name)
+
+def _rss_bytes():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def _max_rss_bytes():
+    if resource is None:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS byte
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+def _mb(value):
+    return None if value is None else round(value / MB, 3)
+
+# Class profiler memori per tahap: puncak tracemalloc, alokasi bersih, RSS dan RSS high-water mark
+class MemoryProfiler:
+    def __init__(self, top=5, frames=1):
+        self.top = top
+        self.frames = frames
+        self.stages = []
+        self._stack = []
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def start(self):
+        global _active
+        tracemalloc.start(self.frames)
+        _active = self
+
+    def stop(self):
+        global _active
+        if _active is self:
+            _active = None
+        tracemalloc.stop()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        _, peak_before = tracemalloc.get_traced_memory()
+        # Puncak tahap induk sebelum tahap ini dimulai tidak boleh hilang oleh reset_peak
+        if self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak_before)
+        frame = {"peak": 0}
+        self._stack.append(frame)
+        # Entri dicatat saat tahap dimulai agar urutan report mengikuti urutan eksekusi
+        entry = {"stage": name, "depth": len(self._stack) - 1}
+        self.stages.append(entry)
+        snapshot = tracemalloc.take_snapshot() if self.top else None
+        current_before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        rss_before = _rss_bytes()
+        start_time = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start_time
+            current_after, peak = tracemalloc.get_traced_memory()
+            peak = max(peak, frame["peak"])
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+
+            rss_after = _rss_bytes()
+            entry.update({
+                "elapsed_sec": round(elapsed, 6),
+                "traced_peak_mb": _mb(peak - current_before),
+                "traced_net_mb": _mb(current_after - current_before),
+                "rss_mb": _mb(rss_after),
+                "rss_delta_mb": _mb(None if rss_before is None or rss_after is None else rss_after - rss_before),
+                "max_rss_mb": _mb(_max_rss_bytes()),
+            })
+            if snapshot is not None:
+                diff = tracemalloc.take_snapshot().compare_to(snapshot, "lineno")[:self.top]
+                entry["top_allocations"] = [
+                    {"location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                     "size_diff_mb": _mb(stat.size_diff), "count_diff": stat.count_diff}
+                    for stat in diff
+                ]
+
+    def report(self):
+        return {
+            "python": sys.version.split()[0],
+            "platform": sys.platform,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "max_rss_mb": _mb(_max_rss_bytes()),
+            "stages": self.stages,
+        }
+
+    def print_report(self):
+        print("\n=== MEMORY PROFILE ===")
+        print(f"{'Stage':<32} {'Time (s)':>9} {'Peak (MB)':>10} {'Net (MB)':>9} {'RSS (MB)':>9} {'HWM (MB)':>9}")
+        for entry in self.stages:
+            name = "  " * entry["depth"] + entry["stage"]
+            print(f"{name:<32} {entry['elapsed_sec']:>9.4f} {entry['traced_peak_mb']:>10.2f} "
+                  f"{entry['traced_net_mb']:>9.2f} {_fmt(entry['rss_mb']):>9} {_fmt(entry['max_rss_mb']):>9}")
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+        print(f"[Memory] Report disimpan: {path}")
+
+def _fmt(value):
+    return "-" if value is None else f"{value:.1f}"
+
+# Fungsi untuk menambahkan flag --profile-memory ke parser argparse
+def add_profile_argument(parser):
+    parser.add_argument("--profile-memory", nargs="?", const="memory_profile.json", default=None, metavar="PATH",
+                        help="Profil memori per tahap dan simpan report JSON (default: memory_profile.json)")
+
+# Fungsi untuk menjalankan fungsi utama dengan profiler jika report_path diberikan
+def run_profiled(func, report_path, *args, **kwargs):
+    if not report_path:
+        return func(*args, **kwargs)
+    with MemoryProfiler() as profiler:
+        try:
+            return func(*args, **kwargs)
+        finally:
+            profiler.print_report()
+            profiler.save(report_path)
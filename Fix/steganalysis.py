@@ -0,0 +1,217 @@
+import argparse
+import csv
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from stegano_utils import quantized_detail
+
+# Steganalisis LSB pada koefisien cD1 terkuantisasi (nilai yang LSB-nya diganti saat embed).
+# Semua uji memakai histogram NumPy (bincount) sehingga satu file cukup satu kali baca + transform.
+
+# Rentang nilai koefisien yang masuk histogram (genap, agar pasangan 2k/2k+1 tidak terpotong)
+HIST_LIMIT = 1 << 16
+# Jumlah segmen untuk profil chi-square berurutan (payload disisipkan mulai koefisien 0)
+CHI_SEGMENTS = 20
+# Frekuensi harapan minimum per pasangan agar ikut dihitung (aturan umum uji chi-square)
+CHI_MIN_EXPECTED = 5
+# Ukuran grup dan mask untuk analisis RS
+RS_MASK = np.array([0, 1, 1, 0], dtype=bool)
+# Toleransi perkiraan RS di luar [0, 1]; lebih jauh dari ini dianggap tidak terdefinisi (None)
+RS_TOLERANCE = 0.1
+
+# Fungsi untuk menghitung histogram kumulatif per segmen (baris i = prefix sampai segmen i)
+def _prefix_histograms(values, segments, limit=HIST_LIMIT):
+    in_range = (values >= -limit) & (values < limit)
+    segment = (np.arange(len(values)) * segments // max(len(values), 1))[in_range]
+    index = segment * (2 * limit) + (values[in_range] + limit)
+    hist = np.bincount(index, minlength=segments * 2 * limit).reshape(segments, 2 * limit)
+    return np.cumsum(hist, axis=0)
+
+# Fungsi untuk peluang ekor atas chi-square (aproksimasi Wilson-Hilferty, tanpa scipy)
+def _chi2_sf(chi2, dof):
+    if dof <= 0:
+        return 1.0
+    z = ((chi2 / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+# Uji chi-square pairs-of-values (Westfeld-Pfitzmann): penggantian LSB menyamakan frekuensi
+# nilai 2k dan 2k+1. p mendekati 1 berarti histogram sudah "rata" per pasangan (indikasi embed).
+def chi_square_profile(values, segments=CHI_SEGMENTS):
+    # Rentang histogram secukupnya (genap) agar array per segmen tetap kecil
+    peak = int(np.abs(values).max()) + 2 if len(values) else 2
+    hist = _prefix_histograms(values, segments, min(HIST_LIMIT, peak + peak % 2))
+    even, odd = hist[:, 0::2].astype(np.float64), hist[:, 1::2].astype(np.float64)
+    expected = (even + odd) / 2
+    valid = expected >= CHI_MIN_EXPECTED
+    terms = np.where(valid, (even - expected) ** 2 / np.where(valid, expected, 1), 0.0)
+    chi2 = terms.sum(axis=1)
+    dof = valid.sum(axis=1) - 1
+    return [_chi2_sf(c, int(d)) for c, d in zip(chi2, dof)]
+
+# Fungsi untuk menghitung selisih frekuensi pasangan 2k/2k+1 relatif terhadap jumlah nilai
+def pair_imbalance(hist):
+    total = hist.sum()
+    return float(np.abs(hist[0::2] - hist[1::2]).sum() / total) if total else 0.0
+
+def _group_smoothness(groups):
+    return np.abs(np.diff(groups, axis=1)).sum(axis=1)
+
+def _rs_counts(groups):
+    base = _group_smoothness(groups)
+    positive = groups.copy()
+    positive[:, RS_MASK] ^= 1
+    negative = groups.copy()
+    negative[:, RS_MASK] = ((negative[:, RS_MASK] + 1) ^ 1) - 1
+    f_pos, f_neg = _group_smoothness(positive), _group_smoothness(negative)
+    n = len(groups)
+    return ((f_pos > base).sum() / n, (f_pos < base).sum() / n,
+            (f_neg > base).sum() / n, (f_neg < base).sum() / n)
+
+# Analisis RS (Fridrich) untuk deret 1-D: grup 4 koefisien berurutan, mask [0, 1, 1, 0].
+# Mengembalikan perkiraan proporsi koefisien yang LSB-nya dipakai (0 = bersih), atau None jika
+# persamaan kuadrat RS tidak terdefinisi (R ~ S, mis. cover berisik): bukan berarti "penuh".
+def rs_estimate(values):
+    groups = values[:len(values) - len(values) % len(RS_MASK)].astype(np.int64).reshape(-1, len(RS_MASK))
+    if len(groups) == 0:
+        return None
+    r_m, s_m, r_neg, s_neg = _rs_counts(groups)
+    r_m1, s_m1, r_neg1, s_neg1 = _rs_counts(groups ^ 1)
+
+    d0, d1 = r_m - s_m, r_m1 - s_m1
+    dn0, dn1 = r_neg - s_neg, r_neg1 - s_neg1
+    a, b, c = 2 * (d1 + d0), dn0 - dn1 - d1 - 3 * d0, d0 - dn0
+    if abs(a) < 1e-12:
+        if abs(b) < 1e-12:
+            return None
+        x = -c / b
+    else:
+        disc = b * b - 4 * a * c
+        if disc < 0:
+            return None
+        roots = [(-b + sign * math.sqrt(disc)) / (2 * a) for sign in (1, -1)]
+        x = min(roots, key=abs)
+    if abs(x - 0.5) < 1e-12:
+        return None
+    rate = x / (x - 0.5)
+    # Hanya deviasi kecil akibat noise estimasi yang dipotong ke [0, 1]
+    if not -RS_TOLERANCE <= rate <= 1 + RS_TOLERANCE:
+        return None
+    return float(min(max(rate, 0.0), 1.0))
+
+# Fungsi untuk menganalisis satu file: statistik deteksi dari koefisien cD1
+def analyze_file(audio_path, transform='pywt'):
+    values = np.asarray(quantized_detail(audio_path, transform), dtype=np.int64)
+    profile = chi_square_profile(values)
+    hist = _prefix_histograms(values, 1)[-1]
+    # Bagian awal terpanjang yang masih terlihat "rata" per pasangan
+    suspicious = [p > 0.5 for p in profile]
+    embedded = next((i for i, flag in enumerate(suspicious) if not flag), len(profile))
+    return {
+        "coefficients": len(values),
+        "chi2_p": profile[-1],
+        "chi2_p_first": profile[0],
+        "chi2_embedded_fraction": embedded / len(profile),
+        "pair_imbalance": pair_imbalance(hist),
+        "rs_rate": rs_estimate(values),
+    }, hist
+
+STAT_FIELDS = ["coefficients", "chi2_p", "chi2_p_first", "chi2_embedded_fraction", "pair_imbalance", "rs_rate"]
+FIELDS = ["cover", "stego", "transform"] + [f"{side}_{name}" for side in ("cover", "stego") for name in STAT_FIELDS] \
+    + ["hist_distance", "error"]
+
+# Fungsi untuk menganalisis pasangan cover/stego (dijalankan di proses worker)
+def analyze_pair(cover_path, stego_path, transform='pywt'):
+    row = {"cover": cover_path, "stego": stego_path, "transform": transform}
+    try:
+        cover_stats, cover_hist = analyze_file(cover_path, transform)
+        stego_stats, stego_hist = analyze_file(stego_path, transform)
+        row.update({f"cover_{name}": value for name, value in cover_stats.items()})
+        row.update({f"stego_{name}": value for name, value in stego_stats.items()})
+        # Jarak total variation antara histogram cover dan stego
+        total = max(cover_hist.sum(), stego_hist.sum(), 1)
+        row["hist_distance"] = float(np.abs(cover_hist - stego_hist).sum() / (2 * total))
+    except Exception as e:
+        row["error"] = str(e)
+    return row
+
+# Fungsi untuk menghitung AUC detektor (Mann-Whitney): 0.5 = tidak terdeteksi, 1.0 = selalu terdeteksi.
+# Skor None (detektor tidak terdefinisi untuk file itu) diabaikan.
+def detection_auc(cover_scores, stego_scores):
+    cover_scores = np.array([score for score in cover_scores if score is not None], float)
+    stego_scores = np.array([score for score in stego_scores if score is not None], float)
+    cover_scores, stego_scores = cover_scores[~np.isnan(cover_scores)], stego_scores[~np.isnan(stego_scores)]
+    if len(cover_scores) == 0 or len(stego_scores) == 0:
+        return None
+    scores = np.concatenate([cover_scores, stego_scores])
+    order = scores.argsort(kind="mergesort")
+    ranks = np.empty(len(scores))
+    ranks[order] = np.arange(1, len(scores) + 1)
+    # Nilai yang sama mendapat rank rata-rata
+    _, inverse, counts = np.unique(scores, return_inverse=True, return_counts=True)
+    ranks = (np.bincount(inverse, ranks) / counts)[inverse]
+    stego_ranks = ranks[len(cover_scores):].sum()
+    n_stego = len(stego_scores)
+    return float((stego_ranks - n_stego * (n_stego + 1) / 2) / (len(cover_scores) * n_stego))
+
+# Fungsi untuk meringkas keterdeteksian dari baris hasil (skor lebih besar = lebih mencurigakan)
+def summarize(rows):
+    rows = [row for row in rows if not row.get("error")]
+    return {
+        "pairs": len(rows),
+        "rs_undefined": sum(row["cover_rs_rate"] is None or row["stego_rs_rate"] is None for row in rows),
+        "auc_chi2": detection_auc([r["cover_chi2_p"] for r in rows], [r["stego_chi2_p"] for r in rows]),
+        "auc_rs": detection_auc([r["cover_rs_rate"] for r in rows], [r["stego_rs_rate"] for r in rows]),
+        "auc_pair_imbalance": detection_auc([-r["cover_pair_imbalance"] for r in rows],
+                                            [-r["stego_pair_imbalance"] for r in rows]),
+    }
+
+# Fungsi untuk menganalisis banyak pasangan secara paralel
+def analyze_pairs(pairs, transform='pywt', workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_pair, [c for c, _ in pairs], [s for _, s in pairs], [transform] * len(pairs),
+                             chunksize=8))
+
+# Fungsi untuk membaca daftar pasangan dari CSV (kolom cover, stego)
+def load_pairs(path):
+    with open(path, newline="") as f:
+        return [(row["cover"], row["stego"]) for row in csv.DictReader(f)]
+
+# Fungsi untuk memasangkan file di dua direktori berdasarkan nama file
+def match_pairs(cover_dir, stego_dir):
+    pairs = []
+    for file_name in sorted(os.listdir(stego_dir)):
+        cover_path = os.path.join(cover_dir, file_name)
+        if os.path.exists(cover_path):
+            pairs.append((cover_path, os.path.join(stego_dir, file_name)))
+    return pairs
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Steganalisis LSB (chi-square, histogram, RS) pada pasangan cover/stego.")
+    parser.add_argument("--pairs", type=str, help="CSV berkolom cover,stego")
+    parser.add_argument("--cover-dir", type=str, help="Direktori cover (dipasangkan dengan --stego-dir lewat nama file)")
+    parser.add_argument("--stego-dir", type=str, help="Direktori stego")
+    parser.add_argument("--transform", type=str, default="pywt", help="Transform (pywt, numpy, lifting)")
+    parser.add_argument("--output", type=str, default="steganalysis_results.csv", help="File hasil CSV")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    args = parser.parse_args()
+
+    if args.pairs:
+        pairs = load_pairs(args.pairs)
+    elif args.cover_dir and args.stego_dir:
+        pairs = match_pairs(args.cover_dir, args.stego_dir)
+    else:
+        parser.error("Gunakan --pairs atau --cover-dir dan --stego-dir")
+
+    start_time = time.perf_counter()
+    rows = analyze_pairs(pairs, args.transform, args.workers)
+    with open(args.output, "w", newline="") as f:
+        writer = csv.DictWriter(f, FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    summary = summarize(rows)
+    print(f"[Steganalysis] {len(rows)} pasangan dalam {time.perf_counter() - start_time:.2f} s, hasil: {args.output}")
+    for name, value in summary.items():
+        print(f"  {name}: {'-' if value is None else round(value, 4)}")
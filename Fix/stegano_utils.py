@@ -1,74 +1,604 @@
+import io
+import os
+import struct
+import zlib
 import numpy as np
-import pywt
 import soundfile as sf
+from ecc_utils import get_ecc_code, ECC_CODES_BY_ID
+from mem_profile import stage
+from io_utils import atomic_output
 
-def embed_data_in_audio(audio_path, data_bytes, output_path='stego_audio.wav'):
-    print(f"[Embed] Data size: {len(data_bytes)} bytes")
-    audio_data, sample_rate = sf.read(audio_path)
-    
-    # Konversi ke mono
-    if len(audio_data.shape) > 1:
-        audio_data = audio_data.mean(axis=1)
-    
-    # Konversi data ke bitstream
-    data_bits = ''.join(format(byte, '08b') for byte in data_bytes)
-    data_len = len(data_bits)
-    print(f"[Embed] Total bit: {data_len}")
+# Tata letak sampel PCM per subtype: (dtype baca, geser bit, subtype tulis, jumlah bit)
+PCM_LAYOUTS = {
+    'PCM_S8': ('int16', 8, 'PCM_S8', 8),
+    'PCM_U8': ('int16', 8, 'PCM_U8', 8),
+    'PCM_16': ('int16', 0, 'PCM_16', 16),
+    'PCM_24': ('int32', 8, 'PCM_24', 24),
+    'PCM_32': ('int32', 0, 'PCM_32', 32),
+}
+# Cover non-PCM (FLOAT/DOUBLE, dll.) dikuantisasi ke PCM 16-bit
+DEFAULT_PCM_LAYOUT = PCM_LAYOUTS['PCM_16']
+
+# Presisi kuantisasi koefisien detail untuk backend float (bawaan; fungsi embed/extract menerima
+# scale_factor=None yang berarti nilai ini)
+SCALE_FACTOR = 1000
+
+# Header frame payload: magic, flags, panjang payload (byte), CRC32 payload
+FRAME_MAGIC = b'STG'
+FRAME_HEADER = struct.Struct('>3sBII')
+FRAME_HEADER_BITS = FRAME_HEADER.size * 8
+# Bit flags header: 0-2 = ID kode ECC payload (0 = tanpa ECC), 3-5 = kedalaman embed - 1
+ECC_FLAG_MASK = 0x07
+DEPTH_FLAG_SHIFT = 3
+DEPTH_FLAG_MASK = 0x38
+# Kedalaman embed: jumlah LSB per koefisien detail untuk bagian payload.
+# Header selalu 1 bit per koefisien agar bisa dibaca tanpa tahu kedalamannya.
+MAX_EMBED_DEPTH = 8
+
+# Backend transformasi Haar level 1 (float) berbasis PyWavelets
+class PywtHaarBackend:
+    name = 'pywt'
+    dtype = 'float64'
+
+    @staticmethod
+    def forward(samples):
+        import pywt
+        approx, detail = pywt.wavedec(samples, 'haar', level=1)
+        return approx, detail
+
+    @staticmethod
+    def inverse(approx, detail):
+        import pywt
+        return pywt.waverec((approx, detail), 'haar')
+
+# Backend transformasi Haar level 1 (float32) murni NumPy, tanpa pywt
+class NumpyHaarBackend:
+    name = 'numpy'
+    dtype = 'float32'
+
+    @staticmethod
+    def forward(samples):
+        # Panjang ganjil dipadding simetris seperti pywt (sampel terakhir diulang)
+        if len(samples) % 2:
+            samples = np.append(samples, samples[-1])
+        pairs = samples.reshape(-1, 2)
+        norm = samples.dtype.type(np.sqrt(0.5))
+        approx = (pairs[:, 0] + pairs[:, 1]) * norm
+        detail = (pairs[:, 0] - pairs[:, 1]) * norm
+        return approx, detail
+
+    @staticmethod
+    def inverse(approx, detail):
+        norm = approx.dtype.type(np.sqrt(0.5))
+        samples = np.empty(len(approx) * 2, dtype=approx.dtype)
+        samples[0::2] = (approx + detail) * norm
+        samples[1::2] = (approx - detail) * norm
+        return samples
+
+# Backend transformasi lifting Haar integer (lihat haar_lifting_forward)
+class LiftingHaarBackend:
+    name = 'lifting'
+    dtype = None  # Ditentukan oleh subtype PCM cover
+
+    @staticmethod
+    def forward(samples):
+        return haar_lifting_forward(samples)
+
+    @staticmethod
+    def inverse(approx, detail):
+        return haar_lifting_inverse(approx, detail)
+
+TRANSFORM_BACKENDS = {
+    backend.name: backend
+    for backend in (PywtHaarBackend, NumpyHaarBackend, LiftingHaarBackend)
+}
+
+# Fungsi untuk memilih backend transformasi berdasarkan nama
+def get_transform_backend(transform):
+    try:
+        return TRANSFORM_BACKENDS[transform]
+    except KeyError:
+        raise ValueError(f"Transform tidak dikenal: {transform}") from None
+
+# Fungsi untuk membungkus payload dengan header frame, menghasilkan bitstream
+def build_frame_bits(payload, ecc=None, depth=1):
+    code = get_ecc_code(ecc)
+    _check_depth(depth)
+    flags = (code.code_id if code else 0) | ((depth - 1) << DEPTH_FLAG_SHIFT)
+    header = FRAME_HEADER.pack(FRAME_MAGIC, flags, len(payload), zlib.crc32(payload))
+    payload_bits = np.unpackbits(np.frombuffer(payload, dtype=np.uint8))
+    if code is not None:
+        # Header tidak diproteksi agar tetap bisa dibaca oleh probe_frame
+        payload_bits = code.encode(payload_bits)
+    return np.concatenate([np.unpackbits(np.frombuffer(header, dtype=np.uint8)), payload_bits])
+
+# Fungsi untuk membaca header frame, None jika bukan frame yang valid
+def parse_frame_header(header_bytes):
+    if len(header_bytes) < FRAME_HEADER.size:
+        return None
+    magic, flags, length, crc32 = FRAME_HEADER.unpack_from(header_bytes)
+    if magic != FRAME_MAGIC:
+        return None
+    return {"flags": flags, "length": length, "crc32": crc32, "depth": _frame_depth(flags)}
+
+# Fungsi untuk menghitung jumlah bit frame (header + payload setelah ECC)
+def frame_bit_length(header):
+    payload_bits = header["length"] * 8
+    code = _frame_ecc_code(header)
+    if code is not None:
+        payload_bits = code.encoded_length(payload_bits)
+    return FRAME_HEADER_BITS + payload_bits
+
+# Fungsi untuk menghitung jumlah koefisien detail yang dipakai frame
+def frame_coeff_length(header):
+    return _coeff_count(frame_bit_length(header), _frame_depth(header["flags"]))
+
+# Fungsi untuk menghitung jumlah koefisien yang dibutuhkan payload framed berukuran tertentu
+def payload_coeff_length(payload_size, ecc=None, depth=1):
+    code = get_ecc_code(ecc)
+    payload_bits = payload_size * 8
+    if code is not None:
+        payload_bits = code.encoded_length(payload_bits)
+    return _coeff_count(FRAME_HEADER_BITS + payload_bits, depth)
+
+def _coeff_count(n_bits, depth):
+    if depth == 1:
+        return n_bits
+    return FRAME_HEADER_BITS + -(-(n_bits - FRAME_HEADER_BITS) // depth)
+
+def _frame_depth(flags):
+    return ((flags & DEPTH_FLAG_MASK) >> DEPTH_FLAG_SHIFT) + 1
+
+def _check_depth(depth):
+    if not 1 <= depth <= MAX_EMBED_DEPTH:
+        raise ValueError(f"Kedalaman embed harus 1..{MAX_EMBED_DEPTH}, bukan {depth}")
+
+def _frame_ecc_code(header):
+    code_id = header["flags"] & ECC_FLAG_MASK
+    if code_id == 0:
+        return None
+    if code_id not in ECC_CODES_BY_ID:
+        raise ValueError(f"ID kode ECC tidak dikenal: {code_id}")
+    return ECC_CODES_BY_ID[code_id]
+
+# Fungsi untuk mengubah payload menjadi bitstream yang akan disisipkan
+def payload_to_bits(data_bytes, framed=True, ecc=None, depth=1):
+    if ecc is not None and not framed:
+        raise ValueError("ECC membutuhkan framed=True (ID kode dicatat di header).")
+    if depth != 1 and not framed:
+        raise ValueError("Kedalaman > 1 membutuhkan framed=True (kedalaman dicatat di header).")
+    if framed:
+        return build_frame_bits(data_bytes, ecc, depth)
+    return np.unpackbits(np.frombuffer(data_bytes, dtype=np.uint8))
+
+# Fungsi untuk mengelompokkan bitstream menjadi nilai per koefisien (symbols) dan mask LSB-nya.
+# depth > 1: header frame tetap 1 bit per koefisien, sisanya `depth` bit per koefisien (MSB dulu).
+def bits_to_symbols(data_bits, depth=1):
+    _check_depth(depth)
+    data_bits = np.asarray(data_bits, dtype=np.uint8)
+    if depth == 1:
+        return data_bits, np.ones(len(data_bits), dtype=np.uint8)
+
+    body = data_bits[FRAME_HEADER_BITS:]
+    padded = np.zeros(-(-len(body) // depth) * depth, dtype=np.uint8)
+    padded[:len(body)] = body
+    weights = (1 << np.arange(depth - 1, -1, -1)).astype(np.uint16)
+    body_symbols = (padded.reshape(-1, depth) @ weights).astype(np.uint8)
+
+    symbols = np.concatenate([data_bits[:FRAME_HEADER_BITS], body_symbols])
+    masks = np.full(len(symbols), (1 << depth) - 1, dtype=np.uint8)
+    masks[:FRAME_HEADER_BITS] = 1
+    return symbols, masks
+
+# Fungsi untuk menyisipkan bit ke LSB koefisien detail sebuah array sampel 1-D.
+# Untuk lifting, `layout` adalah tata letak PCM (lihat PCM_LAYOUTS).
+def embed_bits_in_samples(samples, data_bits, backend, layout=None, depth=1, scale_factor=None):
+    return embed_symbols_in_samples(samples, *bits_to_symbols(data_bits, depth), backend, layout, scale_factor)
+
+# Fungsi untuk menyisipkan nilai per koefisien (lihat bits_to_symbols) ke koefisien detail
+def embed_symbols_in_samples(samples, symbols, masks, backend, layout=None, scale_factor=None):
+    data_len = len(symbols)
+
+    # Gunakan DWT level 1
+    approx, detail = backend.forward(samples)
 
     # Alokasi ruang di audio
-    if len(audio_data) * 8 < data_len:
+    if len(detail) < data_len:
         raise ValueError("Audio tidak cukup besar untuk menyimpan data.")
 
-    # Gunakan DWT level 1
-    coeffs = pywt.wavedec(audio_data, 'haar', level=1)
-    approx, detail = coeffs
-
-    # Sisipkan bit ke detail coefficients
-    bit_index = 0
-    detail_flat = np.copy(detail)
-    scale_factor = 1000  # Untuk presisi float
-
-    for i in range(len(detail_flat)):
-        if bit_index >= data_len:
-            break
-        coeff_val = detail_flat[i] * scale_factor
-        coeff_int = int(round(coeff_val))
-        coeff_int = (coeff_int & ~1) | int(data_bits[bit_index])  # Ganti LSB
-        detail_flat[i] = coeff_int / scale_factor
-        bit_index += 1
+    # Sisipkan bit ke detail coefficients (ganti k LSB secara vektor)
+    coeff_int = _quantize_detail(detail[:data_len], backend, scale_factor)
+    clear = ~masks.astype(coeff_int.dtype)
+    detail[:data_len] = _dequantize_detail((coeff_int & clear) | symbols, backend, scale_factor)
 
     # Rekonstruksi audio
-    coeffs_new = (approx, detail_flat)
-    stego_audio = pywt.waverec(coeffs_new, 'haar')
-    sf.write(output_path, stego_audio, sample_rate)
-    print(f"[Embed] Data berhasil disisipkan: {bit_index} bit")
+    if backend is LiftingHaarBackend:
+        return _fit_pcm_range(approx, detail, layout)
+    return _fit_float_range(approx, detail, backend)
+
+# Fungsi untuk rekonstruksi backend float yang tetap berada dalam rentang [-1, 1) PCM 16-bit.
+# Sampel di luar rentang terpotong saat ditulis ke PCM sehingga LSB koefisien detail hilang;
+# seperti _fit_pcm_range, pasangan yang melewati batas digeser lewat koefisien aproksimasi
+# (sampel = (a +- d) / sqrt(2), jadi a - e*sqrt(2) menggeser kedua sampel sebesar e).
+def _fit_float_range(approx, detail, backend):
+    stego = backend.inverse(approx, detail)
+    lo, hi = -1.0, 1.0 - 2.0 ** -15
+    pairs = stego[:2 * len(approx)].reshape(-1, 2)
+    shift = np.maximum(pairs.max(axis=1) - hi, 0) - np.maximum(lo - pairs.min(axis=1), 0)
+    if not shift.any():
+        return stego
+    approx = approx - (shift * np.sqrt(2)).astype(approx.dtype)
+    stego = backend.inverse(approx, detail)
+    # Pembulatan float bisa menyisakan selisih sangat kecil; toleransi setengah langkah PCM 16-bit
+    if stego.min() < lo - 2.0 ** -16 or stego.max() > hi + 2.0 ** -16:
+        raise ValueError("Sampel stego melampaui rentang [-1, 1); kurangi kedalaman embed.")
+    return np.clip(stego, lo, hi)
+
+# Fungsi untuk membaca LSB semua koefisien detail dari array sampel 1-D
+def detail_lsb_bits(samples, backend, scale_factor=None):
+    _, detail = backend.forward(samples)
+    return _lsb_bits(detail, backend, scale_factor)
+
+# Fungsi untuk membaca 8 bit terendah semua koefisien detail (cukup untuk kedalaman berapa pun)
+def detail_low_bits(samples, backend, scale_factor=None):
+    _, detail = backend.forward(samples)
+    return _low_bits(detail, backend, scale_factor)
+
+# audio_path / output_path boleh berupa path atau objek file-like (mis. BytesIO)
+# subtype/audio_format menentukan file keluaran (mis. 'FLAC'); None = sesuai ekstensi / subtype bawaan
+# scale_factor: presisi kuantisasi backend float (None = SCALE_FACTOR); extract harus memakai nilai yang sama
+def embed_data_in_audio(audio_path, data_bytes, output_path='stego_audio.wav', transform='pywt', framed=True, ecc=None,
+                        depth=1, subtype=None, audio_format=None, scale_factor=None):
+    backend = get_transform_backend(transform)
+    data_bits = payload_to_bits(data_bytes, framed, ecc, depth)
+    print(f"[Embed] Data size: {len(data_bytes)} bytes")
+
+    with stage("embed.read"):
+        audio_data, sample_rate, layout = _read_audio(audio_path, backend)
+    audio_format = audio_format or output_format(output_path)
+    subtype = resolve_output_subtype(transform, layout, subtype, audio_format, scale_factor)
+    print(f"[Embed] Total bit: {len(data_bits)}")
+
+    with stage("embed.transform"):
+        stego_audio = _embed_array(audio_data, data_bits, backend, layout, depth, scale_factor)
+    with stage("embed.write"):
+        _write_audio(output_path, stego_audio, sample_rate, layout, subtype, audio_format)
+    print(f"[Embed] Data berhasil disisipkan: {len(data_bits)} bit")
     return output_path
 
-def extract_data_from_audio(audio_path, expected_bit_length=float('inf')):
-    audio_data, sample_rate = sf.read(audio_path)
-    
-    # Konversi ke mono
-    if len(audio_data.shape) > 1:
-        audio_data = audio_data.mean(axis=1)
-    
+def extract_data_from_audio(audio_path, expected_bit_length=float('inf'), transform='pywt', cache=None,
+                            scale_factor=None):
+    backend = get_transform_backend(transform)
+
+    # Cache opsional (lihat extract_cache.ExtractionCache), dikunci oleh hash isi file
+    if cache is not None:
+        # scale_factor hanya ikut kunci jika diset, agar entri lama tetap terpakai
+        params = {} if scale_factor is None else {"scale_factor": scale_factor}
+        cache_key = cache.file_key(audio_path, 'extract', transform=transform, bits=expected_bit_length, **params)
+        extracted_bytes = cache.get(cache_key)
+        if extracted_bytes is not None:
+            print(f"[Extract] Cache hit: {len(extracted_bytes)} bytes")
+            return extracted_bytes
+
+    with stage("extract.read"):
+        audio_data, sample_rate, _ = _read_audio(audio_path, backend)
+
     # DWT
-    coeffs = pywt.wavedec(audio_data, 'haar', level=1)
-    approx, detail = coeffs
-
-    # Ekstraksi bit
-    extracted_bits = []
-    scale_factor = 1000
-
-    for coeff in detail:
-        coeff_val = coeff * scale_factor
-        coeff_int = int(round(coeff_val))
-        extracted_bits.append(str(coeff_int & 1))
-        if len(extracted_bits) >= expected_bit_length:
-            break
-
-    # Konversi ke byte
-    bit_string = ''.join(extracted_bits)
-    byte_chunks = [bit_string[i:i+8] for i in range(0, len(bit_string), 8) if len(bit_string[i:i+8]) == 8]
-    extracted_bytes = bytes([int(chunk, 2) for chunk in byte_chunks])
+    with stage("extract.transform"):
+        approx, detail = backend.forward(_select_samples(audio_data, backend))
+
+    # Ekstraksi bit; jika ada header frame, panjangnya yang dipakai
+    with stage("extract.decode"):
+        extracted_bytes = _read_payload(detail, backend, expected_bit_length, scale_factor)
     print(f"[Extract] Data size: {len(extracted_bytes)} bytes")
-    return extracted_bytes
\ No newline at end of file
+
+    if cache is not None:
+        cache.put(cache_key, extracted_bytes)
+    return extracted_bytes
+
+# Fungsi untuk menyisipkan nilai per koefisien yang sudah tersusun (mis. beberapa frame berurutan,
+# lihat stego_container) ke file audio
+def embed_symbols_in_audio(audio_path, symbols, masks, output_path='stego_audio.wav', transform='pywt'):
+    backend = get_transform_backend(transform)
+    audio_data, sample_rate, layout = _read_audio(audio_path, backend)
+    stego_audio = _embed_symbols_array(audio_data, symbols, masks, backend, layout)
+    subtype = resolve_output_subtype(transform, layout, audio_format=output_format(output_path))
+    _write_audio(output_path, stego_audio, sample_rate, layout, subtype)
+    return output_path
+
+# Fungsi untuk membaca 8 bit terendah koefisien detail [start, start + count);
+# hanya sampel 2*start .. 2*(start + count) yang dibaca dari file
+def read_detail_low_bits(audio_path, start, count, transform='pywt'):
+    backend = get_transform_backend(transform)
+    audio_data, _, _ = _read_audio(audio_path, backend, frames=2 * count, start=2 * start)
+    _, detail = backend.forward(_select_samples(audio_data, backend))
+    return _low_bits(detail[:count], backend)
+
+# Fungsi untuk membaca koefisien detail terkuantisasi (bilangan bulat yang LSB-nya dipakai), mis. untuk steganalisis
+def quantized_detail(audio_path, transform='pywt', frames=-1):
+    backend = get_transform_backend(transform)
+    audio_data, _, _ = _read_audio(audio_path, backend, frames)
+    _, detail = backend.forward(_select_samples(audio_data, backend))
+    return _quantize_detail(detail, backend)
+
+# Fungsi untuk mendekode frame dari nilai bit rendah koefisien yang diawali header frame
+def decode_frame_values(low_values):
+    header = parse_frame_header(np.packbits(low_values[:FRAME_HEADER_BITS] & 1).tobytes())
+    if header is None:
+        raise ValueError("Header frame tidak ditemukan.")
+    frame_end = frame_coeff_length(header)
+    if frame_end > len(low_values):
+        raise ValueError(f"Frame terpotong: butuh {frame_end} koefisien, tersedia {len(low_values)}")
+    return decode_frame_symbols(header, low_values[FRAME_HEADER_BITS:frame_end])
+
+# Fungsi untuk menyisipkan data ke array audio di memori (frames atau frames x kanal).
+# Backend float mengembalikan array mono float (input integer dinormalisasi ke [-1, 1]
+# seperti sf.read); lifting membutuhkan array int16/int32
+# (diperlakukan sebagai PCM_16/PCM_32) dan mengembalikan salinan dengan bentuk yang sama.
+def embed_data_in_array(audio_data, data_bytes, transform='pywt', framed=True, ecc=None, depth=1, scale_factor=None):
+    backend = get_transform_backend(transform)
+    data_bits = payload_to_bits(data_bytes, framed, ecc, depth)
+    if backend is LiftingHaarBackend:
+        return _embed_array(np.array(audio_data), data_bits, backend, _array_pcm_layout(audio_data), depth)
+    return _embed_array(_float_samples(audio_data, backend.dtype), data_bits, backend, None, depth, scale_factor)
+
+def extract_data_from_array(audio_data, expected_bit_length=float('inf'), transform='pywt', scale_factor=None):
+    backend = get_transform_backend(transform)
+    if backend is LiftingHaarBackend:
+        _array_pcm_layout(audio_data)
+    else:
+        audio_data = _float_samples(audio_data, backend.dtype)
+    _, detail = backend.forward(_select_samples(audio_data, backend))
+    return _read_payload(detail, backend, expected_bit_length, scale_factor)
+
+# Fungsi untuk menyisipkan data ke file audio yang ada di memori (bytes), hasil juga bytes
+def embed_data_in_bytes(audio_bytes, data_bytes, transform='pywt', framed=True, ecc=None, depth=1, subtype=None,
+                        audio_format='WAV', scale_factor=None):
+    output = io.BytesIO()
+    embed_data_in_audio(io.BytesIO(audio_bytes), data_bytes, output, transform, framed, ecc, depth, subtype,
+                        audio_format, scale_factor)
+    return output.getvalue()
+
+def extract_data_from_bytes(audio_bytes, expected_bit_length=float('inf'), transform='pywt', scale_factor=None):
+    return extract_data_from_audio(io.BytesIO(audio_bytes), expected_bit_length, transform,
+                                   scale_factor=scale_factor)
+
+# Fungsi untuk menentukan format file keluaran dari ekstensi (objek file-like: WAV)
+def output_format(output):
+    if isinstance(output, (str, os.PathLike)):
+        extension = os.path.splitext(os.fspath(output))[1][1:].upper()
+        if extension in sf.available_formats():
+            return extension
+    return 'WAV'
+
+# Fungsi untuk memilih subtype keluaran yang tidak merusak LSB payload (subtype None = bawaan format).
+# Lifting harus memakai subtype PCM cover (kisi integer yang sama). Backend float menulis ulang sampel
+# terkuantisasi: error koefisien detail (< 2 langkah PCM) harus jauh di bawah 1/(2*scale_factor).
+def resolve_output_subtype(transform, layout=None, subtype=None, audio_format='WAV', scale_factor=None):
+    backend = get_transform_backend(transform)
+    if backend is LiftingHaarBackend:
+        required = (layout or DEFAULT_PCM_LAYOUT)[2]
+        if subtype is not None and subtype != required:
+            raise ValueError(f"Transform lifting membutuhkan subtype keluaran {required} (sama dengan cover).")
+        subtype = required
+    else:
+        subtype = subtype or sf.default_subtype(audio_format)
+        if subtype in PCM_LAYOUTS:
+            bits = PCM_LAYOUTS[subtype][3]
+            scale_factor = _scale_factor(scale_factor)
+            if 4 * scale_factor > 2 ** (bits - 1):
+                raise ValueError(f"Subtype {subtype} terlalu kasar untuk scale factor {scale_factor}; "
+                                 f"LSB payload akan hilang.")
+        elif subtype not in ('FLOAT', 'DOUBLE'):
+            raise ValueError(f"Subtype {subtype} lossy atau tidak didukung untuk stego.")
+
+    if not sf.check_format(audio_format, subtype):
+        raise ValueError(f"Format {audio_format} tidak mendukung subtype {subtype}.")
+    return subtype
+
+# Fungsi untuk memeriksa header frame dari beberapa ratus sampel pertama saja
+def probe_frame(audio_path, transform='pywt', verify=False):
+    backend = get_transform_backend(transform)
+    audio_data, _, _ = _read_audio(audio_path, backend, frames=2 * FRAME_HEADER_BITS)
+    _, detail = backend.forward(_select_samples(audio_data, backend))
+    header = parse_frame_header(_lsb_bytes(detail[:FRAME_HEADER_BITS], backend))
+    if header is None or not verify:
+        return header
+
+    # Verifikasi CRC hanya membaca sampel yang memuat frame
+    audio_data, _, _ = _read_audio(audio_path, backend, frames=2 * frame_coeff_length(header))
+    _, detail = backend.forward(_select_samples(audio_data, backend))
+    try:
+        _read_payload(detail, backend)
+        header["crc_ok"] = True
+    except ValueError:
+        header["crc_ok"] = False
+    return header
+
+# Fungsi untuk membaca audio sesuai kebutuhan backend
+def _read_audio(source, backend, frames=-1, start=0):
+    # Objek file-like bisa dibaca berulang (mis. probe lalu verifikasi)
+    if hasattr(source, 'seek'):
+        source.seek(0)
+    if backend is LiftingHaarBackend:
+        return _read_pcm(source, frames, start)
+    audio_data, sample_rate = sf.read(source, frames=frames, start=start, dtype=backend.dtype)
+    return audio_data, sample_rate, None
+
+def _write_audio(output, audio_data, sample_rate, layout, subtype=None, audio_format=None):
+    # Objek file-like tidak punya ekstensi, gunakan WAV
+    if audio_format is None and not isinstance(output, (str, os.PathLike)):
+        audio_format = 'WAV'
+    if isinstance(output, (str, os.PathLike)):
+        # File path ditulis atomik: tidak ada file stego setengah jadi jika proses berhenti
+        with atomic_output(output) as temp_path:
+            _write_audio_to(temp_path, audio_data, sample_rate, layout, subtype, audio_format)
+    else:
+        _write_audio_to(output, audio_data, sample_rate, layout, subtype, audio_format)
+
+def _write_audio_to(output, audio_data, sample_rate, layout, subtype, audio_format):
+    if layout is None:
+        sf.write(output, audio_data, sample_rate, subtype=subtype, format=audio_format)
+    else:
+        _write_pcm(output, audio_data, sample_rate, layout, audio_format)
+
+# Fungsi untuk memilih sampel yang ditransformasi dari array audio
+def _select_samples(audio_data, backend):
+    if backend is LiftingHaarBackend:
+        # Data disisipkan di kanal pertama (pasangan sampel utuh), kanal lain tidak diubah
+        channel = audio_data[:, 0] if audio_data.ndim > 1 else audio_data
+        return channel[:len(channel) - len(channel) % 2]
+
+    # Konversi ke mono
+    if audio_data.ndim > 1:
+        audio_data = audio_data.mean(axis=1, dtype=audio_data.dtype)
+    return audio_data
+
+# Fungsi untuk menyisipkan bitstream ke array audio (lifting: diubah di tempat)
+def _embed_array(audio_data, data_bits, backend, layout, depth=1, scale_factor=None):
+    return _embed_symbols_array(audio_data, *bits_to_symbols(data_bits, depth), backend, layout, scale_factor)
+
+def _embed_symbols_array(audio_data, symbols, masks, backend, layout, scale_factor=None):
+    samples = _select_samples(audio_data, backend)
+    if backend is LiftingHaarBackend:
+        samples[:] = embed_symbols_in_samples(samples, symbols, masks, backend, layout)
+        return audio_data
+    return embed_symbols_in_samples(samples, symbols, masks, backend, scale_factor=scale_factor)
+
+def _float_samples(audio_data, dtype):
+    audio_data = np.asarray(audio_data)
+    if np.issubdtype(audio_data.dtype, np.integer):
+        return (audio_data / -np.iinfo(audio_data.dtype).min).astype(dtype)
+    return audio_data.astype(dtype, copy=False)
+
+def _array_pcm_layout(audio_data):
+    dtype = np.asarray(audio_data).dtype
+    if dtype == np.int16:
+        return PCM_LAYOUTS['PCM_16']
+    if dtype == np.int32:
+        return PCM_LAYOUTS['PCM_32']
+    raise ValueError(f"Transform lifting membutuhkan array int16/int32, bukan {dtype}.")
+
+# Fungsi untuk memilih scale factor kuantisasi (None = SCALE_FACTOR modul)
+def _scale_factor(scale_factor):
+    return SCALE_FACTOR if scale_factor is None else scale_factor
+
+# Fungsi untuk mengubah koefisien detail menjadi bilangan bulat yang LSB-nya dipakai
+def _quantize_detail(detail, backend, scale_factor=None):
+    if backend is LiftingHaarBackend:
+        return detail
+    return np.round(detail * _scale_factor(scale_factor)).astype(np.int64)
+
+def _dequantize_detail(coeff_int, backend, scale_factor=None):
+    if backend is LiftingHaarBackend:
+        return coeff_int
+    return coeff_int / _scale_factor(scale_factor)
+
+def _lsb_bits(detail, backend, scale_factor=None):
+    return (_quantize_detail(detail, backend, scale_factor) & 1).astype(np.uint8)
+
+def _low_bits(detail, backend, scale_factor=None):
+    return (_quantize_detail(detail, backend, scale_factor) & 0xFF).astype(np.uint8)
+
+def _lsb_bytes(detail, backend, scale_factor=None):
+    bit_count = len(detail) - len(detail) % 8
+    return np.packbits(_lsb_bits(detail[:bit_count], backend, scale_factor)).tobytes()
+
+# Fungsi untuk membaca payload dari LSB koefisien detail (frame atau format lama)
+def _read_payload(detail, backend, expected_bit_length=float('inf'), scale_factor=None):
+    header = parse_frame_header(_lsb_bytes(detail[:FRAME_HEADER_BITS], backend, scale_factor))
+    if header is None:
+        # Format lama tanpa header: ambil sebanyak expected_bit_length
+        if expected_bit_length < len(detail):
+            detail = detail[:int(expected_bit_length)]
+        return _lsb_bytes(detail, backend, scale_factor)
+
+    frame_end = frame_coeff_length(header)
+    if frame_end > len(detail):
+        raise ValueError(f"Frame terpotong: butuh {frame_end} koefisien, tersedia {len(detail)}")
+    return decode_frame_symbols(header, _low_bits(detail[FRAME_HEADER_BITS:frame_end], backend, scale_factor))
+
+# Fungsi untuk mendekode payload dari nilai bit rendah koefisien setelah header
+def decode_frame_symbols(header, low_values):
+    depth = _frame_depth(header["flags"])
+    n_bits = frame_bit_length(header) - FRAME_HEADER_BITS
+    if depth == 1:
+        return decode_frame_payload(header, (low_values & 1).astype(np.uint8))
+    # Ambil `depth` bit terendah tiap koefisien, MSB dulu
+    bits = np.unpackbits(low_values[:, None], axis=1)[:, 8 - depth:]
+    return decode_frame_payload(header, bits.ravel()[:n_bits])
+
+# Fungsi untuk mendekode bit payload sebuah frame (ECC + cek CRC)
+def decode_frame_payload(header, payload_bits):
+    code = _frame_ecc_code(header)
+    if code is not None:
+        payload_bits = code.decode(payload_bits, header["length"] * 8)
+    payload = np.packbits(payload_bits).tobytes()
+    if zlib.crc32(payload) != header["crc32"]:
+        raise ValueError("CRC payload tidak cocok, data rusak.")
+    return payload
+
+# Fungsi untuk transformasi Haar integer-ke-integer (lifting / S-transform)
+def haar_lifting_forward(samples):
+    # Perhitungan di dtype yang lebih lebar agar selisih sampel tidak overflow
+    work_dtype = np.int32 if samples.dtype.itemsize <= 2 else np.int64
+    even = samples[0::2].astype(work_dtype)
+    odd = samples[1::2].astype(work_dtype)
+    detail = odd - even
+    approx = even + (detail >> 1)
+    return approx, detail
+
+# Fungsi untuk rekonstruksi eksak dari koefisien lifting Haar
+def haar_lifting_inverse(approx, detail):
+    even = approx - (detail >> 1)
+    odd = detail + even
+    samples = np.empty(len(even) * 2, dtype=even.dtype)
+    samples[0::2] = even
+    samples[1::2] = odd
+    return samples
+
+# Fungsi untuk membaca sampel PCM asli (tanpa konversi ke float)
+def _read_pcm(source, frames=-1, start=0):
+    with sf.SoundFile(source) as f:
+        if start:
+            f.seek(start)
+        is_pcm = f.subtype in PCM_LAYOUTS
+        layout = PCM_LAYOUTS.get(f.subtype, DEFAULT_PCM_LAYOUT)
+        dtype, shift, _, _ = layout
+        # libsndfile tidak menskalakan float -> integer, jadi cover non-PCM dibaca sebagai float
+        audio_data = f.read(frames, dtype=dtype if is_pcm else 'float64', always_2d=True)
+        sample_rate = f.samplerate
+    if not is_pcm:
+        return float_to_pcm(audio_data, layout), sample_rate, layout
+    if shift:
+        audio_data >>= shift
+    return audio_data, sample_rate, layout
+
+# Fungsi untuk mengkuantisasi sampel float [-1, 1] ke integer sesuai layout PCM
+def float_to_pcm(audio_data, layout):
+    dtype, _, _, bits = layout
+    full_scale = 2 ** (bits - 1)
+    return np.clip(np.round(audio_data * full_scale), -full_scale, full_scale - 1).astype(dtype)
+
+# Fungsi untuk menulis sampel PCM dengan subtype yang sama seperti saat dibaca
+def _write_pcm(output_path, audio_data, sample_rate, layout, audio_format=None):
+    _, shift, subtype, _ = layout
+    if shift:
+        audio_data = audio_data << shift
+    sf.write(output_path, audio_data, sample_rate, subtype=subtype, format=audio_format)
+
+# Fungsi untuk rekonstruksi lifting yang tetap berada dalam rentang PCM
+def _fit_pcm_range(approx, detail, layout):
+    dtype, _, _, bits = layout
+    stego = haar_lifting_inverse(approx, detail)
+
+    # Penggantian LSB menggeser sampel pasangan; pada sampel yang melewati batas rentang,
+    # geser koefisien aproksimasi (menggeser kedua sampel pasangan dengan jumlah yang sama)
+    lo, hi = -(1 << (bits - 1)), (1 << (bits - 1)) - 1
+    pairs = stego.reshape(-1, 2)
+    approx -= np.maximum(pairs.max(axis=1) - hi, 0).astype(approx.dtype)
+    approx += np.maximum(lo - pairs.min(axis=1), 0).astype(approx.dtype)
+    stego = haar_lifting_inverse(approx, detail)
+    if len(stego) and (stego.min() < lo or stego.max() > hi):
+        raise ValueError("Sampel stego melampaui rentang PCM.")
+    return stego.astype(dtype)
@@ -0,0 +1,140 @@
+import argparse
+import struct
+import numpy as np
+from stegano_utils import (
+    FRAME_HEADER_BITS, payload_to_bits, bits_to_symbols, parse_frame_header, frame_coeff_length,
+    embed_symbols_in_audio, read_detail_low_bits, decode_frame_values,
+)
+from stego_shard import cover_capacity_bits
+
+# Kontainer multi-pesan: frame direktori di koefisien 0, lalu frame tiap pesan berurutan.
+# Direktori: magic, jumlah entri; tiap entri = panjang ID, ID (UTF-8), offset dan panjang
+# frame pesan dalam koefisien detail. Setiap pesan adalah frame biasa (header + CRC),
+# jadi satu pesan bisa didekode hanya dari rentang koefisiennya sendiri.
+DIRECTORY_MAGIC = b'SDX'
+DIRECTORY_HEADER = struct.Struct('>3sH')
+ENTRY_RANGE = struct.Struct('>II')
+
+# Fungsi untuk menyusun bytes direktori dari daftar entri (id, offset, coeffs)
+def pack_directory(entries):
+    parts = [DIRECTORY_HEADER.pack(DIRECTORY_MAGIC, len(entries))]
+    for entry in entries:
+        message_id = entry["id"].encode("utf-8")
+        parts.append(bytes([len(message_id)]) + message_id + ENTRY_RANGE.pack(entry["offset"], entry["coeffs"]))
+    return b''.join(parts)
+
+# Fungsi untuk membaca entri direktori dari bytes payload frame direktori
+def unpack_directory(data):
+    if len(data) < DIRECTORY_HEADER.size:
+        raise ValueError("Data bukan direktori kontainer (terlalu pendek).")
+    magic, count = DIRECTORY_HEADER.unpack_from(data)
+    if magic != DIRECTORY_MAGIC:
+        raise ValueError("Data bukan direktori kontainer (magic tidak cocok).")
+    entries = []
+    position = DIRECTORY_HEADER.size
+    for _ in range(count):
+        id_length = data[position]
+        message_id = data[position + 1:position + 1 + id_length].decode("utf-8")
+        position += 1 + id_length
+        offset, coeffs = ENTRY_RANGE.unpack_from(data, position)
+        position += ENTRY_RANGE.size
+        entries.append({"id": message_id, "offset": offset, "coeffs": coeffs})
+    return entries
+
+# Fungsi untuk menyusun nilai per koefisien seluruh kontainer.
+# messages: daftar (id, bytes). Direktori selalu kedalaman 1 agar mudah dibaca.
+def build_container(messages, ecc=None, depth=1):
+    ids = [message_id for message_id, _ in messages]
+    if len(set(ids)) != len(ids):
+        raise ValueError("ID pesan harus unik.")
+    for message_id in ids:
+        if not 0 < len(message_id.encode("utf-8")) <= 255:
+            raise ValueError(f"Panjang ID pesan harus 1-255 byte: {message_id!r}")
+
+    frames = [bits_to_symbols(payload_to_bits(data, ecc=ecc, depth=depth), depth) for _, data in messages]
+    # Ukuran direktori tidak bergantung pada nilai offset (lebar tetap), jadi offset bisa dihitung dulu
+    directory_size = len(pack_directory([{"id": message_id, "offset": 0, "coeffs": 0} for message_id in ids]))
+    offset = len(payload_to_bits(bytes(directory_size), ecc=ecc))
+    entries = []
+    for message_id, (symbols, _) in zip(ids, frames):
+        entries.append({"id": message_id, "offset": offset, "coeffs": len(symbols)})
+        offset += len(symbols)
+
+    directory = bits_to_symbols(payload_to_bits(pack_directory(entries), ecc=ecc))
+    symbols = np.concatenate([directory[0]] + [frame[0] for frame in frames])
+    masks = np.concatenate([directory[1]] + [frame[1] for frame in frames])
+    return symbols, masks, entries
+
+# Fungsi untuk menyisipkan beberapa pesan ke satu cover sebagai kontainer
+def embed_container(audio_path, messages, output_path='stego_audio.wav', transform='pywt', ecc=None, depth=1):
+    symbols, masks, entries = build_container(messages, ecc, depth)
+    capacity = cover_capacity_bits(audio_path, transform)
+    if len(symbols) > capacity:
+        raise ValueError(f"Kontainer butuh {len(symbols)} koefisien, cover hanya {capacity}.")
+    embed_symbols_in_audio(audio_path, symbols, masks, output_path, transform)
+    print(f"[Container] {len(entries)} pesan disisipkan ({len(symbols)}/{capacity} koefisien)")
+    return entries
+
+# Fungsi untuk membaca direktori kontainer (hanya sampel yang memuat frame direktori)
+def read_directory(audio_path, transform='pywt'):
+    header_values = read_detail_low_bits(audio_path, 0, FRAME_HEADER_BITS, transform)
+    header = parse_frame_header(np.packbits(header_values & 1).tobytes())
+    if header is None:
+        raise ValueError("Header frame direktori tidak ditemukan.")
+    values = read_detail_low_bits(audio_path, 0, frame_coeff_length(header), transform)
+    return unpack_directory(decode_frame_values(values))
+
+# Fungsi untuk mengekstrak satu pesan: langsung membaca rentang koefisiennya saja
+def extract_message(audio_path, message_id, transform='pywt', directory=None):
+    if directory is None:
+        directory = read_directory(audio_path, transform)
+    for entry in directory:
+        if entry["id"] == message_id:
+            values = read_detail_low_bits(audio_path, entry["offset"], entry["coeffs"], transform)
+            return decode_frame_values(values)
+    raise KeyError(f"Pesan tidak ada di kontainer: {message_id}")
+
+def _parse_message_arg(value):
+    message_id, separator, path = value.partition("=")
+    if not separator:
+        raise argparse.ArgumentTypeError("Format pesan harus ID=FILE")
+    return message_id, path
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kontainer beberapa pesan dalam satu cover dengan direktori.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    embed_parser = subparsers.add_parser("embed", help="Sisipkan beberapa pesan ke satu cover")
+    embed_parser.add_argument("cover", type=str, help="File audio cover")
+    embed_parser.add_argument("messages", type=_parse_message_arg, nargs="+", help="Pesan dalam format ID=FILE")
+    embed_parser.add_argument("--output", type=str, default="stego_audio.wav", help="File audio stego")
+    embed_parser.add_argument("--ecc", type=str, default=None, help="Kode ECC (rep3, rep5, hamming74)")
+    embed_parser.add_argument("--depth", type=int, default=1, help="Jumlah LSB per koefisien (1-8, default: 1)")
+
+    list_parser = subparsers.add_parser("list", help="Tampilkan direktori kontainer")
+    list_parser.add_argument("stego", type=str, help="File audio stego")
+
+    extract_parser = subparsers.add_parser("extract", help="Ekstrak satu pesan berdasarkan ID")
+    extract_parser.add_argument("stego", type=str, help="File audio stego")
+    extract_parser.add_argument("id", type=str, help="ID pesan")
+    extract_parser.add_argument("--output", type=str, required=True, help="File payload hasil")
+
+    for sub in (embed_parser, list_parser, extract_parser):
+        sub.add_argument("--transform", type=str, default="pywt", help="Transform (pywt, numpy, lifting)")
+    args = parser.parse_args()
+
+    if args.command == "embed":
+        messages = []
+        for message_id, path in args.messages:
+            with open(path, "rb") as f:
+                messages.append((message_id, f.read()))
+        embed_container(args.cover, messages, args.output, args.transform, args.ecc, args.depth)
+        print(f"[+] {args.output}")
+    elif args.command == "list":
+        for entry in read_directory(args.stego, args.transform):
+            print(f"{entry['id']}\toffset={entry['offset']}\tcoeffs={entry['coeffs']}")
+    else:
+        data = extract_message(args.stego, args.id, args.transform)
+        with open(args.output, "wb") as f:
+            f.write(data)
+        print(f"[+] Payload disimpan: {args.output} ({len(data)} bytes)")
@@ -0,0 +1,205 @@
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import numpy as np
+import soundfile as sf
+from stegano_utils import (
+    LiftingHaarBackend, PCM_LAYOUTS, DEFAULT_PCM_LAYOUT, FRAME_HEADER_BITS, float_to_pcm, get_transform_backend,
+    payload_to_bits, bits_to_symbols, embed_symbols_in_samples, detail_low_bits, probe_frame,
+    frame_coeff_length, decode_frame_symbols, output_format, resolve_output_subtype,
+)
+from stego_shard import cover_capacity_bits
+from io_utils import atomic_output
+
+# Embed/extract satu file besar dengan beberapa proses. Sampel didekode langsung ke
+# multiprocessing.shared_memory oleh worker (tiap worker membaca partisinya sendiri), lalu tiap
+# worker menghitung partisi koefisiennya. Haar level 1 membuat partisi pada batas genap independen,
+# sehingga hasilnya identik dengan embed_data_in_audio/extract_data_from_audio.
+
+# Partisi terkecil (frame) agar overhead proses tidak mendominasi
+MIN_PARTITION_FRAMES = 1 << 16
+
+# Class array NumPy di atas shared memory; dibuat oleh proses induk, dibuka ulang oleh worker lewat nama
+class SharedArray:
+    def __init__(self, shape, dtype, name=None):
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        size = max(int(np.prod(self.shape)) * self.dtype.itemsize, 1)
+        self.owner = name is None
+        self.shm = shared_memory.SharedMemory(name=name, create=self.owner, size=size if self.owner else 0)
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=self.shm.buf)
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        # Array harus dilepas sebelum buffer ditutup
+        del self.array
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# Fungsi untuk membagi [0, total) menjadi rentang dengan batas genap
+def plan_partitions(total, workers, min_size=None):
+    min_size = MIN_PARTITION_FRAMES if min_size is None else min_size
+    count = max(1, min(workers, total // max(min_size, 1)))
+    bounds = [(total * i // count) & ~1 for i in range(count)] + [total]
+    return [(start, stop) for start, stop in zip(bounds, bounds[1:]) if stop > start]
+
+# Fungsi untuk menentukan format baca seperti embed_data_in_audio: (layout, quantize)
+def _read_format(info, backend):
+    if backend is LiftingHaarBackend:
+        layout = PCM_LAYOUTS.get(info.subtype, DEFAULT_PCM_LAYOUT)
+        return layout, None if info.subtype in PCM_LAYOUTS else layout
+    return None, None
+
+# Fungsi untuk membaca satu partisi (lifting: semua kanal PCM integer, float: mono)
+def _read_partition(audio_path, backend, layout, quantize, start, frames):
+    with sf.SoundFile(audio_path) as f:
+        f.seek(start)
+        if backend is LiftingHaarBackend:
+            if quantize:
+                return float_to_pcm(f.read(frames, dtype='float64', always_2d=True), quantize)
+            dtype, shift, _, _ = layout
+            block = f.read(frames, dtype=dtype, always_2d=True)
+            if shift:
+                block >>= shift
+            return block
+        block = f.read(frames, dtype=backend.dtype, always_2d=True)
+    return block[:, 0] if block.shape[1] == 1 else block.mean(axis=1, dtype=block.dtype)
+
+def _embed_partition(name, shape, dtype, audio_path, transform, start, stop, symbols, masks):
+    backend = get_transform_backend(transform)
+    layout, quantize = _read_format(sf.info(audio_path), backend)
+    shared = SharedArray(shape, dtype, name)
+    try:
+        block = _read_partition(audio_path, backend, layout, quantize, start, stop - start)
+        if backend is LiftingHaarBackend:
+            shared.array[start:stop] = block
+            channel = shared.array[start:stop, 0]
+            samples = channel[:len(channel) - len(channel) % 2]
+            if len(symbols):
+                samples[:] = embed_symbols_in_samples(samples, symbols, masks, backend, layout)
+        else:
+            # Backend float selalu melewati transform balik (sama seperti embed satu proses);
+            # partisi terakhir berpanjang ganjil menghasilkan satu sampel padding tambahan
+            stego = embed_symbols_in_samples(block, symbols, masks, backend)
+            shared.array[start:start + len(stego)] = stego
+    finally:
+        shared.close()
+
+def _extract_partition(name, shape, audio_path, transform, coeff_start, coeff_stop):
+    backend = get_transform_backend(transform)
+    layout, quantize = _read_format(sf.info(audio_path), backend)
+    shared = SharedArray(shape, np.uint8, name)
+    try:
+        block = _read_partition(audio_path, backend, layout, quantize, 2 * coeff_start,
+                                2 * (coeff_stop - coeff_start))
+        samples = block[:, 0] if block.ndim > 1 else block
+        shared.array[coeff_start:coeff_stop] = detail_low_bits(samples, backend)[:coeff_stop - coeff_start]
+    finally:
+        shared.close()
+
+# Fungsi untuk menyisipkan data ke satu file dengan beberapa proses worker
+def embed_data_in_audio_parallel(audio_path, data_bytes, output_path='stego_audio.wav', transform='pywt',
+                                 framed=True, ecc=None, depth=1, workers=None, subtype=None):
+    backend = get_transform_backend(transform)
+    data_bits = payload_to_bits(data_bytes, framed, ecc, depth)
+    symbols, masks = bits_to_symbols(data_bits, depth)
+    info = sf.info(audio_path)
+    layout, _ = _read_format(info, backend)
+    subtype = resolve_output_subtype(transform, layout, subtype, output_format(output_path))
+    workers = workers or os.cpu_count()
+
+    if backend is LiftingHaarBackend:
+        capacity = info.frames // 2
+        shape, dtype = (info.frames, info.channels), layout[0]
+    else:
+        capacity = (info.frames + 1) // 2
+        shape, dtype = (info.frames + info.frames % 2,), backend.dtype
+    if capacity < len(symbols):
+        raise ValueError("Audio tidak cukup besar untuk menyimpan data.")
+    print(f"[Embed] Data size: {len(data_bytes)} bytes, total bit: {len(data_bits)}")
+
+    partitions = plan_partitions(info.frames, workers)
+    with SharedArray(shape, dtype) as shared:
+        with ProcessPoolExecutor(max_workers=min(workers, len(partitions))) as pool:
+            futures = [
+                pool.submit(_embed_partition, shared.name, shape, dtype, audio_path, transform, start, stop,
+                            symbols[start // 2:(stop + 1) // 2], masks[start // 2:(stop + 1) // 2])
+                for start, stop in partitions
+            ]
+            for future in futures:
+                future.result()
+
+        shift = layout[1] if layout else 0
+        with atomic_output(output_path) as temp_path:
+            sf.write(temp_path, shared.array << shift if shift else shared.array, info.samplerate, subtype=subtype)
+    print(f"[Embed] Data berhasil disisipkan dengan {len(partitions)} partisi")
+    return output_path
+
+# Fungsi untuk mengekstrak data dengan beberapa proses; hanya rentang frame yang dibaca
+def extract_data_from_audio_parallel(audio_path, transform='pywt', workers=None):
+    header = probe_frame(audio_path, transform)
+    if header is None:
+        raise ValueError("Header frame tidak ditemukan.")
+    frame_end = frame_coeff_length(header)
+    if frame_end > cover_capacity_bits(audio_path, transform):
+        raise ValueError(f"Frame terpotong: butuh {frame_end} koefisien.")
+    workers = workers or os.cpu_count()
+
+    partitions = plan_partitions(frame_end, workers, MIN_PARTITION_FRAMES // 2)
+    with SharedArray((frame_end,), np.uint8) as shared:
+        with ProcessPoolExecutor(max_workers=min(workers, len(partitions))) as pool:
+            futures = [
+                pool.submit(_extract_partition, shared.name, (frame_end,), audio_path, transform, start, stop)
+                for start, stop in partitions
+            ]
+            for future in futures:
+                future.result()
+        payload = decode_frame_symbols(header, shared.array[FRAME_HEADER_BITS:].copy())
+    print(f"[Extract] Data size: {len(payload)} bytes")
+    return payload
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Embed/extract satu file besar dengan beberapa proses (shared memory).")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    embed_parser = subparsers.add_parser("embed", help="Sisipkan payload")
+    embed_parser.add_argument("cover", type=str, help="File audio cover")
+    embed_parser.add_argument("payload", type=str, help="File payload")
+    embed_parser.add_argument("--output", type=str, default="stego_audio.wav", help="File audio stego")
+    embed_parser.add_argument("--ecc", type=str, default=None, help="Kode ECC (rep3, rep5, hamming74)")
+    embed_parser.add_argument("--depth", type=int, default=1, help="Jumlah LSB per koefisien (1-8, default: 1)")
+
+    extract_parser = subparsers.add_parser("extract", help="Ekstrak payload")
+    extract_parser.add_argument("stego", type=str, help="File audio stego")
+    extract_parser.add_argument("--output", type=str, required=True, help="File payload hasil")
+
+    for sub in (embed_parser, extract_parser):
+        sub.add_argument("--transform", type=str, default="pywt", help="Transform (pywt, numpy, lifting)")
+        sub.add_argument("--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    embed_parser.add_argument("--subtype", type=str, default=None,
+                              help="Subtype keluaran, mis. PCM_16, PCM_24, FLOAT (default: sesuai format/cover)")
+    args = parser.parse_args()
+
+    start_time = time.perf_counter()
+    if args.command == "embed":
+        with open(args.payload, "rb") as f:
+            data = f.read()
+        embed_data_in_audio_parallel(args.cover, data, args.output, args.transform, ecc=args.ecc, depth=args.depth,
+                                     workers=args.workers, subtype=args.subtype)
+    else:
+        data = extract_data_from_audio_parallel(args.stego, args.transform, args.workers)
+        with open(args.output, "wb") as f:
+            f.write(data)
+    print(f"[+] Selesai dalam {time.perf_counter() - start_time:.2f} s")
@@ -0,0 +1,184 @@
+import queue
+import threading
+import numpy as np
+import soundfile as sf
+from stegano_utils import (
+    LiftingHaarBackend, PCM_LAYOUTS, DEFAULT_PCM_LAYOUT, FRAME_HEADER_BITS, float_to_pcm,
+    get_transform_backend, payload_to_bits, bits_to_symbols, embed_symbols_in_samples, detail_low_bits,
+    parse_frame_header, frame_coeff_length, decode_frame_symbols, output_format, resolve_output_subtype,
+)
+from io_utils import atomic_output
+
+# Ukuran blok default (genap, agar pasangan Haar level 1 tidak terpotong antar blok)
+DEFAULT_BLOCK_FRAMES = 1 << 16
+
+_END = object()
+
+# Fungsi untuk memasukkan item ke antrian tanpa macet jika tahap lain sudah berhenti
+def _put(q, item, stop):
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            pass
+    return False
+
+# Thread pembaca: membaca blok dari file dan mengirim ke tahap komputasi.
+# Jika `quantize` berisi layout PCM, blok float dikuantisasi (cover non-PCM untuk lifting).
+def _reader(sound_file, block_frames, dtype, shift, out_queue, stop, errors, quantize=None):
+    try:
+        while not stop.is_set():
+            block = sound_file.read(block_frames, dtype='float64' if quantize else dtype, always_2d=True)
+            if len(block) == 0:
+                break
+            if quantize:
+                block = float_to_pcm(block, quantize)
+            elif shift:
+                block >>= shift
+            if not _put(out_queue, block, stop):
+                return
+    except BaseException as e:
+        errors.append(e)
+    finally:
+        _put(out_queue, _END, stop)
+
+# Thread penulis: menulis blok stego segera setelah selesai dihitung
+def _writer(sound_file, shift, in_queue, stop, errors):
+    failed = False
+    while (block := in_queue.get()) is not _END:
+        # Setelah gagal, antrian tetap dikuras agar tahap komputasi tidak macet
+        if failed:
+            continue
+        try:
+            sound_file.write(block << shift if shift else block)
+        except BaseException as e:
+            errors.append(e)
+            stop.set()
+            failed = True
+
+# Fungsi untuk menentukan dtype baca dan jumlah kanal tulis sesuai backend
+def _stream_format(audio_path, backend):
+    info = sf.info(audio_path)
+    if backend is LiftingHaarBackend:
+        layout = PCM_LAYOUTS.get(info.subtype, DEFAULT_PCM_LAYOUT)
+        dtype, shift, _, _ = layout
+        quantize = None if info.subtype in PCM_LAYOUTS else layout
+        return info, layout, dtype, shift, info.channels, quantize
+    return info, None, backend.dtype, 0, 1, None
+
+# Fungsi untuk menyisipkan data dengan pipeline baca -> hitung -> tulis (antrian berbatas)
+def embed_data_in_audio_pipelined(audio_path, data_bytes, output_path='stego_audio.wav', transform='pywt',
+                                  framed=True, ecc=None, block_frames=DEFAULT_BLOCK_FRAMES, queue_size=4, depth=1,
+                                  subtype=None):
+    if block_frames % 2:
+        raise ValueError("block_frames harus genap.")
+    backend = get_transform_backend(transform)
+    data_bits = payload_to_bits(data_bytes, framed, ecc, depth)
+    # Nilai per koefisien, sehingga pembagian antar blok tidak bergantung pada kedalaman
+    symbols, masks = bits_to_symbols(data_bits, depth)
+    info, layout, dtype, shift, out_channels, quantize = _stream_format(audio_path, backend)
+    subtype = resolve_output_subtype(transform, layout, subtype, output_format(output_path))
+
+    capacity = info.frames // 2 if layout else (info.frames + 1) // 2
+    if capacity < len(symbols):
+        raise ValueError("Audio tidak cukup besar untuk menyimpan data.")
+    print(f"[Embed] Data size: {len(data_bytes)} bytes, total bit: {len(data_bits)}")
+
+    read_queue = queue.Queue(maxsize=queue_size)
+    write_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors = []
+
+    # File keluaran baru muncul di output_path setelah semua blok tertulis (atomik)
+    with atomic_output(output_path) as temp_path, sf.SoundFile(audio_path) as source, \
+            sf.SoundFile(temp_path, 'w', info.samplerate, out_channels, subtype=subtype) as target:
+        reader = threading.Thread(target=_reader,
+                                  args=(source, block_frames, dtype, shift, read_queue, stop, errors, quantize))
+        writer = threading.Thread(target=_writer, args=(target, shift, write_queue, stop, errors))
+        reader.start()
+        writer.start()
+        try:
+            # Tahap komputasi: NumPy/pywt melepas GIL sehingga overlap dengan I/O
+            coeff_offset = 0
+            while (block := read_queue.get()) is not _END:
+                if layout:
+                    samples = block[:len(block) - len(block) % 2, 0]
+                    n_coeffs = len(samples) // 2
+                else:
+                    samples = block.mean(axis=1, dtype=block.dtype)
+                    n_coeffs = (len(samples) + 1) // 2
+
+                block_symbols = symbols[coeff_offset:coeff_offset + n_coeffs]
+                block_masks = masks[coeff_offset:coeff_offset + n_coeffs]
+                coeff_offset += len(block_symbols)
+                if len(block_symbols):
+                    if layout:
+                        samples[:] = embed_symbols_in_samples(samples, block_symbols, block_masks, backend, layout)
+                    else:
+                        block = embed_symbols_in_samples(samples, block_symbols, block_masks, backend)
+                elif not layout:
+                    # Setelah payload habis, blok diteruskan apa adanya (mono)
+                    block = samples
+                if not _put(write_queue, block, stop):
+                    break
+        except BaseException:
+            stop.set()
+            raise
+        finally:
+            write_queue.put(_END)
+            reader.join()
+            writer.join()
+        if errors:
+            raise errors[0]
+    print(f"[Embed] Data berhasil disisipkan: {len(data_bits)} bit")
+    return output_path
+
+# Fungsi untuk ekstraksi blok demi blok; berhenti begitu frame selesai terbaca
+def extract_data_from_audio_pipelined(audio_path, transform='pywt', block_frames=DEFAULT_BLOCK_FRAMES, queue_size=4):
+    if block_frames % 2:
+        raise ValueError("block_frames harus genap.")
+    backend = get_transform_backend(transform)
+    _, layout, dtype, shift, _, quantize = _stream_format(audio_path, backend)
+
+    read_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors = []
+    chunks = []
+    collected = 0
+    frame_end = None
+
+    with sf.SoundFile(audio_path) as source:
+        reader = threading.Thread(target=_reader,
+                                  args=(source, block_frames, dtype, shift, read_queue, stop, errors, quantize))
+        reader.start()
+        try:
+            while (block := read_queue.get()) is not _END:
+                if layout:
+                    samples = block[:len(block) - len(block) % 2, 0]
+                else:
+                    samples = block.mean(axis=1, dtype=block.dtype)
+                values = detail_low_bits(samples, backend)
+                chunks.append(values)
+                collected += len(values)
+
+                if frame_end is None and collected >= FRAME_HEADER_BITS:
+                    header_bits = np.concatenate(chunks)[:FRAME_HEADER_BITS] & 1
+                    header = parse_frame_header(np.packbits(header_bits).tobytes())
+                    if header is None:
+                        raise ValueError("Header frame tidak ditemukan.")
+                    frame_end = frame_coeff_length(header)
+                if frame_end is not None and collected >= frame_end:
+                    break
+        finally:
+            stop.set()
+            reader.join()
+    if errors:
+        raise errors[0]
+    if frame_end is None or collected < frame_end:
+        raise ValueError("Frame terpotong: audio berakhir sebelum payload lengkap.")
+
+    values = np.concatenate(chunks)
+    payload = decode_frame_symbols(header, values[FRAME_HEADER_BITS:frame_end])
+    print(f"[Extract] Data size: {len(payload)} bytes")
+    return payload
@@ -0,0 +1,90 @@
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import soundfile as sf
+from stegano_utils import probe_frame, frame_coeff_length
+
+AUDIO_EXTENSIONS = ('.wav', '.flac', '.aiff', '.aif', '.ogg')
+# Urutan transform yang dicoba; 'numpy' memberi LSB yang sama dengan 'pywt' tanpa impor pywt
+SCAN_TRANSFORMS = ('numpy', 'lifting')
+
+# Fungsi untuk mencari semua file audio di bawah direktori
+def find_audio_files(root):
+    for dir_path, _, file_names in os.walk(root):
+        for file_name in sorted(file_names):
+            if file_name.lower().endswith(AUDIO_EXTENSIONS):
+                yield os.path.join(dir_path, file_name)
+
+# Fungsi untuk memeriksa satu file tanpa dekode penuh.
+# cache (opsional, extract_cache.ExtractionCache): hasil disimpan per isi file, jadi pemindaian
+# ulang file yang tidak berubah hanya membutuhkan hash isi file
+def scan_file(audio_path, verify=False, cache=None):
+    if cache is not None:
+        try:
+            cache_key = cache.file_key(audio_path, 'scan', transforms=SCAN_TRANSFORMS, verify=verify)
+        except OSError as e:
+            return {"path": audio_path, "candidate": False, "error": str(e)}
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return dict(json.loads(cached), path=audio_path)
+
+    result = {"path": audio_path, "candidate": False}
+    try:
+        info = sf.info(audio_path)
+        capacity_bits = info.frames // 2
+        for transform in SCAN_TRANSFORMS:
+            header = probe_frame(audio_path, transform, verify=verify)
+            # Header valid jika magic cocok dan panjangnya muat di cover
+            if header and frame_coeff_length(header) <= capacity_bits:
+                result.update(candidate=True, transform=transform, **header)
+                break
+    except Exception as e:
+        result["error"] = str(e)
+        return result
+    if cache is not None:
+        cache.put(cache_key, json.dumps(result).encode())
+    return result
+
+# Fungsi untuk memindai direktori secara paralel
+def scan_directory(root, workers=None, verify=False, chunksize=16, cache=None):
+    paths = list(find_audio_files(root))
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(scan_file, paths, [verify] * len(paths), [cache] * len(paths), chunksize=chunksize))
+    elapsed = time.perf_counter() - start_time
+    return results, elapsed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Triage cepat file audio yang berisi payload steganografi.")
+    parser.add_argument("root", type=str, help="Direktori yang dipindai")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument("--verify", action="store_true", help="Verifikasi CRC payload (membaca sampel frame saja)")
+    parser.add_argument("--jsonl", type=str, default=None, help="Simpan hasil per file ke file JSONL")
+    parser.add_argument("--cache", type=str, default=None, metavar="DIR",
+                        help="Direktori cache hasil per isi file (pemindaian ulang cukup hash)")
+    args = parser.parse_args()
+
+    cache = None
+    if args.cache:
+        from extract_cache import ExtractionCache
+        cache = ExtractionCache(args.cache)
+    results, elapsed = scan_directory(args.root, args.workers, args.verify, cache=cache)
+    candidates = [r for r in results if r["candidate"]]
+    errors = [r for r in results if "error" in r]
+
+    for r in candidates:
+        status = "" if "crc_ok" not in r else (" CRC OK" if r["crc_ok"] else " CRC GAGAL")
+        print(f"[+] {r['path']} ({r['transform']}, {r['length']} bytes){status}")
+    for r in errors:
+        print(f"[!] {r['path']}: {r['error']}")
+
+    if args.jsonl:
+        with open(args.jsonl, "w") as f:
+            for r in results:
+                f.write(json.dumps(r) + "\n")
+
+    rate = len(results) / elapsed if elapsed > 0 else float('inf')
+    print(f"\n[Scan] {len(results)} file, {len(candidates)} kandidat, {len(errors)} error")
+    print(f"[Scan] {elapsed:.2f} s ({rate:.1f} file/detik)")
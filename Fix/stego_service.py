@@ -0,0 +1,236 @@
+import argparse
+import asyncio
+import base64
+import importlib
+import json
+import os
+import socket
+from concurrent.futures import ProcessPoolExecutor
+
+# Kunci yang dimuat sekali per proses worker
+_worker_keys = {}
+# Dependensi yang dimuat lazy oleh crypto_utils/stegano_utils, dipanaskan di worker jika tersedia
+WARM_MODULES = ("stegano_utils", "pywt", "qrcode", "PIL.Image", "pyzbar.pyzbar")
+# Batas panjang satu baris permintaan JSON (payload base64 ikut di dalamnya); default asyncio hanya 64 KiB
+MAX_REQUEST_BYTES = 64 * 2**20
+
+# Fungsi inisialisasi worker: impor modul berat dan muat kunci satu kali
+def _init_worker(private_key_path, public_key_path):
+    from cryptography.hazmat.primitives import serialization
+    from crypto_utils import load_private_key
+    # Best-effort: modul yang tidak tersedia (mis. library zbar tidak terpasang) hanya
+    # menggagalkan job yang memakainya, bukan seluruh pool worker
+    for module_name in WARM_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except (ImportError, OSError) as e:
+            print(f"[Service] Worker tanpa {module_name}: {e}")
+
+    if private_key_path:
+        _worker_keys['private'] = load_private_key(private_key_path)
+        _worker_keys['public'] = _worker_keys['private'].public_key()
+    if public_key_path:
+        with open(public_key_path, "rb") as key_file:
+            _worker_keys['public'] = serialization.load_pem_public_key(key_file.read())
+
+def _get_key(kind):
+    key = _worker_keys.get(kind)
+    if key is None:
+        raise ValueError(f"Service dijalankan tanpa kunci {kind}.")
+    return key
+
+# Fungsi job: enkripsi teks dan ubah menjadi payload QR terkompresi
+def _job_encrypt(text):
+    from crypto_utils import encrypt_data, create_qr_image, compress_qr_image
+    ciphertext = encrypt_data(_get_key('public'), text)
+    compressed = compress_qr_image(create_qr_image(ciphertext))
+    return {"ciphertext": _b64(ciphertext), "data": _b64(compressed)}
+
+# Fungsi job: sisipkan payload ke audio
+def _job_embed(audio_path, data, output_path, transform='pywt', depth=1):
+    from stegano_utils import embed_data_in_audio
+    output_path = embed_data_in_audio(audio_path, base64.b64decode(data), output_path, transform=transform, depth=depth)
+    return {"output_path": output_path}
+
+# Fungsi job: ekstraksi payload dari audio
+def _job_extract(audio_path, bits=None, transform='pywt'):
+    from stegano_utils import extract_data_from_audio
+    expected_bit_length = float('inf') if bits is None else bits
+    data = extract_data_from_audio(audio_path, expected_bit_length, transform=transform)
+    return {"data": _b64(data)}
+
+# Fungsi job: dekripsi payload (langsung atau dari audio stego)
+def _job_decrypt(data=None, audio_path=None, transform='pywt'):
+    from crypto_utils import decrypt_qr_data
+    from stegano_utils import extract_data_from_audio
+    if audio_path:
+        compressed = extract_data_from_audio(audio_path, transform=transform)
+    elif data:
+        compressed = base64.b64decode(data)
+    else:
+        raise ValueError("Job decrypt membutuhkan 'data' atau 'audio_path'.")
+    text = decrypt_qr_data(_get_key('private'), compressed, reconstructed_path=None)
+    if text is None:
+        raise ValueError("Decryption failed!")
+    return {"text": text}
+
+JOBS = {
+    "encrypt": _job_encrypt,
+    "embed": _job_embed,
+    "extract": _job_extract,
+    "decrypt": _job_decrypt,
+}
+
+def _b64(data):
+    return base64.b64encode(data).decode('ascii')
+
+# Class service lokal: menerima job JSON per baris dan menjalankannya di pool worker
+class SteganoService:
+    def __init__(self, private_key_path=None, public_key_path=None, workers=None):
+        self.workers = workers or os.cpu_count()
+        self.pool = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(private_key_path, public_key_path),
+        )
+
+    def warm_up(self):
+        # Paksa semua worker mulai (impor + muat kunci) sebelum menerima klien
+        futures = [self.pool.submit(os.getpid) for _ in range(self.workers)]
+        return {future.result() for future in futures}
+
+    async def run_job(self, request):
+        op = request.get("op")
+        job = JOBS.get(op)
+        if job is None:
+            raise ValueError(f"Operasi tidak dikenal: {op}")
+        params = {k: v for k, v in request.items() if k not in ("op", "id")}
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, _call_job, op, params)
+
+    async def handle_client(self, reader, writer):
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def respond(request):
+            try:
+                response = {"ok": True, "result": await self.run_job(request)}
+            except Exception as e:
+                response = {"ok": False, "error": str(e)}
+            response["id"] = request.get("id")
+            async with write_lock:
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    # Baris melebihi MAX_REQUEST_BYTES: sisa baris tidak bisa disinkronkan lagi,
+                    # jadi beri jawaban error lalu tutup koneksi
+                    response = {"ok": False, "error": f"Permintaan melebihi {MAX_REQUEST_BYTES} byte", "id": None}
+                    async with write_lock:
+                        writer.write(json.dumps(response).encode() + b"\n")
+                        await writer.drain()
+                    break
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                except json.JSONDecodeError as e:
+                    response = {"ok": False, "error": f"JSON tidak valid: {e}", "id": None}
+                    async with write_lock:
+                        writer.write(json.dumps(response).encode() + b"\n")
+                    continue
+                # Permintaan dari satu klien boleh diproses bersamaan (dicocokkan lewat 'id')
+                task = asyncio.create_task(respond(request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        finally:
+            writer.close()
+
+    async def serve(self, host='127.0.0.1', port=8765, unix_path=None):
+        if unix_path:
+            server = await asyncio.start_unix_server(self.handle_client, path=unix_path, limit=MAX_REQUEST_BYTES)
+            print(f"[Service] Listening on unix:{unix_path}")
+        else:
+            server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_REQUEST_BYTES)
+            print(f"[Service] Listening on {host}:{port}")
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        self.pool.shutdown()
+
+def _call_job(op, params):
+    return JOBS[op](**params)
+
+# Class klien sinkron sederhana untuk SteganoService
+class ServiceClient:
+    def __init__(self, host='127.0.0.1', port=8765, unix_path=None):
+        if unix_path:
+            self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.sock.connect(unix_path)
+        else:
+            self.sock = socket.create_connection((host, port))
+        self.stream = self.sock.makefile('rwb')
+        self.next_id = 0
+
+    def call(self, op, **params):
+        self.next_id += 1
+        request = {"op": op, "id": self.next_id, **params}
+        self.stream.write(json.dumps(request).encode() + b"\n")
+        self.stream.flush()
+        response = json.loads(self.stream.readline())
+        if not response["ok"]:
+            raise RuntimeError(response["error"])
+        return response["result"]
+
+    def encrypt(self, text):
+        result = self.call("encrypt", text=text)
+        return base64.b64decode(result["data"])
+
+    def embed(self, audio_path, data_bytes, output_path, transform='pywt'):
+        return self.call("embed", audio_path=audio_path, data=_b64(data_bytes),
+                         output_path=output_path, transform=transform)["output_path"]
+
+    def extract(self, audio_path, bits=None, transform='pywt'):
+        result = self.call("extract", audio_path=audio_path, bits=bits, transform=transform)
+        return base64.b64decode(result["data"])
+
+    def decrypt(self, audio_path=None, data_bytes=None, transform='pywt'):
+        data = _b64(data_bytes) if data_bytes is not None else None
+        return self.call("decrypt", audio_path=audio_path, data=data, transform=transform)["text"]
+
+    def close(self):
+        self.stream.close()
+        self.sock.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="Service lokal enkripsi/steganografi dengan state yang tetap hangat.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Alamat host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Port TCP (default: 8765)")
+    parser.add_argument("--unix", type=str, default=None, help="Path Unix socket (menggantikan host/port)")
+    parser.add_argument("--private-key", type=str, default="Keys/private_key.pem", help="Path kunci privat")
+    parser.add_argument("--public-key", type=str, default=None, help="Path kunci publik (default: dari kunci privat)")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    args = parser.parse_args()
+
+    private_key_path = args.private_key if os.path.exists(args.private_key) else None
+    if private_key_path is None:
+        print(f"[Service] Private key not found: {args.private_key} (decrypt dinonaktifkan)")
+
+    service = SteganoService(private_key_path, args.public_key, args.workers)
+    print(f"[Service] Warm workers: {len(service.warm_up())}")
+    try:
+        asyncio.run(service.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+import argparse
+import hashlib
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+import soundfile as sf
+from stegano_utils import (
+    LiftingHaarBackend, get_transform_backend, payload_coeff_length,
+    embed_data_in_audio, extract_data_from_audio,
+)
+
+# Header shard: magic, ID payload, indeks shard, jumlah shard, panjang total, CRC32 total
+SHARD_MAGIC = b'SHD'
+SHARD_HEADER = struct.Struct('>3s8sHHII')
+
+# Fungsi untuk menghitung jumlah koefisien detail yang tersedia di sebuah cover
+def cover_capacity_bits(audio_path, transform='pywt'):
+    frames = sf.info(audio_path).frames
+    if get_transform_backend(transform) is LiftingHaarBackend:
+        return frames // 2
+    return (frames + 1) // 2
+
+# Fungsi untuk menghitung ukuran potongan payload terbesar yang muat di kapasitas tertentu
+def max_chunk_size(capacity_bits, ecc=None, depth=1):
+    # Pencarian biner pada ukuran potongan
+    lo, hi = -1, capacity_bits * depth // 8
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if payload_coeff_length(SHARD_HEADER.size + mid, ecc, depth) <= capacity_bits:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+# Fungsi untuk membagi payload sebanding dengan kapasitas tiap cover
+def plan_shards(payload_size, capacities):
+    if not capacities:
+        raise ValueError("Minimal satu cover diperlukan.")
+    limits = list(capacities)
+    if sum(limits) < payload_size:
+        raise ValueError(f"Total kapasitas cover ({sum(limits)} bytes) kurang dari payload ({payload_size} bytes).")
+
+    sizes = [payload_size * limit // sum(limits) for limit in limits]
+    remainder = payload_size - sum(sizes)
+    for i, limit in enumerate(limits):
+        extra = min(remainder, limit - sizes[i])
+        sizes[i] += extra
+        remainder -= extra
+    return sizes
+
+# Fungsi untuk memecah payload menjadi shard berheader
+def split_payload(payload, sizes):
+    payload_id = hashlib.blake2b(payload, digest_size=8).digest()
+    total_crc = zlib.crc32(payload)
+    shards = []
+    offset = 0
+    for index, size in enumerate(sizes):
+        header = SHARD_HEADER.pack(SHARD_MAGIC, payload_id, index, len(sizes), len(payload), total_crc)
+        shards.append(header + payload[offset:offset + size])
+        offset += size
+    return shards
+
+# Fungsi untuk menyusun kembali payload dari shard dalam urutan apa pun
+def join_shards(shards):
+    groups = {}
+    for shard in shards:
+        if len(shard) < SHARD_HEADER.size:
+            raise ValueError("Data bukan shard (terlalu pendek).")
+        magic, payload_id, index, count, total_length, total_crc = SHARD_HEADER.unpack_from(shard)
+        if magic != SHARD_MAGIC:
+            raise ValueError("Data bukan shard (magic tidak cocok).")
+        group = groups.setdefault(payload_id, {"count": count, "length": total_length,
+                                               "crc32": total_crc, "parts": {}})
+        group["parts"][index] = shard[SHARD_HEADER.size:]
+
+    if len(groups) != 1:
+        raise ValueError(f"File berisi {len(groups)} payload berbeda, harus tepat satu.")
+    group = next(iter(groups.values()))
+    missing = sorted(set(range(group["count"])) - set(group["parts"]))
+    if missing:
+        raise ValueError(f"Shard hilang: {missing} dari {group['count']}")
+
+    payload = b''.join(group["parts"][i] for i in range(group["count"]))
+    if len(payload) != group["length"] or zlib.crc32(payload) != group["crc32"]:
+        raise ValueError("Payload hasil gabungan shard rusak.")
+    return payload
+
+def _embed_job(cover_path, shard, output_path, transform, ecc, depth):
+    return embed_data_in_audio(cover_path, shard, output_path, transform=transform, ecc=ecc, depth=depth)
+
+def _extract_job(stego_path, transform):
+    return extract_data_from_audio(stego_path, transform=transform)
+
+# Fungsi untuk menyisipkan satu payload ke beberapa cover secara paralel
+def embed_sharded(cover_paths, data_bytes, output_dir='.', transform='pywt', ecc=None, workers=None, depth=1):
+    capacities = [max_chunk_size(cover_capacity_bits(path, transform), ecc, depth) for path in cover_paths]
+    for path, capacity in zip(cover_paths, capacities):
+        if capacity < 0:
+            raise ValueError(f"Cover terlalu pendek untuk header shard: {path}")
+    shards = split_payload(data_bytes, plan_shards(len(data_bytes), capacities))
+    print(f"[Shard] {len(data_bytes)} bytes -> {len(shards)} shard")
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_paths = [
+        os.path.join(output_dir, f"{os.path.splitext(os.path.basename(path))[0]}_shard{i}.wav")
+        for i, path in enumerate(cover_paths)
+    ]
+    count = len(shards)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_embed_job, cover_paths, shards, output_paths,
+                             [transform] * count, [ecc] * count, [depth] * count))
+
+# Fungsi untuk mengekstrak dan menggabungkan shard dari beberapa file secara paralel
+def extract_sharded(stego_paths, transform='pywt', workers=None):
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        shards = list(pool.map(_extract_job, stego_paths, [transform] * len(stego_paths)))
+    payload = join_shards(shards)
+    print(f"[Shard] Payload tersusun kembali: {len(payload)} bytes dari {len(shards)} shard")
+    return payload
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sisipkan/ekstrak satu payload yang dibagi ke beberapa cover.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    embed_parser = subparsers.add_parser("embed", help="Bagi payload ke beberapa cover")
+    embed_parser.add_argument("payload", type=str, help="File payload")
+    embed_parser.add_argument("covers", type=str, nargs="+", help="File audio cover")
+    embed_parser.add_argument("--out-dir", type=str, default=".", help="Direktori output (default: .)")
+    embed_parser.add_argument("--ecc", type=str, default=None, help="Kode ECC (rep3, rep5, hamming74)")
+    embed_parser.add_argument("--depth", type=int, default=1, help="Jumlah LSB per koefisien (1-8, default: 1)")
+
+    extract_parser = subparsers.add_parser("extract", help="Gabungkan payload dari file stego")
+    extract_parser.add_argument("stego", type=str, nargs="+", help="File audio stego (urutan bebas)")
+    extract_parser.add_argument("--output", type=str, required=True, help="File payload hasil")
+
+    for sub in (embed_parser, extract_parser):
+        sub.add_argument("--transform", type=str, default="pywt", help="Transform (pywt, numpy, lifting)")
+        sub.add_argument("--workers", type=int, default=None, help="Jumlah proses worker")
+    args = parser.parse_args()
+
+    if args.command == "embed":
+        with open(args.payload, "rb") as f:
+            data = f.read()
+        for path in embed_sharded(args.covers, data, args.out_dir, args.transform, args.ecc, args.workers, args.depth):
+            print(f"[+] {path}")
+    else:
+        data = extract_sharded(args.stego, args.transform, args.workers)
+        with open(args.output, "wb") as f:
+            f.write(data)
+        print(f"[+] Payload disimpan: {args.output}")
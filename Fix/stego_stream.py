@@ -0,0 +1,165 @@
+import argparse
+import sys
+import numpy as np
+from stegano_utils import (
+    LiftingHaarBackend, PCM_LAYOUTS, FRAME_HEADER_BITS, payload_to_bits, bits_to_symbols,
+    embed_symbols_in_samples, detail_low_bits, parse_frame_header, frame_coeff_length, decode_frame_symbols,
+)
+
+# Streaming PCM mentah (interleaved, little-endian) dari stdin/pipe atau objek file-like apa pun.
+# Setiap blok langsung diproses dan ditulis, jadi latensi maksimum satu blok. Selalu memakai
+# backend lifting: integer eksak, sehingga format sampel keluaran sama dengan masukan.
+
+# Format sampel mentah: (lebar byte, layout PCM), nama mengikuti format ffmpeg (-f s16le)
+RAW_FORMATS = {
+    's16le': (2, PCM_LAYOUTS['PCM_16']),
+    's24le': (3, PCM_LAYOUTS['PCM_24']),
+    's32le': (4, PCM_LAYOUTS['PCM_32']),
+}
+
+# 1024 frame ~ 23 ms pada 44.1 kHz (harus genap agar pasangan Haar tidak terpotong antar blok)
+DEFAULT_STREAM_BLOCK_FRAMES = 1024
+
+def _raw_format(sample_format):
+    try:
+        return RAW_FORMATS[sample_format]
+    except KeyError:
+        raise ValueError(f"Format sampel tidak dikenal: {sample_format}") from None
+
+# Fungsi untuk membaca tepat n byte (read pada pipe bisa mengembalikan lebih sedikit); kurang hanya saat EOF
+def _read_block(source, n_bytes):
+    chunks = []
+    remaining = n_bytes
+    while remaining:
+        chunk = source.read(remaining)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+def _emit(target, data):
+    target.write(data)
+    # Blok dikirim segera ke proses berikutnya di pipe
+    if hasattr(target, "flush"):
+        target.flush()
+
+# Fungsi untuk mengubah byte mentah menjadi array (frame, kanal) sesuai layout
+def _decode_pcm(data, width, channels, layout):
+    if width == 3:
+        raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+        values = raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)
+        values = (values ^ 0x800000) - 0x800000  # sign-extend 24 bit
+    else:
+        values = np.frombuffer(data, dtype=f'<i{width}').astype(layout[0])
+    return values.reshape(-1, channels)
+
+def _encode_pcm(block, width):
+    if width == 3:
+        values = block.astype('<i4').ravel()
+        return values.view(np.uint8).reshape(-1, 4)[:, :3].tobytes()
+    return block.astype(f'<i{width}').tobytes()
+
+# Fungsi untuk menyisipkan payload ke stream PCM mentah blok demi blok (kanal pertama).
+# Setelah payload habis, blok diteruskan tanpa diubah.
+def embed_stream(source, target, data_bytes, sample_format='s16le', channels=1, framed=True, ecc=None, depth=1,
+                 block_frames=DEFAULT_STREAM_BLOCK_FRAMES):
+    if block_frames % 2:
+        raise ValueError("block_frames harus genap.")
+    width, layout = _raw_format(sample_format)
+    frame_bytes = width * channels
+    data_bits = payload_to_bits(data_bytes, framed, ecc, depth)
+    symbols, masks = bits_to_symbols(data_bits, depth)
+    print(f"[Stream] Data size: {len(data_bytes)} bytes, total bit: {len(data_bits)}", file=sys.stderr)
+
+    coeff_offset = 0
+    total_frames = 0
+    while data := _read_block(source, block_frames * frame_bytes):
+        # Sisa byte yang bukan frame utuh (akhir stream) diteruskan apa adanya
+        tail = len(data) % frame_bytes
+        body, tail_bytes = (data[:-tail], data[-tail:]) if tail else (data, b"")
+        block_symbols = symbols[coeff_offset:coeff_offset + len(body) // frame_bytes // 2]
+        if len(block_symbols):
+            block = _decode_pcm(body, width, channels, layout)
+            samples = block[:len(block) - len(block) % 2, 0]
+            block_masks = masks[coeff_offset:coeff_offset + len(block_symbols)]
+            samples[:] = embed_symbols_in_samples(samples, block_symbols, block_masks, LiftingHaarBackend, layout)
+            coeff_offset += len(block_symbols)
+            body = _encode_pcm(block, width)
+        total_frames += len(body) // frame_bytes
+        _emit(target, body + tail_bytes)
+
+    if coeff_offset < len(symbols):
+        raise ValueError(f"Stream berakhir sebelum payload selesai disisipkan "
+                         f"({coeff_offset}/{len(symbols)} koefisien).")
+    print(f"[Stream] Data berhasil disisipkan: {len(data_bits)} bit, {total_frames} frame", file=sys.stderr)
+    return total_frames
+
+# Fungsi untuk mengekstrak payload dari stream PCM mentah; berhenti membaca begitu frame lengkap
+def extract_stream(source, sample_format='s16le', channels=1, block_frames=DEFAULT_STREAM_BLOCK_FRAMES):
+    if block_frames % 2:
+        raise ValueError("block_frames harus genap.")
+    width, layout = _raw_format(sample_format)
+    frame_bytes = width * channels
+
+    chunks = []
+    collected = 0
+    frame_end = None
+    while data := _read_block(source, block_frames * frame_bytes):
+        block = _decode_pcm(data[:len(data) - len(data) % frame_bytes], width, channels, layout)
+        values = detail_low_bits(block[:len(block) - len(block) % 2, 0], LiftingHaarBackend)
+        chunks.append(values)
+        collected += len(values)
+
+        if frame_end is None and collected >= FRAME_HEADER_BITS:
+            header_bits = np.concatenate(chunks)[:FRAME_HEADER_BITS] & 1
+            header = parse_frame_header(np.packbits(header_bits).tobytes())
+            if header is None:
+                raise ValueError("Header frame tidak ditemukan.")
+            frame_end = frame_coeff_length(header)
+        if frame_end is not None and collected >= frame_end:
+            break
+    if frame_end is None or collected < frame_end:
+        raise ValueError("Frame terpotong: stream berakhir sebelum payload lengkap.")
+
+    values = np.concatenate(chunks)
+    payload = decode_frame_symbols(header, values[FRAME_HEADER_BITS:frame_end])
+    print(f"[Stream] Data size: {len(payload)} bytes", file=sys.stderr)
+    return payload
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Embed/extract pada stream PCM mentah (stdin -> stdout), "
+                    "mis. ffmpeg -i in.mp3 -f s16le -ac 2 - | python stego_stream.py embed payload.bin -c 2 | ...")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    embed_parser = subparsers.add_parser("embed", help="Sisipkan payload; stream stego ditulis ke stdout")
+    embed_parser.add_argument("payload", type=str, help="File payload")
+    embed_parser.add_argument("--ecc", type=str, default=None, help="Kode ECC (rep3, rep5, hamming74)")
+    embed_parser.add_argument("--depth", type=int, default=1, help="Jumlah LSB per koefisien (1-8, default: 1)")
+
+    extract_parser = subparsers.add_parser("extract", help="Ekstrak payload dari stream stego")
+    extract_parser.add_argument("--output", type=str, required=True, help="File payload hasil")
+
+    for sub in (embed_parser, extract_parser):
+        sub.add_argument("-f", "--format", type=str, default="s16le", choices=list(RAW_FORMATS),
+                         help="Format sampel mentah (default: s16le)")
+        sub.add_argument("-c", "--channels", type=int, default=1, help="Jumlah kanal interleaved (default: 1)")
+        sub.add_argument("--block-frames", type=int, default=DEFAULT_STREAM_BLOCK_FRAMES,
+                         help=f"Ukuran blok dalam frame, menentukan latensi (default: {DEFAULT_STREAM_BLOCK_FRAMES})")
+    args = parser.parse_args()
+
+    if args.command == "embed":
+        with open(args.payload, "rb") as f:
+            data = f.read()
+        try:
+            embed_stream(sys.stdin.buffer, sys.stdout.buffer, data, args.format, args.channels, ecc=args.ecc,
+                         depth=args.depth, block_frames=args.block_frames)
+        except BrokenPipeError:
+            # Proses hilir berhenti lebih dulu (mis. extractor setelah payload lengkap)
+            sys.stdout = None
+    else:
+        data = extract_stream(sys.stdin.buffer, args.format, args.channels, args.block_frames)
+        with open(args.output, "wb") as f:
+            f.write(data)
+        print(f"[+] Payload disimpan: {args.output}", file=sys.stderr)
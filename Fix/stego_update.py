@@ -0,0 +1,124 @@
+import argparse
+import struct
+import numpy as np
+from stegano_utils import (
+    LiftingHaarBackend, PCM_LAYOUTS, get_transform_backend, payload_to_bits, bits_to_symbols,
+    embed_symbols_in_samples, float_to_pcm,
+)
+
+# Pembaruan payload langsung di file stego WAV. Haar level 1 bersifat lokal (koefisien ke-i hanya
+# bergantung pada sampel 2i dan 2i+1), jadi cukup pasangan sampel yang memuat frame baru yang
+# dihitung ulang, dan hanya pasangan yang berubah yang ditulis ke data chunk lewat memmap.
+
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_IEEE_FLOAT = 0x0003
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+
+# Fungsi untuk membaca letak dan format data chunk dari header RIFF/WAVE
+def read_wav_layout(path):
+    with open(path, "rb") as f:
+        riff, _, wave = struct.unpack("<4sI4s", f.read(12))
+        if riff != b"RIFF" or wave != b"WAVE":
+            raise ValueError("Pembaruan in-place hanya mendukung file RIFF/WAVE.")
+        fmt = None
+        while header := f.read(8):
+            if len(header) < 8:
+                break
+            chunk_id, size = struct.unpack("<4sI", header)
+            if chunk_id == b"fmt ":
+                chunk = f.read(size)
+                audio_format, channels, sample_rate = struct.unpack_from("<HHI", chunk)
+                bits = struct.unpack_from("<H", chunk, 14)[0]
+                if audio_format == WAVE_FORMAT_EXTENSIBLE:
+                    audio_format = struct.unpack_from("<H", chunk, 24)[0]
+                fmt = {"format": audio_format, "channels": channels, "sample_rate": sample_rate, "bits": bits}
+                f.seek(size % 2, 1)
+            elif chunk_id == b"data":
+                if fmt is None:
+                    raise ValueError("Chunk fmt tidak ditemukan sebelum data.")
+                frame_bytes = fmt["channels"] * fmt["bits"] // 8
+                return dict(fmt, offset=f.tell(), frames=size // frame_bytes)
+            else:
+                # Chunk berukuran ganjil diikuti satu byte padding
+                f.seek(size + size % 2, 1)
+    raise ValueError("Chunk data tidak ditemukan.")
+
+# Fungsi untuk memetakan data chunk ke array (frame, kanal[, 3]) yang bisa ditulis
+def map_wav_samples(path, wav):
+    if wav["format"] == WAVE_FORMAT_PCM and wav["bits"] == 24:
+        dtype, shape = np.uint8, (wav["frames"], wav["channels"], 3)
+    elif wav["format"] == WAVE_FORMAT_PCM and wav["bits"] in (16, 32):
+        dtype, shape = f"<i{wav['bits'] // 8}", (wav["frames"], wav["channels"])
+    elif wav["format"] == WAVE_FORMAT_IEEE_FLOAT and wav["bits"] in (32, 64):
+        dtype, shape = f"<f{wav['bits'] // 8}", (wav["frames"], wav["channels"])
+    else:
+        raise ValueError(f"Format WAV tidak didukung untuk pembaruan in-place: "
+                         f"format {wav['format']}, {wav['bits']} bit")
+    return np.memmap(path, dtype=dtype, mode="r+", offset=wav["offset"], shape=shape)
+
+def _get_channel(mapped, rows):
+    values = mapped[rows, 0]
+    if values.ndim == 2:  # PCM 24-bit (3 byte little-endian)
+        values = values.astype(np.int32)
+        values = values[:, 0] | (values[:, 1] << 8) | (values[:, 2] << 16)
+        return (values ^ 0x800000) - 0x800000
+    return np.array(values)
+
+def _set_channel(mapped, rows, values):
+    if mapped.ndim == 3:
+        mapped[rows, 0] = values.astype("<i4").view(np.uint8).reshape(-1, 4)[:, :3]
+    else:
+        mapped[rows, 0] = values
+
+# Fungsi untuk mengganti payload file stego di tempat; mengembalikan jumlah pasangan sampel yang ditulis.
+# Kedalaman/ECC boleh berbeda dari payload lama; sisa frame lama setelah frame baru diabaikan
+# karena panjang frame dibaca dari header.
+def update_payload_in_place(stego_path, data_bytes, transform='pywt', ecc=None, depth=1):
+    backend = get_transform_backend(transform)
+    symbols, masks = bits_to_symbols(payload_to_bits(data_bytes, ecc=ecc, depth=depth), depth)
+    wav = read_wav_layout(stego_path)
+    is_float = wav["format"] == WAVE_FORMAT_IEEE_FLOAT
+
+    if backend is LiftingHaarBackend and is_float:
+        raise ValueError("Transform lifting membutuhkan WAV PCM.")
+    if backend is not LiftingHaarBackend and wav["channels"] != 1:
+        # Backend float menyisipkan ke campuran mono dan selalu menghasilkan file mono
+        raise ValueError("Transform float hanya bisa memperbarui stego mono.")
+    if len(symbols) > wav["frames"] // 2:
+        raise ValueError(f"Payload butuh {len(symbols)} koefisien, file hanya {wav['frames'] // 2}.")
+
+    mapped = map_wav_samples(stego_path, wav)
+    rows = slice(0, 2 * len(symbols))
+    current = _get_channel(mapped, rows)
+    layout = None if is_float else PCM_LAYOUTS[f"PCM_{wav['bits']}"]
+
+    if backend is LiftingHaarBackend:
+        stego = embed_symbols_in_samples(current.astype(layout[0]), symbols, masks, backend, layout)
+    else:
+        # Skala baca sama seperti sf.read (integer / 2^(bits-1))
+        samples = current.astype(backend.dtype) if is_float else current / float(2 ** (wav["bits"] - 1))
+        stego = embed_symbols_in_samples(samples.astype(backend.dtype), symbols, masks, backend)
+        stego = stego.astype(current.dtype) if is_float else float_to_pcm(stego, layout)
+
+    # Hanya pasangan yang berubah yang ditulis (halaman lain dari file tidak tersentuh)
+    changed = np.flatnonzero((stego.reshape(-1, 2) != current.reshape(-1, 2)).any(axis=1))
+    indices = np.stack([2 * changed, 2 * changed + 1], axis=1).ravel()
+    if len(indices):
+        _set_channel(mapped, indices, stego[indices])
+        mapped.flush()
+    del mapped
+    print(f"[Update] Payload {len(data_bytes)} bytes, {len(changed)}/{len(symbols)} pasangan sampel ditulis ulang")
+    return len(changed)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Ganti payload file stego WAV di tempat tanpa menulis ulang seluruh file.")
+    parser.add_argument("stego", type=str, help="File audio stego (WAV)")
+    parser.add_argument("payload", type=str, help="File payload baru")
+    parser.add_argument("--transform", type=str, default="pywt", help="Transform (pywt, numpy, lifting)")
+    parser.add_argument("--ecc", type=str, default=None, help="Kode ECC (rep3, rep5, hamming74)")
+    parser.add_argument("--depth", type=int, default=1, help="Jumlah LSB per koefisien (1-8, default: 1)")
+    args = parser.parse_args()
+
+    with open(args.payload, "rb") as f:
+        data = f.read()
+    update_payload_in_place(args.stego, data, args.transform, args.ecc, args.depth)
@@ -0,0 +1,184 @@
+import argparse
+import itertools
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+import soundfile as sf
+
+DEFAULT_BLOCK_FRAMES = 1 << 16
+
+# Generator sinyal sintetis, dihasilkan blok demi blok (fase/state berlanjut antar blok)
+# agar file berdurasi panjang tidak perlu dibuat utuh di memori.
+
+# Class nada: jumlah beberapa sinus dengan frekuensi acak
+class ToneGenerator:
+    def __init__(self, rng, sample_rate):
+        self.sample_rate = sample_rate
+        self.freqs = rng.uniform(110.0, min(4000.0, sample_rate / 4), size=3)
+        self.amps = np.array([0.4, 0.2, 0.1])
+
+    def block(self, start, n):
+        t = (start + np.arange(n)) / self.sample_rate
+        return (self.amps * np.sin(2 * np.pi * np.outer(t, self.freqs))).sum(axis=1)
+
+# Class white noise Gaussian
+class WhiteNoiseGenerator:
+    def __init__(self, rng, sample_rate):
+        self.rng = rng
+
+    def block(self, start, n):
+        return 0.15 * self.rng.standard_normal(n)
+
+# Class pink noise (Voss-McCartney): baris ke-k diperbarui tiap 2^k sampel
+class PinkNoiseGenerator:
+    ROWS = 16
+
+    def __init__(self, rng, sample_rate):
+        self.rng = rng
+        self.last = np.zeros(self.ROWS)
+
+    def block(self, start, n):
+        index = start + np.arange(n)
+        out = np.zeros(n)
+        for k in range(self.ROWS):
+            steps = index >> k
+            first = steps[0]
+            values = self.rng.standard_normal(steps[-1] - first + 1)
+            # Nilai pada langkah yang sudah dimulai di blok sebelumnya dipakai ulang
+            if start and (start - 1) >> k == first:
+                values[0] = self.last[k]
+            self.last[k] = values[-1]
+            out += values[steps - first]
+        return 0.05 * out
+
+# Class sinyal mirip ucapan: vokal harmonik dengan pitch bergeser, amplop suku kata, dan jeda
+class SpeechLikeGenerator:
+    def __init__(self, rng, sample_rate):
+        self.rng = rng
+        self.sample_rate = sample_rate
+        self.f0 = rng.uniform(100.0, 220.0)
+        self.syllable_rate = rng.uniform(3.0, 5.0)
+        self.harmonics = np.arange(1, 11)
+
+    def block(self, start, n):
+        t = (start + np.arange(n)) / self.sample_rate
+        # Pitch bergelombang pelan; fase = integral frekuensi
+        phase = 2 * np.pi * (self.f0 * t + 8.0 * np.sin(2 * np.pi * 0.3 * t) / (2 * np.pi * 0.3))
+        harmonics = self.harmonics[self.harmonics * self.f0 < self.sample_rate / 2]
+        voiced = (np.sin(np.outer(phase, harmonics)) / harmonics).sum(axis=1)
+        envelope = np.sin(np.pi * self.syllable_rate * t) ** 2
+        # Jeda antar frasa: 1 detik dari tiap 4 detik hening
+        envelope *= (t % 4.0) < 3.0
+        return 0.3 * envelope * voiced + 0.005 * self.rng.standard_normal(n)
+
+# Class sinyal mirip musik: akord berganti tiap ketukan dengan amplop decay
+class MusicLikeGenerator:
+    SCALE = np.array([0, 2, 4, 5, 7, 9, 11])
+
+    def __init__(self, rng, sample_rate):
+        self.sample_rate = sample_rate
+        self.seed = int(rng.integers(2**31))
+        self.beat = rng.uniform(0.3, 0.6)
+
+    def _chord(self, beat_index):
+        # Nada ditentukan dari (seed, indeks ketukan), jadi konsisten di batas blok
+        beat_rng = np.random.default_rng([self.seed, beat_index])
+        degrees = beat_rng.choice(len(self.SCALE), size=3, replace=False)
+        semitones = self.SCALE[degrees] + 12 * beat_rng.integers(0, 2, size=3)
+        return 220.0 * 2 ** (semitones / 12)
+
+    def block(self, start, n):
+        t = (start + np.arange(n)) / self.sample_rate
+        beats = (t // self.beat).astype(np.int64)
+        out = np.zeros(n)
+        for beat_index in np.unique(beats):
+            mask = beats == beat_index
+            local_t = t[mask] - beat_index * self.beat
+            freqs = self._chord(int(beat_index))
+            tones = np.sin(2 * np.pi * np.outer(t[mask], freqs)).sum(axis=1)
+            out[mask] = 0.25 * np.exp(-4.0 * local_t) * tones
+        return out
+
+SIGNAL_GENERATORS = {
+    'tone': ToneGenerator,
+    'white': WhiteNoiseGenerator,
+    'pink': PinkNoiseGenerator,
+    'speech': SpeechLikeGenerator,
+    'music': MusicLikeGenerator,
+}
+
+# Fungsi untuk membuat satu file cover dengan menulis blok demi blok
+def generate_cover(spec, block_frames=DEFAULT_BLOCK_FRAMES):
+    start_time = time.perf_counter()
+    sample_rate = spec["sample_rate"]
+    total_frames = int(spec["duration"] * sample_rate)
+    # Tiap kanal punya generator sendiri (seed berbeda) agar kanal tidak identik
+    generators = [
+        SIGNAL_GENERATORS[spec["kind"]](np.random.default_rng([spec["seed"], channel]), sample_rate)
+        for channel in range(spec["channels"])
+    ]
+
+    with sf.SoundFile(spec["path"], 'w', sample_rate, spec["channels"], subtype=spec["subtype"]) as f:
+        for start in range(0, total_frames, block_frames):
+            n = min(block_frames, total_frames - start)
+            block = np.column_stack([generator.block(start, n) for generator in generators])
+            f.write(np.clip(block, -1.0, 1.0 - 2.0**-15))
+
+    return dict(spec, frames=total_frames, elapsed_sec=time.perf_counter() - start_time)
+
+# Fungsi untuk menyusun daftar cover (kombinasi semua parameter)
+def build_specs(output_dir, kinds, durations, sample_rates, channels, subtypes, seed=0):
+    specs = []
+    for index, (kind, duration, sample_rate, n_channels, subtype) in enumerate(
+            itertools.product(kinds, durations, sample_rates, channels, subtypes)):
+        file_name = f"{kind}_{duration:g}s_{sample_rate}hz_{n_channels}ch_{subtype.lower()}.wav"
+        specs.append({
+            "path": os.path.join(output_dir, file_name),
+            "kind": kind,
+            "duration": duration,
+            "sample_rate": sample_rate,
+            "channels": n_channels,
+            "subtype": subtype,
+            "seed": seed + index,
+        })
+    return specs
+
+# Fungsi untuk membuat korpus secara paralel dan menulis manifest JSONL
+def generate_corpus(specs, workers=None, block_frames=DEFAULT_BLOCK_FRAMES, manifest_path=None):
+    for spec in specs:
+        os.makedirs(os.path.dirname(spec["path"]) or ".", exist_ok=True)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(generate_cover, specs, [block_frames] * len(specs)))
+    if manifest_path:
+        with open(manifest_path, "w") as f:
+            for result in results:
+                f.write(json.dumps(result) + "\n")
+    return results
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate korpus cover audio sintetis untuk benchmark dan evaluasi.")
+    parser.add_argument("--out-dir", type=str, default="corpus", help="Direktori output (default: corpus)")
+    parser.add_argument("--kinds", type=str, nargs="+", default=list(SIGNAL_GENERATORS),
+                        choices=list(SIGNAL_GENERATORS), help="Jenis sinyal (default: semua)")
+    parser.add_argument("--durations", type=float, nargs="+", default=[5], help="Durasi dalam detik (default: 5)")
+    parser.add_argument("--samplerates", type=int, nargs="+", default=[44100], help="Sample rate (default: 44100)")
+    parser.add_argument("--channels", type=int, nargs="+", default=[1, 2], help="Jumlah kanal (default: 1 2)")
+    parser.add_argument("--subtypes", type=str, nargs="+", default=["PCM_16"],
+                        help="Subtype WAV, mis. PCM_16 PCM_24 PCM_32 FLOAT (default: PCM_16)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed dasar (default: 0)")
+    parser.add_argument("--workers", type=int, default=None, help="Jumlah proses worker (default: jumlah CPU)")
+    parser.add_argument("--block-frames", type=int, default=DEFAULT_BLOCK_FRAMES, help="Ukuran blok tulis dalam frame")
+    args = parser.parse_args()
+
+    specs = build_specs(args.out_dir, args.kinds, args.durations, args.samplerates,
+                        args.channels, args.subtypes, args.seed)
+    start_time = time.perf_counter()
+    results = generate_corpus(specs, args.workers, args.block_frames,
+                              manifest_path=os.path.join(args.out_dir, "manifest.jsonl"))
+    elapsed = time.perf_counter() - start_time
+
+    total_seconds = sum(r["duration"] for r in results)
+    print(f"[Corpus] {len(results)} file ({total_seconds:g} detik audio) dibuat di '{args.out_dir}'")
+    print(f"[Corpus] {elapsed:.2f} s, manifest: {os.path.join(args.out_dir, 'manifest.jsonl')}")